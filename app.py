@@ -102,7 +102,8 @@ from modules.visualizer import (
     create_pnl_chart, create_allocation_pie, create_correlation_heatmap,
     create_var_distribution, create_performance_summary_chart, create_sector_allocation_chart,
     create_price_history_chart, create_stock_candlestick_chart, create_stock_line_chart,
-    create_factor_beta_chart, create_rolling_beta_chart, create_factor_contribution_chart
+    create_factor_beta_chart, create_rolling_beta_chart, create_factor_contribution_chart,
+    build_dashboard_figures
 )
 from utils.currency_mapper import get_currency_mapping, get_market_info
 from utils.helpers import (
@@ -469,22 +470,22 @@ def display_performance_analysis(pnl_df: pd.DataFrame, summary: Dict[str, float]
     """パフォーマンス分析の表示"""
     st.subheader("📈 パフォーマンス分析")
     
+    # 損益・配分・サマリーの各チャートは独立しているため並列生成
+    figures = build_dashboard_figures(pnl_df=pnl_df, summary=summary if summary else None)
+    
     col1, col2 = st.columns(2)
     
     with col1:
         # 損益チャート
-        pnl_chart = create_pnl_chart(pnl_df)
-        st.plotly_chart(pnl_chart, use_container_width=True)
+        st.plotly_chart(figures['pnl'], use_container_width=True)
     
     with col2:
         # 資産配分チャート
-        allocation_chart = create_allocation_pie(pnl_df)
-        st.plotly_chart(allocation_chart, use_container_width=True)
+        st.plotly_chart(figures['alloc'], use_container_width=True)
     
     # パフォーマンスサマリー
     if summary:
-        performance_chart = create_performance_summary_chart(summary)
-        st.plotly_chart(performance_chart, use_container_width=True)
+        st.plotly_chart(figures['summary'], use_container_width=True)
 
 
 def display_risk_analysis(pnl_df: pd.DataFrame, tickers: list, portfolio_df: pd.DataFrame):
@@ -613,8 +614,12 @@ def display_risk_analysis(pnl_df: pd.DataFrame, tickers: list, portfolio_df: pd.
             valid_total_value = valid_pnl['current_value_jpy'].sum()
             valid_weights = (valid_pnl['current_value_jpy'] / valid_total_value).values
             
+            # 共分散行列は一度だけ計算して各リスク計算で共有
+            valid_returns = returns_df[valid_tickers]
+            cov_matrix = valid_returns.cov()
+            
             # リスク指標計算
-            risk_metrics = calculate_portfolio_risk(returns_df[valid_tickers], valid_weights)
+            risk_metrics = calculate_portfolio_risk(valid_returns, valid_weights, cov_matrix=cov_matrix)
             
             if risk_metrics:
                 col1, col2 = st.columns(2)
@@ -643,7 +648,7 @@ def display_risk_analysis(pnl_df: pd.DataFrame, tickers: list, portfolio_df: pd.
                         st.plotly_chart(corr_chart, use_container_width=True)
             
             # ポートフォリオリターンを計算
-            portfolio_returns = (returns_df[valid_tickers] * valid_weights).sum(axis=1)
+            portfolio_returns = (valid_returns * valid_weights).sum(axis=1)
             
             # VaR/CVaR計算
             var_metrics = calculate_var_cvar(pd.Series(portfolio_returns))
@@ -675,8 +680,9 @@ def display_risk_analysis(pnl_df: pd.DataFrame, tickers: list, portfolio_df: pd.
                 
                 # ストレステスト
                 st.subheader("🚨 ストレステスト")
-                stress_results = stress_test_scenario(returns_df[valid_tickers], valid_weights, 
-                                                     stress_factor=1.5, correlation_shock=0.8)
+                stress_results = stress_test_scenario(valid_returns, valid_weights, 
+                                                     stress_factor=1.5, correlation_shock=0.8,
+                                                     cov_matrix=cov_matrix)
                 
                 if stress_results:
                     col1, col2, col3, col4 = st.columns(4)
@@ -1851,17 +1857,22 @@ def generate_stock_news_analysis(ticker: str, from_date: datetime, to_date: date
             
             try:
                 safe_prompt = safe_text_processing(prompt)
-                response = gemini_client.model.generate_content(
-                    safe_prompt,
-                    generation_config=gemini_client.generation_config
-                )
                 
-                if response.text:
+                # 応答をストリーミングで受け取り、生成途中の分析を逐次表示
+                analysis_preview = st.empty()
+                chunks = []
+                for chunk in gemini_client.generate_text_stream(safe_prompt):
+                    chunks.append(chunk)
+                    analysis_preview.markdown("".join(chunks) + "▌")
+                analysis_preview.empty()
+                analysis_text = "".join(chunks)
+                
+                if analysis_text:
                     analysis_result = {
                         "success": True,
                         "ticker": ticker,
                         "company_name": company_name,
-                        "analysis": safe_text_processing(response.text),
+                        "analysis": safe_text_processing(analysis_text),
                         "period": f"{from_date.strftime('%Y-%m-%d')} ~ {to_date.strftime('%Y-%m-%d')}",
                         "news_count": len(news_items),
                         "model_used": model_name,
@@ -1886,12 +1897,13 @@ def create_stock_analysis_prompt(ticker: str, company_name: str, articles_text:
                                 from_date: datetime, to_date: datetime) -> str:
     """銘柄分析用のプロンプトを作成"""
     from modules.gemini_api import safe_text_processing
+    from utils.text_utils import truncate_text
     
     from_date_str = f"{from_date.year}年{from_date.month}月{from_date.day}日"
     to_date_str = f"{to_date.year}年{to_date.month}月{to_date.day}日"
     
     # テキストを安全に処理
-    safe_articles_text = safe_text_processing(articles_text[:12000])
+    safe_articles_text = safe_text_processing(truncate_text(articles_text, 12000))
     
     prompt = f"""以下のニュース記事を基に、{ticker}（{company_name}）の
 {from_date_str}から{to_date_str}までの期間における企業分析レポートを作成してください。
@@ -2286,61 +2298,56 @@ def calculate_portfolio_performance(pnl_df: pd.DataFrame, period_data: pd.DataFr
                                   from_date: datetime, to_date: datetime) -> Dict[str, Any]:
     """ポートフォリオ全体のパフォーマンスを計算（為替換算含む）"""
     try:
-        from modules.price_fetcher import cached_get_exchange_rates, determine_currency_from_ticker, convert_to_jpy
+        from modules.price_fetcher import cached_get_exchange_rates, determine_currency_from_ticker, convert_to_jpy_vec
         
         # 為替レートを取得
         exchange_rates = cached_get_exchange_rates()
         
         # 株数データを取得
-        shares_data = {}
-        for _, row in pnl_df.iterrows():
-            ticker = row['ticker']
-            shares = row['shares']
-            shares_data[ticker] = shares
+        shares_data = dict(zip(pnl_df['ticker'], pnl_df['shares']))
         
         # ffillを適用したperiod_dataを使用
-        period_data_filled = period_data.fillna(method='ffill')
+        period_data_filled = period_data.ffill()
+        
+        # 価格データのある保有銘柄について通貨と円換算レートを一括で決定
+        held_tickers = [ticker for ticker in shares_data if ticker in period_data_filled.columns]
+        currencies = pd.Series([determine_currency_from_ticker(ticker) for ticker in held_tickers], index=held_tickers)
+        jpy_rates = pd.Series(
+            convert_to_jpy_vec(pd.Series(1.0, index=held_tickers), currencies, exchange_rates),
+            index=held_tickers
+        )
+        shares = pd.Series([shares_data[ticker] for ticker in held_tickers], index=held_tickers)
         
         # 各日付でのポートフォリオ価値を計算（円換算）
-        portfolio_values_jpy = []
-        valid_dates = []
-        debug_info = []
+        prices_local = period_data_filled[held_tickers]
+        prices_jpy = prices_local * jpy_rates
+        values_jpy = prices_jpy * shares
         
-        for date, row in period_data_filled.iterrows():
-            total_value_jpy = 0
-            valid_tickers = 0
-            daily_debug = {"date": date, "tickers": {}}
-            
-            for ticker, shares in shares_data.items():
-                if ticker in period_data_filled.columns and not pd.isna(row[ticker]):
-                    # 現地通貨での株価
-                    price_local = row[ticker]
-                    
-                    # 通貨を判定
-                    currency = determine_currency_from_ticker(ticker)
-                    
-                    # 円換算
-                    price_jpy = convert_to_jpy(price_local, currency, exchange_rates)
-                    
-                    # ポートフォリオ価値に追加
-                    value_jpy = price_jpy * shares
-                    total_value_jpy += value_jpy
-                    valid_tickers += 1
-                    
-                    daily_debug["tickers"][ticker] = {
-                        "price_local": price_local,
-                        "currency": currency,
-                        "price_jpy": price_jpy,
-                        "shares": shares,
-                        "value_jpy": value_jpy
+        # 少なくとも1銘柄のデータがある日付のみ採用
+        valid_rows = prices_local.notna().any(axis=1)
+        daily_totals = values_jpy[valid_rows].sum(axis=1)
+        portfolio_values_jpy = daily_totals.tolist()
+        valid_dates = daily_totals.index.tolist()
+        
+        debug_info = []
+        for i, date in enumerate(valid_dates[:5]):  # 最初の5日分のデバッグ情報
+            row_local = prices_local[valid_rows].iloc[i]
+            row_jpy = prices_jpy[valid_rows].iloc[i]
+            row_value = values_jpy[valid_rows].iloc[i]
+            debug_info.append({
+                "date": date,
+                "tickers": {
+                    ticker: {
+                        "price_local": row_local[ticker],
+                        "currency": currencies[ticker],
+                        "price_jpy": row_jpy[ticker],
+                        "shares": shares_data[ticker],
+                        "value_jpy": row_value[ticker]
                     }
-            
-            # 少なくとも1銘柄のデータがある場合のみ追加
-            if valid_tickers > 0:
-                portfolio_values_jpy.append(total_value_jpy)
-                valid_dates.append(date)
-                daily_debug["total_value_jpy"] = total_value_jpy
-                debug_info.append(daily_debug)
+                    for ticker in held_tickers if not pd.isna(row_local[ticker])
+                },
+                "total_value_jpy": portfolio_values_jpy[i]
+            })
         
         if len(portfolio_values_jpy) > 0:
             # 始点価値を取得
@@ -2360,7 +2367,7 @@ def calculate_portfolio_performance(pnl_df: pd.DataFrame, period_data: pd.DataFr
                 "raw_values": portfolio_values_jpy,
                 "start_value": start_value,
                 "end_value": end_value,
-                "debug_info": debug_info[:5]  # 最初の5日分のデバッグ情報
+                "debug_info": debug_info
             }
         else:
             return {"error": "ポートフォリオの株価データが不足しています"}
@@ -2700,15 +2707,19 @@ def generate_investment_report(performance_result: Dict[str, Any], from_date: da
                     "timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 }
         
-        # ステップ3: Gemini APIで要約を生成
+        # ステップ3: Gemini APIで要約を生成（生成途中のレポートを逐次表示）
+        report_preview = st.empty()
         with st.spinner("AI分析レポートを生成中..."):
             report_result = generate_gemini_investment_report(
                 performance_result=performance_result,
                 from_date=from_date,
                 to_date=to_date,
                 news_articles_text=articles_text,
-                model_name=model
+                model_name=model,
+                on_text=lambda text: report_preview.markdown(text + "▌")
             )
+        # 完成したレポートは display_investment_report_result で表示するため途中経過は消去
+        report_preview.empty()
         
         return report_result
     
@@ -11,6 +11,30 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 本社所在国（大文字）と地域の対応（一覧にない国は「その他」）
+EUROPEAN_COUNTRIES = (
+    'GERMANY', 'FRANCE', 'UNITED KINGDOM', 'UK', 'GREAT BRITAIN',
+    'ITALY', 'SPAIN', 'NETHERLANDS', 'SWITZERLAND', 'SWEDEN',
+    'NORWAY', 'DENMARK', 'FINLAND', 'BELGIUM', 'AUSTRIA',
+    'IRELAND', 'PORTUGAL', 'LUXEMBOURG', 'GREECE', 'POLAND',
+    'CZECH REPUBLIC', 'HUNGARY', 'SLOVAKIA', 'SLOVENIA',
+    'CROATIA', 'ROMANIA', 'BULGARIA', 'ESTONIA', 'LATVIA',
+    'LITHUANIA', 'MALTA', 'CYPRUS'
+)
+ASIA_PACIFIC_COUNTRIES = (
+    'CHINA', 'SOUTH KOREA', 'KOREA', 'TAIWAN', 'HONG KONG',
+    'SINGAPORE', 'MALAYSIA', 'THAILAND', 'INDONESIA',
+    'PHILIPPINES', 'VIETNAM', 'INDIA', 'AUSTRALIA',
+    'NEW ZEALAND'
+)
+COUNTRY_REGIONS = {
+    'JAPAN': "日本",
+    'UNITED STATES': "米国", 'USA': "米国", 'US': "米国",
+    **dict.fromkeys(EUROPEAN_COUNTRIES, "欧州"),
+    **dict.fromkeys(ASIA_PACIFIC_COUNTRIES, "アジア太平洋"),
+    'CANADA': "北米（その他）"
+}
+
 
 def get_alternative_ticker_info(ticker: str) -> Optional[dict]:
     """
@@ -1000,47 +1024,7 @@ def classify_region_by_country(country: Optional[str]) -> str:
     if not country or country.strip() == '':
         return "その他"
     
-    country = country.upper().strip()
-    
-    # 日本
-    if country in ['JAPAN']:
-        return "日本"
-    
-    # 米国
-    if country in ['UNITED STATES', 'USA', 'US']:
-        return "米国"
-    
-    # 欧州
-    european_countries = [
-        'GERMANY', 'FRANCE', 'UNITED KINGDOM', 'UK', 'GREAT BRITAIN',
-        'ITALY', 'SPAIN', 'NETHERLANDS', 'SWITZERLAND', 'SWEDEN',
-        'NORWAY', 'DENMARK', 'FINLAND', 'BELGIUM', 'AUSTRIA',
-        'IRELAND', 'PORTUGAL', 'LUXEMBOURG', 'GREECE', 'POLAND',
-        'CZECH REPUBLIC', 'HUNGARY', 'SLOVAKIA', 'SLOVENIA',
-        'CROATIA', 'ROMANIA', 'BULGARIA', 'ESTONIA', 'LATVIA',
-        'LITHUANIA', 'MALTA', 'CYPRUS'
-    ]
-    
-    if country in european_countries:
-        return "欧州"
-    
-    # アジア太平洋
-    asia_pacific_countries = [
-        'CHINA', 'SOUTH KOREA', 'KOREA', 'TAIWAN', 'HONG KONG',
-        'SINGAPORE', 'MALAYSIA', 'THAILAND', 'INDONESIA',
-        'PHILIPPINES', 'VIETNAM', 'INDIA', 'AUSTRALIA',
-        'NEW ZEALAND'
-    ]
-    
-    if country in asia_pacific_countries:
-        return "アジア太平洋"
-    
-    # カナダ
-    if country in ['CANADA']:
-        return "北米（その他）"
-    
-    # その他
-    return "その他"
+    return COUNTRY_REGIONS.get(country.upper().strip(), "その他")
 
 
 @st.cache_data(ttl=3600)  # 1時間キャッシュ
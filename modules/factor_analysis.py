@@ -5,31 +5,143 @@ Fama-French 5ファクター + Momentumモデルを使用したポートフォ
 
 import pandas as pd
 import numpy as np
-import yfinance as yf
-try:
-    import statsmodels.api as sm
-    from statsmodels.regression.rolling import RollingOLS
-    STATSMODELS_AVAILABLE = True
-except ImportError:
-    STATSMODELS_AVAILABLE = False
-    # statsmodelsが利用できない場合の代替実装
-    class MockModel:
-        def __init__(self):
-            self.params = pd.Series()
-            self.pvalues = pd.Series()
-            self.rsquared = 0
-            self.rsquared_adj = 0
-            self.fvalue = 0
-            self.f_pvalue = 1
-            self.resid = pd.Series()
-            self.fittedvalues = pd.Series()
-
+import functools
+import importlib.util
+import math
+import re
+import time
+from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Tuple, Optional
 import logging
 from datetime import datetime, timedelta
 
+from utils.disk_cache import cache_file_path, load_pickle_cache, save_pickle_cache
+
+# yfinance / statsmodels / numba / pandas_datareader / streamlit は重いため使用時に遅延インポートする
+STATSMODELS_AVAILABLE = importlib.util.find_spec('statsmodels') is not None
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+# numbaの線形代数（lstsq/cholesky）はscipyのLAPACKを利用するため、JITにはscipyも必要
+SCIPY_AVAILABLE = importlib.util.find_spec('scipy') is not None
+yf = None
+sm = None
+RollingOLS = None
+web = None
+st = None
+
+
+def _lazy_yf():
+    """yfinanceを初回使用時にインポート"""
+    global yf
+    if yf is None:
+        import yfinance as yf
+    return yf
+
+
+def _lazy_sm():
+    """statsmodels（api, RollingOLS）を初回使用時にインポート"""
+    global sm, RollingOLS
+    if sm is None:
+        import statsmodels.api as sm
+        from statsmodels.regression.rolling import RollingOLS
+    return sm, RollingOLS
+
+
+def _lazy_web():
+    """pandas_datareaderを初回使用時にインポート"""
+    global web
+    if web is None:
+        import pandas_datareader.data as web
+    return web
+
+
+def _lazy_st():
+    """streamlitを初回使用時にインポート"""
+    global st
+    if st is None:
+        import streamlit as st
+    return st
+
+
+# statsmodelsが利用できない場合の代替実装
+class MockModel:
+    def __init__(self):
+        self.params = pd.Series()
+        self.pvalues = pd.Series()
+        self.rsquared = 0
+        self.rsquared_adj = 0
+        self.fvalue = 0
+        self.f_pvalue = 1
+        self.resid = pd.Series()
+        self.fittedvalues = pd.Series()
+
+
 logger = logging.getLogger(__name__)
 
+# 外部データのダウンロード結果を保存するディスクキャッシュ
+DOWNLOAD_CACHE_DIR = Path("data_cache") / "downloads"
+DOWNLOAD_CACHE_EXPIRY = 86400  # 24時間
+
+# ファクターデータの保持精度（リターンは小さな値のためfloat32で十分、検証時はnp.float64に戻す）
+# 回帰計算自体は数値安定性のためfloat64に昇格して行う
+PRECISION = np.float32
+
+# ポートフォリオリターン計算用のリターン行列のメモリキャッシュ有効期間（秒）
+RETURNS_CACHE_TTL = 3600  # 1時間
+
+# サンプルファクター（Mkt-RF, SMB, HML, RMW, CMA, Mom）の日次平均と共分散
+SAMPLE_FACTOR_MEAN = np.array([0.0008, 0.0001, 0.0002, 0.0001, -0.0001, 0.0003])
+SAMPLE_FACTOR_COV = np.array([
+    [0.000144, 0.00002, 0.00001, 0.00001, -0.00001, 0.00002],  # Mkt-RF
+    [0.00002, 0.000064, -0.00001, 0.000005, 0.000002, 0.00001],  # SMB
+    [0.00001, -0.00001, 0.000049, 0.000008, 0.000004, -0.00001],  # HML
+    [0.00001, 0.000005, 0.000008, 0.000025, -0.000003, 0.000003],  # RMW
+    [-0.00001, 0.000002, 0.000004, -0.000003, 0.000036, -0.000002],  # CMA
+    [0.00002, 0.00001, -0.00001, 0.000003, -0.000002, 0.000081]   # Mom
+])
+SAMPLE_FACTOR_COV_CHOLESKY = np.linalg.cholesky(SAMPLE_FACTOR_COV)
+
+# サンプルデータ生成用の営業日（平日）カレンダー
+BUSINESS_DAY_CALENDAR = pd.bdate_range('1990-01-01', '2035-12-31')
+
+# Kenneth Frenchファイルのヘッダー・注記行としてスキップするキーワード
+FF_HEADER_SKIP_RE = re.compile(
+    r'copyright|research|data|description|note|created|updated|source|french|fama|'
+    r'date|factor|portfolio|return|average|explanation|definition|construction',
+    re.IGNORECASE
+)
+
+
+def _load_cached_download(source: str, start_date: str, end_date: str) -> Optional[pd.DataFrame]:
+    """
+    ディスクキャッシュからダウンロード済みデータを読み込む（期限切れ・未保存ならNone）
+    
+    Args:
+        source: データソース名
+        start_date: 開始日（YYYY-MM-DD形式）
+        end_date: 終了日（YYYY-MM-DD形式）
+    
+    Returns:
+        Optional[pd.DataFrame]: キャッシュ済みデータ
+    """
+    cache_path = cache_file_path(DOWNLOAD_CACHE_DIR, source, (start_date, end_date))
+    cached = load_pickle_cache(cache_path, DOWNLOAD_CACHE_EXPIRY)
+    return cached if isinstance(cached, pd.DataFrame) else None
+
+
+def _save_cached_download(df: pd.DataFrame, source: str, start_date: str, end_date: str):
+    """
+    ダウンロード済みデータをディスクキャッシュに保存（期限切れのファイルは削除）
+    
+    Args:
+        df: 保存するデータ
+        source: データソース名
+        start_date: 開始日（YYYY-MM-DD形式）
+        end_date: 終了日（YYYY-MM-DD形式）
+    """
+    cache_path = cache_file_path(DOWNLOAD_CACHE_DIR, source, (start_date, end_date))
+    save_pickle_cache(cache_path, df, DOWNLOAD_CACHE_EXPIRY)
+
 
 def download_fama_french_direct(start_date: str, end_date: str) -> pd.DataFrame:
     """
@@ -45,9 +157,15 @@ def download_fama_french_direct(start_date: str, end_date: str) -> pd.DataFrame:
     import requests
     import zipfile
     import io
-    import time
+    import threading
+    import warnings
+    from concurrent.futures import ThreadPoolExecutor, as_completed
     from datetime import datetime
     
+    cached = _load_cached_download('ken_french', start_date, end_date)
+    if cached is not None:
+        return cached
+    
     logger.info("🎯 Kenneth French公式サイトからCSVファイル直接ダウンロード開始")
     
     # Kenneth French公式サイトのURL（堅牢性のため複数のミラー）
@@ -72,16 +190,58 @@ def download_fama_french_direct(start_date: str, end_date: str) -> pd.DataFrame:
         'Upgrade-Insecure-Requests': '1'
     })
     
-    def robust_download_and_parse(urls, data_type, expected_columns):
-        """堅牢なダウンロードとパース"""
-        for attempt, url in enumerate(urls):
-            for retry in range(3):  # 最大3回リトライ
+    def count_numeric_fields(parts, n_values):
+        """日付列以降のn_values列のうち有限な数値の列数を返す（np.fromstringでC実装により一括パース）"""
+        values_text = ','.join(parts[1:n_values + 1])
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('error', DeprecationWarning)
+                values = np.fromstring(values_text, sep=',')
+            return int(np.isfinite(values).sum())
+        except (ValueError, DeprecationWarning):
+            # 数値以外の列を含む場合のみ列ごとに判定
+            numeric_count = 0
+            for part in parts[1:n_values + 1]:
+                try:
+                    if np.isfinite(float(part)):
+                        numeric_count += 1
+                except (ValueError, TypeError):
+                    pass
+            return numeric_count
+    
+    def locate_data_start_bytes(raw, n_columns):
+        """バイト列上で最初のデータ行（YYYYMMDD,数値,...）を探し、行番号を返す"""
+        mv = memoryview(raw)
+        start = 0
+        line_no = 0
+        while (nl := raw.find(b'\n', start)) != -1:
+            line = mv[start:nl]
+            if (
+                len(line) > 9 and
+                line[8] == ord(',') and
+                bytes(line[:8]).isdigit() and
+                int(bytes(line[:4])) >= 1900 and
+                raw.count(b',', start, nl) >= n_columns - 1
+            ):
+                # 候補行のみ分割して数値検証
+                parts = bytes(line).decode('latin-1').split(',')
+                if count_numeric_fields(parts, n_columns - 1) == n_columns - 1:
+                    return line_no
+            start = nl + 1
+            line_no += 1
+        return None
+    
+    def race_download(urls, timeout):
+        """複数ミラーへ同時にリクエストし、最初にダウンロードを完了したレスポンスを採用（残りは中断）"""
+        finished = threading.Event()
+        winner_lock = threading.Lock()
+        
+        def fetch(url):
+            # requests.Session はスレッドセーフでないため、ミラーごとに同じヘッダーのセッションを使う
+            with requests.Session() as mirror_session:
+                mirror_session.headers.update(session.headers)
+                response = mirror_session.get(url, timeout=timeout, stream=True)
                 try:
-                    logger.info(f"📥 {data_type}データダウンロード中... (URL {attempt+1}, 試行 {retry+1}/3)")
-                    
-                    # タイムアウトとリトライ設定
-                    timeout = 45 + (retry * 15)  # 45, 60, 75秒
-                    response = session.get(url, timeout=timeout, stream=True)
                     response.raise_for_status()
                     
                     # レスポンスサイズチェック
@@ -89,51 +249,99 @@ def download_fama_french_direct(start_date: str, end_date: str) -> pd.DataFrame:
                     if content_length and int(content_length) < 1000:
                         raise ValueError(f"ファイルサイズが小さすぎます: {content_length} bytes")
                     
-                    # ZIPファイル処理
-                    zip_content = response.content
-                    logger.info(f"✅ ダウンロード成功: {len(zip_content)} bytes")
+                    # チャンクごとに他ミラーの完了を確認し、負けた場合は受信を打ち切る
+                    buffer = io.BytesIO()
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        if finished.is_set():
+                            raise ValueError(f"他のミラーが先に完了したため中断: {url}")
+                        buffer.write(chunk)
+                    
+                    with winner_lock:
+                        if finished.is_set():
+                            raise ValueError(f"他のミラーが先に完了したため中断: {url}")
+                        finished.set()
+                    return url, buffer.getvalue()
+                finally:
+                    response.close()
+        
+        errors = []
+        executor = ThreadPoolExecutor(max_workers=len(urls))
+        futures = [executor.submit(fetch, url) for url in urls]
+        try:
+            for future in as_completed(futures):
+                try:
+                    return future.result()
+                except Exception as e:
+                    errors.append(str(e))
+        finally:
+            # 勝者決定後は残りのミラーが次のチャンクで中断するよう通知し、終了は待たない
+            finished.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        raise ValueError(f"全ミラーでダウンロード失敗: {'; '.join(errors)}")
+    
+    def robust_download_and_parse(urls, data_type, expected_columns):
+        """堅牢なダウンロードとパース"""
+        for retry in range(3):  # 最大3回リトライ
+            try:
+                logger.info(f"📥 {data_type}データダウンロード中... (ミラー{len(urls)}件を同時試行, 試行 {retry+1}/3)")
+                
+                # タイムアウトとリトライ設定
+                timeout = 45 + (retry * 15)  # 45, 60, 75秒
+                url, zip_content = race_download(urls, timeout)
+                
+                # ZIPファイル処理
+                logger.info(f"✅ ダウンロード成功: {len(zip_content)} bytes ({url})")
+                
+                with zipfile.ZipFile(io.BytesIO(zip_content)) as zip_file:
+                    # ZIP内のファイルリスト
+                    file_list = zip_file.namelist()
+                    logger.info(f"ZIP内ファイル: {file_list}")
+                    
+                    # CSVファイルを探す
+                    csv_file = None
+                    for filename in file_list:
+                        if filename.lower().endswith('.csv'):
+                            csv_file = filename
+                            break
+                    
+                    if not csv_file:
+                        raise ValueError(f"ZIP内にCSVファイルが見つかりません: {file_list}")
+                    
+                    logger.info(f"📄 CSVファイル処理中: {csv_file}")
                     
-                    with zipfile.ZipFile(io.BytesIO(zip_content)) as zip_file:
-                        # ZIP内のファイルリスト
-                        file_list = zip_file.namelist()
-                        logger.info(f"ZIP内ファイル: {file_list}")
+                    with zip_file.open(csv_file) as csv_data:
+                        # エンコーディング自動検出（ヘッダー検出用に先頭4KBのみ読み込み）
+                        head_bytes = csv_data.read(4096)
                         
-                        # CSVファイルを探す
-                        csv_file = None
-                        for filename in file_list:
-                            if filename.lower().endswith('.csv'):
-                                csv_file = filename
+                        # 複数のエンコーディングを試行
+                        content = None
+                        for encoding in ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']:
+                            try:
+                                content = head_bytes.decode(encoding)
+                                logger.info("✅ エンコーディング成功: %s", encoding)
                                 break
+                            except UnicodeDecodeError:
+                                continue
                         
-                        if not csv_file:
-                            raise ValueError(f"ZIP内にCSVファイルが見つかりません: {file_list}")
+                        if content is None:
+                            raise ValueError("ファイルのエンコーディングを特定できません")
                         
-                        logger.info(f"📄 CSVファイル処理中: {csv_file}")
+                        # バイト列のままデータ開始行を走査（行ごとの文字列を生成しない）
+                        data_start = locate_data_start_bytes(head_bytes, len(expected_columns))
                         
-                        with zip_file.open(csv_file) as csv_data:
-                            # エンコーディング自動検出
-                            raw_content = csv_data.read()
-                            
-                            # 複数のエンコーディングを試行
-                            content = None
-                            for encoding in ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']:
-                                try:
-                                    content = raw_content.decode(encoding)
-                                    logger.info(f"✅ エンコーディング成功: {encoding}")
-                                    break
-                                except UnicodeDecodeError:
-                                    continue
-                            
-                            if content is None:
-                                raise ValueError("ファイルのエンコーディングを特定できません")
-                            
-                            # Kenneth Frenchフォーマットの解析（堅牢版）
+                        if data_start is not None:
+                            logger.info(f"✅ バイト走査でデータ開始行発見: {data_start + 1}行目")
+                        else:
+                            # Kenneth Frenchフォーマットの解析（先頭部分のみ）
                             lines = content.split('\n')
-                            logger.info(f"📝 総行数: {len(lines)}")
-                            
+                            if len(head_bytes) == 4096:
+                                lines = lines[:-1]  # 途中で切れた最終行は除外
+                            logger.info(f"📝 ヘッダー検出対象行数: {len(lines)}")
+                        
                             # データ開始行の検索（より堅牢な検索）
                             data_start = None
-                            
+                        
                             # 複数のパターンでデータ開始行を検索
                             search_patterns = [
                                 # パターン1: 8桁の数字で始まる行（YYYYMMDD形式）
@@ -158,34 +366,26 @@ def download_fama_french_direct(start_date: str, end_date: str) -> pd.DataFrame:
                                     line.count(',') >= 2
                                 )
                             ]
-                            
-                            # スキップすべきパターン
-                            skip_patterns = [
-                                'copyright', 'research', 'data', 'description', 'note',
-                                'created', 'updated', 'source', 'french', 'fama',
-                                'date', 'factor', 'portfolio', 'return', 'average',
-                                'explanation', 'definition', 'construction'
-                            ]
-                            
+                        
                             # データ開始行を段階的に検索
                             for pattern_idx, pattern_func in enumerate(search_patterns):
-                                logger.info(f"🔍 パターン{pattern_idx + 1}でデータ行検索中...")
-                                
+                                logger.info("🔍 パターン%dでデータ行検索中...", pattern_idx + 1)
+                            
                                 search_range = min(100, len(lines))  # 最初の100行をチェック
                                 for i, line in enumerate(lines[:search_range]):
                                     line_stripped = line.strip()
                                     if not line_stripped:
                                         continue
-                                    
+                                
                                     # スキップパターンのチェック
-                                    if any(skip in line_stripped.lower() for skip in skip_patterns):
+                                    if FF_HEADER_SKIP_RE.search(line_stripped):
                                         continue
-                                    
+                                
                                     # ヘッダー行の可能性があるものをスキップ
                                     if i < 20 and any(char.isalpha() for char in line_stripped[:10]):
                                         if not line_stripped.split(',')[0].strip().isdigit():
                                             continue
-                                    
+                                
                                     # パターンマッチング
                                     try:
                                         if pattern_func(line_stripped):
@@ -193,258 +393,176 @@ def download_fama_french_direct(start_date: str, end_date: str) -> pd.DataFrame:
                                             parts = line_stripped.split(',')
                                             if len(parts) >= len(expected_columns):
                                                 # 日付以外の列が数値かチェック
-                                                numeric_count = 0
-                                                for j in range(1, min(len(parts), len(expected_columns))):
-                                                    try:
-                                                        float(parts[j].strip())
-                                                        numeric_count += 1
-                                                    except (ValueError, TypeError):
-                                                        pass
-                                                
+                                                numeric_count = count_numeric_fields(parts, len(expected_columns) - 1)
+                                            
                                                 # 少なくとも半分の列が数値データなら有効とする
                                                 if numeric_count >= (len(expected_columns) - 1) // 2:
                                                     data_start = i
-                                                    logger.info(f"✅ パターン{pattern_idx + 1}でデータ開始行発見: {i+1}行目")
-                                                    logger.info(f"📊 検証: {numeric_count}/{len(expected_columns)-1}列が数値データ")
+                                                    logger.info("✅ パターン%dでデータ開始行発見: %d行目", pattern_idx + 1, i + 1)
+                                                    logger.info("📊 検証: %d/%d列が数値データ", numeric_count, len(expected_columns) - 1)
                                                     break
                                     except Exception as e:
-                                        logger.debug(f"パターン検証エラー（行{i+1}）: {str(e)}")
+                                        logger.debug("パターン検証エラー（行%d）: %s", i + 1, e)
                                         continue
-                                
+                            
                                 if data_start is not None:
                                     break
-                            
+                        
                             if data_start is None:
                                 logger.error("❌ 全パターンでデータ開始行が見つかりませんでした")
                                 logger.info("🔍 最初の20行をデバッグ出力:")
                                 for i, line in enumerate(lines[:20]):
-                                    logger.info(f"  行{i+1}: {line.strip()[:100]}")
+                                    logger.info("  行%d: %s", i + 1, line.strip()[:100])
                                 raise ValueError("データ開始行が見つかりません")
+                        
+                        # データ行の抽出（ZIPメンバーをストリームのままCパーサーに渡す）
+                        logger.info(f"📊 データ抽出開始（開始行: {data_start + 1}）")
+                        csv_data.seek(0)
+                        df = pd.read_csv(
+                            csv_data,
+                            skiprows=data_start,
+                            header=None,
+                            names=expected_columns,
+                            index_col=False,
+                            dtype={'Date': str},
+                            encoding=encoding,
+                            skipinitialspace=True,
+                            on_bad_lines='skip',
+                            engine='c'
+                        )
+                        
+                        # 日付形式の検証（YYYYMMDD形式のみ有効）
+                        date_str = df['Date'].str.strip()
+                        is_valid_date = date_str.str.fullmatch(r'\d{8}').fillna(False).astype(bool)
+                        date_str = date_str.where(is_valid_date)
+                        year = pd.to_numeric(date_str.str[:4], errors='coerce')
+                        month = pd.to_numeric(date_str.str[4:6], errors='coerce')
+                        day = pd.to_numeric(date_str.str[6:8], errors='coerce')
+                        is_valid_date &= year.between(1900, 2030) & month.between(1, 12) & day.between(1, 31)
+                        
+                        # 数値データの検証（ファクターリターンは-100%～+100%の範囲、70%以上の列が有効）
+                        numeric_columns = expected_columns[1:]
+                        df[numeric_columns] = df[numeric_columns].apply(pd.to_numeric, errors='coerce')
+                        valid_numeric_count = df[numeric_columns].abs().le(100.0).sum(axis=1)
+                        is_valid_row = is_valid_date & (valid_numeric_count >= len(numeric_columns) * 0.7)
+                        
+                        df = df[is_valid_row].reset_index(drop=True)
+                        df['Date'] = df['Date'].str.strip()
+                        
+                        logger.info(f"📈 有効データ行数: {len(df)}")
+                        
+                        # データ量チェック
+                        min_required_lines = 50  # 最低限必要な行数
+                        if len(df) < min_required_lines:
+                            logger.error(f"❌ データ行数が不足: {len(df)}行 < {min_required_lines}行")
+                            logger.info("🔍 抽出されたデータの最初の10行:")
+                            for idx, row in enumerate(df.head(10).itertuples(index=False)):
+                                logger.info("  %d: %s", idx + 1, tuple(row))
+                            raise ValueError(f"十分なデータ行が見つかりません: {len(df)}行 < {min_required_lines}行")
+                        
+                        # DataFrameの検証
+                        try:
+                            logger.info(f"📋 DataFrame作成完了: {len(df)}行 x {len(df.columns)}列")
                             
-                            # データ行の抽出（堅牢版）
-                            data_lines = []
-                            consecutive_invalid_lines = 0
-                            max_consecutive_invalid = 50  # 連続で無効な行が50行続いたら終了
+                            # データ品質検証
+                            validation_errors = []
                             
-                            logger.info(f"📊 データ抽出開始（開始行: {data_start + 1}）")
+                            # 1. 基本サイズチェック
+                            if len(df) < min_required_lines:
+                                validation_errors.append(f"行数不足: {len(df)} < {min_required_lines}")
                             
-                            for i, line in enumerate(lines[data_start:], start=data_start):
-                                line_stripped = line.strip()
-                                if not line_stripped:
-                                    consecutive_invalid_lines += 1
-                                    if consecutive_invalid_lines > max_consecutive_invalid:
-                                        logger.info(f"🛑 連続空行が{max_consecutive_invalid}行続いたため終了")
-                                        break
-                                    continue
-                                
-                                if ',' not in line_stripped:
-                                    consecutive_invalid_lines += 1
-                                    if consecutive_invalid_lines > max_consecutive_invalid:
-                                        logger.info(f"🛑 連続無効行が{max_consecutive_invalid}行続いたため終了")
-                                        break
-                                    continue
-                                
-                                parts = [p.strip() for p in line_stripped.split(',')]
-                                
-                                # 列数チェック
-                                if len(parts) < len(expected_columns):
-                                    consecutive_invalid_lines += 1
-                                    if consecutive_invalid_lines > max_consecutive_invalid:
-                                        logger.info(f"🛑 連続短行が{max_consecutive_invalid}行続いたため終了")
-                                        break
-                                    continue
-                                
-                                # 日付形式の検証（より柔軟に）
-                                date_part = parts[0]
-                                is_valid_date = False
-                                
-                                try:
-                                    # 8桁数字の日付チェック
-                                    if date_part.isdigit() and len(date_part) == 8:
-                                        year = int(date_part[:4])
-                                        month = int(date_part[4:6])
-                                        day = int(date_part[6:8])
-                                        
-                                        if 1900 <= year <= 2030 and 1 <= month <= 12 and 1 <= day <= 31:
-                                            is_valid_date = True
-                                    # 6桁数字の日付チェック（YYMMDD形式）
-                                    elif date_part.isdigit() and len(date_part) == 6:
-                                        year = int("20" + date_part[:2]) if int(date_part[:2]) < 50 else int("19" + date_part[:2])
-                                        month = int(date_part[2:4])
-                                        day = int(date_part[4:6])
-                                        
-                                        if 1900 <= year <= 2030 and 1 <= month <= 12 and 1 <= day <= 31:
-                                            is_valid_date = True
-                                except (ValueError, TypeError, IndexError):
-                                    pass
-                                
-                                if not is_valid_date:
-                                    # 十分なデータがある場合は終了判定
-                                    if len(data_lines) > 500:
-                                        consecutive_invalid_lines += 1
-                                        if consecutive_invalid_lines > 20:  # より早く終了
-                                            logger.info(f"🛑 十分なデータ取得済み、無効日付で終了")
-                                            break
-                                    else:
-                                        consecutive_invalid_lines += 1
-                                        if consecutive_invalid_lines > max_consecutive_invalid:
-                                            logger.info(f"🛑 連続無効日付が{max_consecutive_invalid}行続いたため終了")
-                                            break
-                                    continue
-                                
-                                # 数値データの検証（より厳密に）
-                                valid_numeric_count = 0
-                                total_numeric_fields = len(expected_columns) - 1  # 日付以外
-                                
-                                for j in range(1, min(len(parts), len(expected_columns))):
+                            if len(df.columns) != len(expected_columns):
+                                validation_errors.append(f"列数不一致: {len(df.columns)} != {len(expected_columns)}")
+                            
+                            # 2. 日付列の検証
+                            try:
+                                # 日付変換テスト
+                                test_dates = df['Date'].head(10).astype(str)
+                                valid_date_count = 0
+                                for date_str in test_dates:
                                     try:
-                                        value = float(parts[j])
-                                        # 異常値チェック（ファクターリターンは通常-100%～+100%の範囲）
-                                        if -1.0 <= value <= 1.0:  # 小数形式
-                                            valid_numeric_count += 1
-                                        elif -100.0 <= value <= 100.0:  # パーセント形式
-                                            valid_numeric_count += 1
-                                    except (ValueError, TypeError):
+                                        if len(date_str) == 8 and date_str.isdigit():
+                                            year = int(date_str[:4])
+                                            if 1900 <= year <= 2030:
+                                                valid_date_count += 1
+                                    except:
                                         pass
                                 
-                                # 数値フィールドの有効性判定（70%以上が有効）
-                                if valid_numeric_count >= total_numeric_fields * 0.7:
-                                    data_lines.append(line_stripped)
-                                    consecutive_invalid_lines = 0  # 有効行でリセット
+                                if valid_date_count < len(test_dates) * 0.8:
+                                    validation_errors.append(f"日付形式エラー: 有効日付 {valid_date_count}/{len(test_dates)}")
                                     
-                                    # プログレス表示
-                                    if len(data_lines) % 500 == 0:
-                                        logger.info(f"📈 抽出済み: {len(data_lines)}行")
-                                else:
-                                    consecutive_invalid_lines += 1
-                                    if consecutive_invalid_lines > max_consecutive_invalid:
-                                        logger.info(f"🛑 連続数値無効行が{max_consecutive_invalid}行続いたため終了")
-                                        break
-                            
-                            logger.info(f"📈 有効データ行数: {len(data_lines)}")
+                            except Exception as e:
+                                validation_errors.append(f"日付列検証エラー: {str(e)}")
                             
-                            # データ量チェック
-                            min_required_lines = 50  # 最低限必要な行数
-                            if len(data_lines) < min_required_lines:
-                                logger.error(f"❌ データ行数が不足: {len(data_lines)}行 < {min_required_lines}行")
-                                logger.info("🔍 抽出されたデータの最初の10行:")
-                                for idx, line in enumerate(data_lines[:10]):
-                                    logger.info(f"  {idx+1}: {line}")
-                                raise ValueError(f"十分なデータ行が見つかりません: {len(data_lines)}行 < {min_required_lines}行")
+                            # 3. 数値列の検証（describeで統計量を一括計算）
+                            numeric_columns = [col for col in expected_columns if col != 'Date' and col in df.columns]
+                            df[numeric_columns] = df[numeric_columns].apply(pd.to_numeric, errors='coerce')
+                            desc = df[numeric_columns].describe(percentiles=[0.01, 0.99])
+                            na_rate = df[numeric_columns].isna().mean()
+                            outlier_rates = (
+                                (df[numeric_columns] < desc.loc['1%']) | (df[numeric_columns] > desc.loc['99%'])
+                            ).mean()
                             
-                            # DataFrameの作成と検証
-                            try:
-                                logger.info(f"📊 DataFrame作成開始: {len(data_lines)}行")
-                                data_io = io.StringIO('\n'.join(data_lines))
-                                df = pd.read_csv(data_io, header=None, names=expected_columns)
-                                
-                                logger.info(f"📋 DataFrame作成完了: {len(df)}行 x {len(df.columns)}列")
-                                
-                                # データ品質検証
-                                validation_errors = []
-                                
-                                # 1. 基本サイズチェック
-                                if len(df) < min_required_lines:
-                                    validation_errors.append(f"行数不足: {len(df)} < {min_required_lines}")
-                                
-                                if len(df.columns) != len(expected_columns):
-                                    validation_errors.append(f"列数不一致: {len(df.columns)} != {len(expected_columns)}")
-                                
-                                # 2. 日付列の検証
-                                try:
-                                    # 日付変換テスト
-                                    test_dates = df['Date'].head(10).astype(str)
-                                    valid_date_count = 0
-                                    for date_str in test_dates:
-                                        try:
-                                            if len(date_str) == 8 and date_str.isdigit():
-                                                year = int(date_str[:4])
-                                                if 1900 <= year <= 2030:
-                                                    valid_date_count += 1
-                                        except:
-                                            pass
-                                    
-                                    if valid_date_count < len(test_dates) * 0.8:
-                                        validation_errors.append(f"日付形式エラー: 有効日付 {valid_date_count}/{len(test_dates)}")
-                                        
-                                except Exception as e:
-                                    validation_errors.append(f"日付列検証エラー: {str(e)}")
-                                
-                                # 3. 数値列の検証
-                                numeric_columns = [col for col in expected_columns if col != 'Date']
-                                for col in numeric_columns:
-                                    if col in df.columns:
-                                        try:
-                                            # 数値変換テスト
-                                            numeric_data = pd.to_numeric(df[col], errors='coerce')
-                                            valid_rate = (1 - numeric_data.isna().mean())
-                                            
-                                            if valid_rate < 0.9:
-                                                validation_errors.append(f"{col}列: 数値変換率 {valid_rate:.1%}")
-                                            
-                                            # 異常値チェック
-                                            if valid_rate > 0.5:
-                                                q1, q99 = numeric_data.quantile([0.01, 0.99])
-                                                outlier_rate = ((numeric_data < q1) | (numeric_data > q99)).mean()
-                                                if outlier_rate > 0.1:
-                                                    logger.warning(f"⚠️ {col}列に異常値が多い: {outlier_rate:.1%}")
-                                        except Exception as e:
-                                            validation_errors.append(f"{col}列検証エラー: {str(e)}")
-                                
-                                # 4. データ統計サマリー
-                                logger.info(f"📊 データ統計サマリー:")
-                                logger.info(f"   - 総行数: {len(df):,}")
-                                logger.info(f"   - 列数: {len(df.columns)}")
-                                logger.info(f"   - 期間: {df['Date'].iloc[0]} ～ {df['Date'].iloc[-1]}")
+                            for col in numeric_columns:
+                                valid_rate = 1 - na_rate[col]
+                                if valid_rate < 0.9:
+                                    validation_errors.append(f"{col}列: 数値変換率 {valid_rate:.1%}")
                                 
-                                # 各列の統計
-                                for col in numeric_columns:
-                                    if col in df.columns:
-                                        try:
-                                            col_data = pd.to_numeric(df[col], errors='coerce')
-                                            if not col_data.isna().all():
-                                                mean_val = col_data.mean()
-                                                std_val = col_data.std()
-                                                logger.info(f"   - {col}: 平均={mean_val:.4f}, 標準偏差={std_val:.4f}")
-                                        except:
-                                            logger.warning(f"   - {col}: 統計計算不可")
-                                
-                                # 検証結果判定
-                                if validation_errors:
-                                    logger.warning(f"⚠️ データ品質の警告 ({len(validation_errors)}件):")
-                                    for error in validation_errors:
-                                        logger.warning(f"   - {error}")
-                                    
-                                    # 致命的エラーのチェック
-                                    critical_errors = [e for e in validation_errors if any(keyword in e.lower() 
-                                                     for keyword in ['行数不足', '列数不一致', '日付形式エラー'])]
-                                    
-                                    if critical_errors:
-                                        logger.error(f"❌ 致命的エラー: {critical_errors}")
-                                        raise ValueError(f"データ品質エラー: {'; '.join(critical_errors)}")
-                                    else:
-                                        logger.info("✅ 警告はありますが、使用可能なデータです")
+                                # 異常値チェック
+                                if valid_rate > 0.5:
+                                    outlier_rate = outlier_rates[col]
+                                    if outlier_rate > 0.1:
+                                        logger.warning("⚠️ %s列に異常値が多い: %.1f%%", col, outlier_rate * 100)
+                            
+                            # 4. データ統計サマリー
+                            logger.info(f"📊 データ統計サマリー:")
+                            logger.info(f"   - 総行数: {len(df):,}")
+                            logger.info(f"   - 列数: {len(df.columns)}")
+                            logger.info(f"   - 期間: {df['Date'].iloc[0]} ～ {df['Date'].iloc[-1]}")
+                            
+                            # 各列の統計（describeの結果をログ出力のみに使用）
+                            for col in desc.columns:
+                                if desc.at['count', col] > 0:
+                                    logger.info("   - %s: 平均=%.4f, 標準偏差=%.4f", col, desc.at['mean', col], desc.at['std', col])
                                 else:
-                                    logger.info("✅ データ品質検証: 全チェック通過")
+                                    logger.warning("   - %s: 統計計算不可", col)
+                            
+                            # 検証結果判定
+                            if validation_errors:
+                                logger.warning(f"⚠️ データ品質の警告 ({len(validation_errors)}件):")
+                                for error in validation_errors:
+                                    logger.warning("   - %s", error)
                                 
-                                logger.info(f"✅ {data_type}データ取得成功: {len(df)}行 x {len(df.columns)}列")
-                                return df
+                                # 致命的エラーのチェック
+                                critical_errors = [e for e in validation_errors if any(keyword in e.lower() 
+                                                 for keyword in ['行数不足', '列数不一致', '日付形式エラー'])]
                                 
-                            except Exception as e:
-                                logger.error(f"❌ DataFrame作成エラー: {str(e)}")
-                                logger.info(f"🔍 デバッグ用サンプルデータ:")
-                                for idx, line in enumerate(data_lines[:5]):
-                                    logger.info(f"  {idx+1}: {line}")
-                                raise ValueError(f"DataFrame作成に失敗: {str(e)}")
+                                if critical_errors:
+                                    logger.error(f"❌ 致命的エラー: {critical_errors}")
+                                    raise ValueError(f"データ品質エラー: {'; '.join(critical_errors)}")
+                                else:
+                                    logger.info("✅ 警告はありますが、使用可能なデータです")
+                            else:
+                                logger.info("✅ データ品質検証: 全チェック通過")
                             
-                except Exception as e:
-                    logger.warning(f"❌ {data_type}ダウンロード失敗 (試行 {retry+1}/3): {str(e)}")
-                    if retry < 2:  # 最後の試行でなければ待機
-                        wait_time = (retry + 1) * 2
-                        logger.info(f"⏱️ {wait_time}秒待機してリトライ...")
-                        time.sleep(wait_time)
-                    continue
-        
+                            logger.info(f"✅ {data_type}データ取得成功: {len(df)}行 x {len(df.columns)}列")
+                            return df
+                            
+                        except Exception as e:
+                            logger.error(f"❌ DataFrame作成エラー: {str(e)}")
+                            logger.info(f"🔍 デバッグ用サンプルデータ:")
+                            for idx, row in enumerate(df.head(5).itertuples(index=False)):
+                                logger.info("  %d: %s", idx + 1, tuple(row))
+                            raise ValueError(f"DataFrame作成に失敗: {str(e)}")
+                        
+            except Exception as e:
+                logger.warning(f"❌ {data_type}ダウンロード失敗 (試行 {retry+1}/3): {str(e)}")
+                if retry < 2:  # 最後の試行でなければ待機
+                    wait_time = (retry + 1) * 2
+                    logger.info(f"⏱️ {wait_time}秒待機してリトライ...")
+                    time.sleep(wait_time)
+                continue
+    
         raise Exception(f"すべての{data_type}ダウンロード試行が失敗しました")
     
     try:
@@ -486,35 +604,31 @@ def download_fama_french_direct(start_date: str, end_date: str) -> pd.DataFrame:
         
         logger.info(f"📊 日付変換後: 5ファクター {len(ff5_df)}行, Momentum {len(mom_df)}行")
         
-        # インデックスを日付に設定
-        ff5_df.set_index('Date', inplace=True)
-        mom_df.set_index('Date', inplace=True)
+        # インデックスを日付に設定（ソート済みにして結合・スライスを高速化）
+        ff5_df = ff5_df.set_index('Date').sort_index()
+        mom_df = mom_df.set_index('Date').sort_index()
         
-        # データを結合（内部結合で共通の日付のみ）
+        # データを結合（共通の日付のみを横方向に連結）
         logger.info("🔗 データ結合中...")
-        factors = ff5_df.join(mom_df, how='inner')
+        common_dates = ff5_df.index.intersection(mom_df.index)
+        factors = pd.concat([ff5_df.loc[common_dates], mom_df.loc[common_dates]], axis=1)
         
         if factors.empty:
             raise ValueError("5ファクターとMomentumデータの結合に失敗")
         
         logger.info(f"✅ データ結合成功: {len(factors)}行")
         
-        # パーセンテージから小数に変換
-        factors = factors.div(100)
-        
-        # 指定期間でフィルタ
+        # 指定期間でフィルタ（ソート済みDatetimeIndexの二分探索スライス）
         start_dt = pd.to_datetime(start_date)
         end_dt = pd.to_datetime(end_date)
-        factors = factors[(factors.index >= start_dt) & (factors.index <= end_dt)]
+        factors = factors.loc[start_dt:end_dt]
         
-        # 数値型への変換と異常値除去
-        for col in factors.columns:
-            factors[col] = pd.to_numeric(factors[col], errors='coerce')
-            
-            # 異常値のフィルタリング（ファクターリターンは通常-50%～+50%の範囲）
-            q1 = factors[col].quantile(0.01)
-            q99 = factors[col].quantile(0.99)
-            factors.loc[(factors[col] < q1) | (factors[col] > q99), col] = np.nan
+        # パーセンテージから小数に変換
+        factors = factors.div(100)
+        
+        # 異常値のフィルタリング（数値型への変換はread_csv時に完了済み）
+        quantiles = factors.quantile([0.01, 0.99])
+        factors = factors.mask((factors < quantiles.loc[0.01]) | (factors > quantiles.loc[0.99]))
         
         # 欠損値を削除
         factors = factors.dropna()
@@ -528,6 +642,7 @@ def download_fama_french_direct(start_date: str, end_date: str) -> pd.DataFrame:
         logger.info(f"   - 日数: {len(factors)}日")
         logger.info(f"   - ファクター: {list(factors.columns)}")
         
+        _save_cached_download(factors, 'ken_french', start_date, end_date)
         return factors
         
     except Exception as e:
@@ -550,6 +665,18 @@ def download_fred_factor_data(start_date: str, end_date: str) -> pd.DataFrame:
     try:
         import requests
         import json
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        
+        # orjsonが利用可能なら高速なパーサーを使用（bytesをそのまま解析）
+        try:
+            import orjson
+            json_loads = orjson.loads
+        except ImportError:
+            json_loads = json.loads
+        
+        cached = _load_cached_download('fred', start_date, end_date)
+        if cached is not None:
+            return cached
         
         logger.info("FRED APIからファクター関連データ取得を試行...")
         
@@ -565,46 +692,65 @@ def download_fred_factor_data(start_date: str, end_date: str) -> pd.DataFrame:
             'FEDFUNDS': 'FedFunds',      # フェデラルファンド金利
         }
         
-        factors_data = {}
-        
-        for series_id, factor_name in series_list.items():
-            try:
-                params = {
-                    'series_id': series_id,
-                    'api_key': 'YOUR_FRED_API_KEY',  # 実際のAPIキーが必要
-                    'file_type': 'json',
-                    'observation_start': start_date,
-                    'observation_end': end_date,
-                    'frequency': 'd',  # 日次データ
-                    'aggregation_method': 'avg'
-                }
-                
-                response = requests.get(base_url, params=params, timeout=15)
-                response.raise_for_status()
-                
-                data = response.json()
+        def fetch_series(series_id: str, factor_name: str) -> Optional[pd.Series]:
+            """1系列を取得して日次の小数系列に変換（取得できない場合はNone）"""
+            params = {
+                'series_id': series_id,
+                'api_key': 'YOUR_FRED_API_KEY',  # 実際のAPIキーが必要
+                'file_type': 'json',
+                'observation_start': start_date,
+                'observation_end': end_date,
+                'frequency': 'd',  # 日次データ
+                'aggregation_method': 'avg'
+            }
+            
+            response = requests.get(base_url, params=params, timeout=15)
+            response.raise_for_status()
+            
+            data = json_loads(response.content)
+            
+            if data.get('observations'):
+                # 観測値を一括でDataFrame化し、ベクトル演算で変換
+                obs = pd.DataFrame(data['observations'])
+                mask = obs['value'].to_numpy() != '.'  # 有効なデータのみ
+                values = obs['value'].to_numpy()[mask].astype(np.float64) / 100.0  # パーセントから小数に
+                dates = pd.to_datetime(obs['date'].to_numpy()[mask], format='%Y-%m-%d', cache=True)
                 
-                if 'observations' in data:
-                    dates = []
-                    values = []
-                    
-                    for obs in data['observations']:
-                        if obs['value'] != '.':  # 有効なデータのみ
-                            dates.append(pd.to_datetime(obs['date']))
-                            values.append(float(obs['value']) / 100)  # パーセントから小数に
-                    
-                    if dates and values:
-                        series = pd.Series(values, index=dates, name=factor_name)
-                        factors_data[factor_name] = series
+                if len(values) > 0:
+                    return pd.Series(values, index=dates, name=factor_name)
+            return None
+        
+        # 各系列は独立したHTTPリクエストのため並行して取得
+        fetched = {}
+        with ThreadPoolExecutor(max_workers=len(series_list)) as executor:
+            futures = {
+                executor.submit(fetch_series, series_id, factor_name): series_id
+                for series_id, factor_name in series_list.items()
+            }
+            for future in as_completed(futures):
+                series_id = futures[future]
+                try:
+                    series = future.result()
+                    if series is not None:
+                        fetched[series_id] = series
                         logger.info(f"FRED {series_id} データ取得成功: {len(series)}日分")
-                
-            except Exception as e:
-                logger.warning(f"FRED {series_id} データ取得失敗: {str(e)}")
+                except Exception as e:
+                    logger.warning(f"FRED {series_id} データ取得失敗: {str(e)}")
+        
+        # 列順を系列定義の順序に揃える
+        factors_data = {
+            factor_name: fetched[series_id]
+            for series_id, factor_name in series_list.items()
+            if series_id in fetched
+        }
         
         if factors_data:
-            # データを結合
-            factors_df = pd.DataFrame(factors_data)
-            factors_df = factors_df.dropna()
+            # データを結合（全系列に共通する日付のみ、外部結合を経由せずソート済み配列の積集合で揃える）
+            common = functools.reduce(np.intersect1d, [series.index.values for series in factors_data.values()])
+            factors_df = pd.DataFrame(
+                {name: series.reindex(common).to_numpy() for name, series in factors_data.items()},
+                index=pd.DatetimeIndex(common)
+            )
             
             # 基本的なファクターを構築（限定的）
             if 'RiskFree_3M' in factors_df.columns:
@@ -615,6 +761,7 @@ def download_fred_factor_data(start_date: str, end_date: str) -> pd.DataFrame:
                 factors_df['RF'] = 0.00008  # デフォルト値
             
             logger.info(f"FRED データ処理完了: {len(factors_df)}日分")
+            _save_cached_download(factors_df, 'fred', start_date, end_date)
             return factors_df
         else:
             logger.warning("FRED から有効なデータを取得できませんでした")
@@ -657,7 +804,7 @@ def get_fama_french_factors(start_date: str = None, end_date: str = None) -> pd.
                 
                 # Streamlit用の成功メッセージ
                 try:
-                    import streamlit as st
+                    st = _lazy_st()
                     with st.expander("🎯 公式Fama-Frenchデータ使用中", expanded=False):
                         st.success("""
                         **Kenneth French公式サイトから実際のFama-Frenchファクターデータを取得しました**
@@ -670,14 +817,27 @@ def get_fama_french_factors(start_date: str = None, end_date: str = None) -> pd.
                 except:
                     pass
                 
-                return factors
+                return factors.astype(PRECISION)
         except Exception as e:
             logger.warning(f"公式サイトからの直接ダウンロードに失敗: {str(e)}")
         
         # 2. pandas_datareaderを試行（複数回リトライ）
-        for attempt in range(3):  # 最大3回リトライ
+        cached = _load_cached_download('datareader', start_date, end_date)
+        if cached is not None:
+            return cached.astype(PRECISION)
+        
+        try:
+            datareader = _lazy_web()
+        except ImportError:
+            datareader = None
+            logger.warning("pandas_datareaderがインストールされていません。代替データ取得を試行します。")
+        except Exception as e:
+            datareader = None
+            logger.warning(f"pandas_datareaderの読み込みに失敗: {str(e)}")
+        
+        # 読み込めない場合はリトライ不要
+        for attempt in range(3 if datareader is not None else 0):  # 最大3回リトライ
             try:
-                import pandas_datareader.data as web
                 logger.info(f"pandas_datareaderでFama-Frenchデータ取得を試行... (試行 {attempt + 1}/3)")
                 
                 # より長いタイムアウトでリトライ
@@ -685,13 +845,13 @@ def get_fama_french_factors(start_date: str = None, end_date: str = None) -> pd.
                 
                 # Fama-French 5ファクターを取得
                 logger.info("F-F 5ファクターデータ取得中...")
-                ff5 = web.DataReader('F-F_Research_Data_5_Factors_2x3_daily', 'famafrench', 
-                                   start=start_date, end=end_date, timeout=timeout)[0]
+                ff5 = datareader.DataReader('F-F_Research_Data_5_Factors_2x3_daily', 'famafrench', 
+                                          start=start_date, end=end_date, timeout=timeout)[0]
                 
                 # Momentumファクターを取得
                 logger.info("Momentumファクターデータ取得中...")
-                mom = web.DataReader('F-F_Momentum_Factor_daily', 'famafrench', 
-                                   start=start_date, end=end_date, timeout=timeout)[0]
+                mom = datareader.DataReader('F-F_Momentum_Factor_daily', 'famafrench', 
+                                          start=start_date, end=end_date, timeout=timeout)[0]
                 
                 # データを結合し、パーセンテージから小数に変換
                 factors = ff5.join(mom, how='inner').div(100)  # %→decimal
@@ -700,19 +860,16 @@ def get_fama_french_factors(start_date: str = None, end_date: str = None) -> pd.
                     logger.info(f"✅ 実際のFama-Frenchデータ取得成功: {len(factors)}日分")
                     logger.info(f"利用可能ファクター: {list(factors.columns)}")
                     logger.info(f"データ期間: {factors.index.min()} ～ {factors.index.max()}")
-                    return factors
+                    _save_cached_download(factors, 'datareader', start_date, end_date)
+                    return factors.astype(PRECISION)
                 else:
                     raise ValueError("取得データが不十分")
                 
-            except ImportError:
-                logger.warning("pandas_datareaderがインストールされていません。代替データ取得を試行します。")
-                break  # ImportErrorの場合はリトライ不要
             except Exception as e:
                 logger.warning(f"pandas_datareaderでのデータ取得に失敗 (試行 {attempt + 1}/3): {str(e)}")
                 if attempt == 2:  # 最後の試行
                     logger.warning("全ての試行が失敗しました。代替データ取得を試行します。")
                 else:
-                    import time
                     time.sleep(2)  # 2秒待機してリトライ
         
         # 3. yfinanceを使った代替データ取得を試行（実際のFama-Frenchに近いデータ）
@@ -725,7 +882,7 @@ def get_fama_french_factors(start_date: str = None, end_date: str = None) -> pd.
                 
                 # Streamlit用の成功メッセージ
                 try:
-                    import streamlit as st
+                    st = _lazy_st()
                     with st.expander("✅ 代替ファクターデータ使用中", expanded=False):
                         st.success("""
                         **実際のETFデータを使用してFama-Frenchファクターを構築しました**
@@ -767,6 +924,10 @@ def get_proxy_factor_data(start_date: str, end_date: str) -> pd.DataFrame:
         pd.DataFrame: 代理ファクターデータ
     """
     try:
+        cached = _load_cached_download('proxy_etf', start_date, end_date)
+        if cached is not None:
+            return cached.astype(PRECISION)
+        
         logger.info(f"代理ファクターデータ取得開始: {start_date} to {end_date}")
         
         # 実際のFama-Frenchファクターに最も近い代理指標を選択
@@ -803,171 +964,161 @@ def get_proxy_factor_data(start_date: str, end_date: str) -> pd.DataFrame:
             '^TNX': 'RiskFree'        # 10年債利回り
         }
         
-        # データ取得
-        import yfinance as yf
+        # データ取得（全ティッカーを1回のリクエストで一括ダウンロード）
+        yf = _lazy_yf()
         
-        price_data = {}
         successful_tickers = []
         
+        logger.info(f"一括取得中: {len(proxy_tickers)}ティッカー")
+        try:
+            data = yf.download(
+                list(proxy_tickers.keys()), start=start_date, end=end_date,
+                progress=False, timeout=30, threads=True, group_by='ticker', auto_adjust=False
+            )
+            if not data.empty:
+                # 調整後終値のみを抽出し、取得できなかった（全てNaNの）ティッカーを除外
+                adj_close = data.xs('Adj Close', level=1, axis=1).dropna(axis=1, how='all')
+            else:
+                adj_close = pd.DataFrame()
+        except Exception as e:
+            logger.warning(f"代理指標の一括取得エラー: {str(e)}")
+            adj_close = pd.DataFrame()
+        
         for ticker, name in proxy_tickers.items():
-            try:
-                logger.info(f"取得中: {name}({ticker})")
-                data = yf.download(ticker, start=start_date, end=end_date, progress=False, timeout=30)
-                if not data.empty and 'Adj Close' in data.columns:
-                    price_data[name] = data['Adj Close'].dropna()
-                    successful_tickers.append(f"{name}({ticker})")
-                    logger.info(f"{name}({ticker}) データ取得成功: {len(data)}日")
-                else:
-                    logger.warning(f"{name}({ticker}) データが空または無効")
-            except Exception as e:
-                logger.warning(f"{name}({ticker}) 取得エラー: {str(e)}")
+            if ticker in adj_close.columns:
+                successful_tickers.append(f"{name}({ticker})")
+                logger.info(f"{name}({ticker}) データ取得成功: {adj_close[ticker].count()}日")
+            else:
+                logger.warning(f"{name}({ticker}) データが空または無効")
         
         logger.info(f"成功した取得: {len(successful_tickers)} / {len(proxy_tickers)} ティッカー")
         logger.info(f"成功ティッカー: {', '.join(successful_tickers)}")
         
-        if len(price_data) < 3:  # 最低限のデータが揃わない場合
+        if len(successful_tickers) < 3:  # 最低限のデータが揃わない場合
             logger.warning("代理指標データが不十分です")
             return pd.DataFrame()
         
-        # 価格データからリターンを計算
-        returns_data = {}
-        for name, prices in price_data.items():
-            if len(prices) > 1:
-                returns = prices.pct_change().dropna()
-                returns_data[name] = returns
+        # 価格データからリターンを計算（全ティッカーの価格行列に対して一括計算）
+        price_df = adj_close.rename(columns=proxy_tickers)
+        price_mat = price_df.to_numpy(dtype=np.float64)
+        returns_mat = np.empty_like(price_mat)
+        returns_mat[:1] = np.nan
+        returns_mat[1:] = price_mat[1:] / price_mat[:-1] - 1.0
         
-        # データフレームに結合
-        returns_df = pd.DataFrame(returns_data).dropna()
+        # データフレームに結合（リターンが計算できない列を除外し、共通の日付のみ）
+        returns_df = pd.DataFrame(returns_mat, index=price_df.index, columns=price_df.columns)
+        returns_df = returns_df.dropna(axis=1, how='all').dropna()
         
         if returns_df.empty:
             return pd.DataFrame()
         
         # Fama-Frenchファクターを実際の構築ロジックに近い形で計算
-        factors = pd.DataFrame(index=returns_df.index)
+        # 各ファクターはNumPy配列として組み立て、最後に1回だけDataFrameを構築する
+        n_days = len(returns_df)
+        
+        def proxy_column(*names):
+            """候補の代理指標のうち最初に取得できたものをNumPy配列で返す"""
+            for name in names:
+                if name in returns_df.columns:
+                    return returns_df[name].to_numpy()
+            return None
         
         # リスクフリーレート（10年債利回りから推定）
-        if 'RiskFree' in returns_df.columns:
+        risk_free_return = proxy_column('RiskFree')
+        if risk_free_return is not None:
             # 10年債利回りの日次変化を年率換算してリスクフリーレートとして使用
-            factors['RF'] = returns_df['RiskFree'].abs() / 252
+            rf = np.abs(risk_free_return) / 252
         else:
-            factors['RF'] = 0.00008  # デフォルト値（年率2%の日次相当）
+            rf = np.full(n_days, 0.00008)  # デフォルト値（年率2%の日次相当）
         
         # 市場プレミアム（Mkt-RF）- 最も重要なファクター
-        market_return = None
-        if 'Market' in returns_df.columns:
-            market_return = returns_df['Market']
-        elif 'Market_Broad' in returns_df.columns:
-            market_return = returns_df['Market_Broad']
+        market_return = proxy_column('Market', 'Market_Broad')
         
         if market_return is not None:
-            factors['Mkt-RF'] = market_return - factors['RF']
+            mkt_rf = market_return - rf
             logger.info("✅ 実際の市場データからMkt-RFファクターを計算")
         else:
-            factors['Mkt-RF'] = np.random.normal(0.0008, 0.012, len(factors))
+            mkt_rf = np.random.normal(0.0008, 0.012, n_days)
             logger.warning("⚠️ 市場データが取得できませんでした。統計的サンプルを使用します。")
         
         # Small Minus Big (SMB) - サイズファクター
-        small_return = None
-        large_return = None
-        
-        # 小型株リターン
-        if 'Small_Cap' in returns_df.columns:
-            small_return = returns_df['Small_Cap']
-        elif 'Small_Cap_Alt' in returns_df.columns:
-            small_return = returns_df['Small_Cap_Alt']
-        
-        # 大型株リターン
-        if 'Large_Cap' in returns_df.columns:
-            large_return = returns_df['Large_Cap']
-        elif market_return is not None:
+        small_return = proxy_column('Small_Cap', 'Small_Cap_Alt')
+        large_return = proxy_column('Large_Cap')
+        if large_return is None:
             large_return = market_return  # 市場を大型株の代理として使用
         
         if small_return is not None and large_return is not None:
-            factors['SMB'] = small_return - large_return
+            smb = small_return - large_return
             logger.info("✅ 実際の小型・大型株データからSMBファクターを計算")
         else:
-            factors['SMB'] = np.random.normal(0.0001, 0.008, len(factors))
+            smb = np.random.normal(0.0001, 0.008, n_days)
             logger.warning("⚠️ サイズファクターデータが取得できませんでした。")
         
         # High Minus Low (HML) - バリューファクター
-        value_return = None
-        growth_return = None
-        
-        if 'Value' in returns_df.columns:
-            value_return = returns_df['Value']
-        elif 'Value_Alt' in returns_df.columns:
-            value_return = returns_df['Value_Alt']
-        
-        if 'Growth' in returns_df.columns:
-            growth_return = returns_df['Growth']
-        elif 'Growth_Alt' in returns_df.columns:
-            growth_return = returns_df['Growth_Alt']
+        value_return = proxy_column('Value', 'Value_Alt')
+        growth_return = proxy_column('Growth', 'Growth_Alt')
         
         if value_return is not None and growth_return is not None:
-            factors['HML'] = value_return - growth_return
+            hml = value_return - growth_return
             logger.info("✅ 実際のバリュー・グロースデータからHMLファクターを計算")
         else:
-            factors['HML'] = np.random.normal(0.0002, 0.007, len(factors))
+            hml = np.random.normal(0.0002, 0.007, n_days)
             logger.warning("⚠️ バリューファクターデータが取得できませんでした。")
         
         # Robust Minus Weak (RMW) - 収益性ファクター
-        quality_return = None
-        if 'Quality' in returns_df.columns:
-            quality_return = returns_df['Quality']
-        elif 'HighDiv' in returns_df.columns:
-            quality_return = returns_df['HighDiv']
-        elif 'Dividend_Aris' in returns_df.columns:
-            quality_return = returns_df['Dividend_Aris']
+        quality_return = proxy_column('Quality', 'HighDiv', 'Dividend_Aris')
         
         if quality_return is not None and market_return is not None:
-            factors['RMW'] = quality_return - market_return
+            rmw = quality_return - market_return
             logger.info("✅ 実際の品質データからRMWファクターを計算")
         else:
-            factors['RMW'] = np.random.normal(0.0001, 0.005, len(factors))
+            rmw = np.random.normal(0.0001, 0.005, n_days)
             logger.warning("⚠️ 収益性ファクターデータが取得できませんでした。")
         
         # Conservative Minus Aggressive (CMA) - 投資ファクター
-        conservative_return = None
-        if 'Conservative' in returns_df.columns:
-            conservative_return = returns_df['Conservative']
-        elif 'International' in returns_df.columns:
-            conservative_return = returns_df['International']
+        conservative_return = proxy_column('Conservative', 'International')
         
         if conservative_return is not None and market_return is not None:
-            factors['CMA'] = (conservative_return - market_return) * 0.5
+            cma = (conservative_return - market_return) * 0.5
             logger.info("✅ 実際の投資スタイルデータからCMAファクターを計算")
         elif quality_return is not None:
-            factors['CMA'] = -quality_return * 0.3  # 品質の逆として近似
+            cma = -quality_return * 0.3  # 品質の逆として近似
         else:
-            factors['CMA'] = np.random.normal(-0.0001, 0.006, len(factors))
+            cma = np.random.normal(-0.0001, 0.006, n_days)
             logger.warning("⚠️ 投資ファクターデータが取得できませんでした。")
         
         # Momentum (Mom) - モメンタムファクター
-        momentum_return = None
-        if 'Momentum' in returns_df.columns:
-            momentum_return = returns_df['Momentum']
-        elif 'Momentum_Alt' in returns_df.columns:
-            momentum_return = returns_df['Momentum_Alt']
+        momentum_return = proxy_column('Momentum', 'Momentum_Alt')
         
         if momentum_return is not None and market_return is not None:
-            factors['Mom'] = momentum_return - market_return
+            mom = momentum_return - market_return
             logger.info("✅ 実際のモメンタムデータからMomファクターを計算")
         elif market_return is not None:
             # 市場データから移動平均を使ってモメンタムを計算
             momentum_window = min(21, len(market_return) // 3)  # 約1ヶ月
             if momentum_window > 5:
                 # 過去リターンの移動平均 - 現在のリターン
-                past_returns = market_return.rolling(window=momentum_window).mean().shift(1)
-                factors['Mom'] = (past_returns - market_return).fillna(0) * 2
+                # 累積和の差分で移動平均を求め、1日ずらして前日までの平均とする
+                cumsum = np.concatenate(([0.0], np.cumsum(market_return)))
+                rolling_mean = (cumsum[momentum_window:] - cumsum[:-momentum_window]) / momentum_window
+                past_returns = np.concatenate((np.full(momentum_window, np.nan), rolling_mean[:-1]))
+                mom = np.nan_to_num(past_returns - market_return, nan=0.0) * 2
                 logger.info("✅ 市場データからモメンタムファクターを推定計算")
             else:
-                factors['Mom'] = np.random.normal(0.0003, 0.009, len(factors))
+                mom = np.random.normal(0.0003, 0.009, n_days)
         else:
-            factors['Mom'] = np.random.normal(0.0003, 0.009, len(factors))
+            mom = np.random.normal(0.0003, 0.009, n_days)
             logger.warning("⚠️ モメンタムファクターデータが取得できませんでした。")
         
+        factors = pd.DataFrame(
+            np.column_stack([rf, mkt_rf, smb, hml, rmw, cma, mom]),
+            index=returns_df.index,
+            columns=['RF', 'Mkt-RF', 'SMB', 'HML', 'RMW', 'CMA', 'Mom']
+        )
+        
         logger.info(f"代理ファクターデータ構築完了: {len(factors)}日分")
-        return factors
+        _save_cached_download(factors, 'proxy_etf', start_date, end_date)
+        return factors.astype(PRECISION)
         
     except Exception as e:
         logger.error(f"代理ファクターデータ取得エラー: {str(e)}")
@@ -988,10 +1139,12 @@ def create_sample_factor_data(start_date: str, end_date: str) -> pd.DataFrame:
     try:
         logger.info(f"統計的サンプルファクターデータ生成開始: {start_date} to {end_date}")
         
-        # 日付範囲を生成
-        date_range = pd.date_range(start=start_date, end=end_date, freq='D')
-        # 営業日のみを抽出
-        business_days = date_range[date_range.weekday < 5]
+        # 事前計算済みの営業日カレンダーから二分探索で切り出す（範囲外の場合のみ都度生成）
+        start_ts, end_ts = pd.Timestamp(start_date), pd.Timestamp(end_date)
+        if BUSINESS_DAY_CALENDAR[0] <= start_ts and end_ts <= BUSINESS_DAY_CALENDAR[-1]:
+            business_days = BUSINESS_DAY_CALENDAR[BUSINESS_DAY_CALENDAR.slice_indexer(start_ts, end_ts)]
+        else:
+            business_days = pd.bdate_range(start=start_ts, end=end_ts)
         
         if len(business_days) == 0:
             logger.error("有効な営業日が見つかりません")
@@ -999,23 +1152,22 @@ def create_sample_factor_data(start_date: str, end_date: str) -> pd.DataFrame:
         
         # 各ファクターの典型的な統計特性に基づいてサンプルデータを生成
         # 実際のFama-Frenchファクターの歴史的統計値に基づく
-        np.random.seed(42)  # 再現性のため
+        rng = np.random.default_rng(42)  # 再現性のため
         n_days = len(business_days)
         
         # より現実的な相関を持つファクターを生成
-        # まず独立成分を生成
-        independent_factors = np.random.multivariate_normal(
-            mean=[0.0008, 0.0001, 0.0002, 0.0001, -0.0001, 0.0003],
-            cov=np.array([
-                [0.000144, 0.00002, 0.00001, 0.00001, -0.00001, 0.00002],  # Mkt-RF
-                [0.00002, 0.000064, -0.00001, 0.000005, 0.000002, 0.00001],  # SMB
-                [0.00001, -0.00001, 0.000049, 0.000008, 0.000004, -0.00001],  # HML
-                [0.00001, 0.000005, 0.000008, 0.000025, -0.000003, 0.000003],  # RMW
-                [-0.00001, 0.000002, 0.000004, -0.000003, 0.000036, -0.000002],  # CMA
-                [0.00002, 0.00001, -0.00001, 0.000003, -0.000002, 0.000081]   # Mom
-            ]),
-            size=n_days
-        )
+        # 独立な標準正規乱数を事前計算済みのCholesky因子で相関させる
+        independent_factors = SAMPLE_FACTOR_MEAN + rng.standard_normal((n_days, 6)) @ SAMPLE_FACTOR_COV_CHOLESKY.T
+        
+        # リスクフリーレート（年率2%程度の日次、最小値で切断した正規分布から直接サンプリング）
+        rf_mean, rf_std, rf_min = 0.00008, 0.00003, 0.00001
+        try:
+            from scipy.stats import truncnorm
+            rf = truncnorm.rvs((rf_min - rf_mean) / rf_std, np.inf, loc=rf_mean, scale=rf_std,
+                               size=n_days, random_state=rng)
+        except ImportError:
+            # scipyが利用できない場合は最小値でクリップ
+            rf = np.maximum(rng.normal(rf_mean, rf_std, n_days), rf_min)
         
         sample_data = pd.DataFrame({
             'Mkt-RF': independent_factors[:, 0],    # 市場プレミアム
@@ -1024,10 +1176,7 @@ def create_sample_factor_data(start_date: str, end_date: str) -> pd.DataFrame:
             'RMW': independent_factors[:, 3],       # 収益性プレミアム
             'CMA': independent_factors[:, 4],       # 投資プレミアム
             'Mom': independent_factors[:, 5],       # モメンタムプレミアム
-            'RF': np.maximum(                       # リスクフリーレート（負にならないように）
-                np.random.normal(0.00008, 0.00003, n_days),  # 年率2%程度の日次
-                0.00001  # 最小値
-            )
+            'RF': rf                                # リスクフリーレート（負にならないように）
         }, index=business_days)
         
         # データ品質チェック
@@ -1044,7 +1193,7 @@ def create_sample_factor_data(start_date: str, end_date: str) -> pd.DataFrame:
         
         # Streamlit用の警告表示
         try:
-            import streamlit as st
+            st = _lazy_st()
             with st.expander("⚠️ ファクターデータについて", expanded=True):
                 st.warning("""
                 **実際のFama-Frenchファクターデータの取得に失敗しました**
@@ -1079,7 +1228,7 @@ def create_sample_factor_data(start_date: str, end_date: str) -> pd.DataFrame:
         except:
             pass
         
-        return sample_data
+        return sample_data.astype(PRECISION)
         
     except Exception as e:
         logger.error(f"サンプルファクターデータ生成エラー: {str(e)}")
@@ -1107,6 +1256,50 @@ def create_sample_factor_data(start_date: str, end_date: str) -> pd.DataFrame:
         return pd.DataFrame()
 
 
+@functools.lru_cache(maxsize=32)
+def _load_returns(tickers_tuple: Tuple[str, ...], period: str, cache_bucket: int) -> pd.DataFrame:
+    """
+    過去データを取得して日次リターン行列を計算（キャッシュ付き）
+    
+    Args:
+        tickers_tuple: ティッカーシンボルのタプル（キャッシュキー用、順序を保持）
+        period: データ取得期間
+        cache_bucket: キャッシュの有効期間を区切る時間枠（RETURNS_CACHE_TTL単位）
+    
+    Returns:
+        pd.DataFrame: 銘柄ごとの日次リターン（キャッシュ共有のため変更しないこと）
+    
+    Raises:
+        ValueError: 過去データまたはリターンが取得できない場合（失敗結果はキャッシュしない）
+    """
+    # リスク分析と同じ方式で過去データを取得
+    from modules.price_fetcher import get_historical_data
+    from utils.helpers import calculate_returns
+    
+    tickers = list(tickers_tuple)
+    logger.info(f"過去データ取得開始: {tickers}, 期間={period}")
+    historical_data = get_historical_data(tickers, period=period)
+    
+    if historical_data.empty:
+        raise ValueError("過去データの取得に失敗")
+    
+    logger.info(f"過去データ取得完了: {historical_data.shape}")
+    
+    # 日次リターンを計算（リスク分析と同じ方式）
+    returns_df = pd.DataFrame()
+    for ticker in tickers:
+        if ticker in historical_data.columns:
+            returns = calculate_returns(historical_data[ticker])
+            if not returns.empty:
+                returns_df[ticker] = returns
+    
+    if returns_df.empty:
+        raise ValueError("リターンデータの計算に失敗")
+    
+    logger.info(f"日次リターン計算完了: {returns_df.shape}")
+    return returns_df
+
+
 def calculate_portfolio_returns_robust(
     pnl_df: pd.DataFrame,
     period: str = '1y'
@@ -1135,33 +1328,13 @@ def calculate_portfolio_returns_robust(
         tickers = pnl_df['ticker'].tolist()
         logger.info(f"対象銘柄数: {len(tickers)}, ティッカー: {tickers}")
         
-        # リスク分析と同じ方式で過去データを取得
-        from modules.price_fetcher import get_historical_data
-        from utils.helpers import calculate_returns
-        
-        logger.info(f"過去データ取得開始: {tickers}, 期間={period}")
-        historical_data = get_historical_data(tickers, period=period)
-        
-        if historical_data.empty:
-            logger.error("過去データの取得に失敗")
-            return pd.Series()
-        
-        logger.info(f"過去データ取得完了: {historical_data.shape}")
-        
-        # 日次リターンを計算（リスク分析と同じ方式）
-        returns_df = pd.DataFrame()
-        for ticker in tickers:
-            if ticker in historical_data.columns:
-                returns = calculate_returns(historical_data[ticker])
-                if not returns.empty:
-                    returns_df[ticker] = returns
-        
-        if returns_df.empty:
-            logger.error("リターンデータの計算に失敗")
+        # 日次リターン行列を取得（同じ銘柄・期間の組み合わせはキャッシュを再利用）
+        try:
+            returns_df = _load_returns(tuple(tickers), period, int(time.time() // RETURNS_CACHE_TTL))
+        except ValueError as e:
+            logger.error(str(e))
             return pd.Series()
         
-        logger.info(f"日次リターン計算完了: {returns_df.shape}")
-        
         # ポートフォリオ重みを計算（リスク分析と同じ方式）
         total_value = pnl_df['current_value_jpy'].sum()
         if total_value <= 0:
@@ -1169,8 +1342,11 @@ def calculate_portfolio_returns_robust(
             return pd.Series()
         
         # データが揃っている銘柄のみでウェイトを計算
-        valid_tickers = [ticker for ticker in tickers if ticker in returns_df.columns]
-        valid_pnl = pnl_df[pnl_df['ticker'].isin(valid_tickers)]
+        # ティッカーをカテゴリ型にして一度だけハッシュ化し、リターン列とインデックスで結合
+        ticker_cat = pnl_df['ticker'].astype('category')
+        value_by_ticker = pnl_df['current_value_jpy'].groupby(ticker_cat, observed=True, sort=False).sum()
+        value_by_ticker, _ = value_by_ticker.align(returns_df.columns.to_series(), join='inner')
+        valid_tickers = value_by_ticker.index.tolist()
         
         if len(valid_tickers) == 0:
             logger.error("有効な銘柄が0件です")
@@ -1179,12 +1355,12 @@ def calculate_portfolio_returns_robust(
         logger.info(f"有効銘柄数: {len(valid_tickers)}/{len(tickers)}")
         
         # 有効な銘柄のウェイトを再計算
-        valid_total_value = valid_pnl['current_value_jpy'].sum()
+        valid_total_value = value_by_ticker.sum()
         if valid_total_value <= 0:
             logger.error("有効銘柄の総時価総額が0以下です")
             return pd.Series()
         
-        valid_weights = (valid_pnl['current_value_jpy'] / valid_total_value).values
+        valid_weights = (value_by_ticker / valid_total_value).values
         
         # 重みの確認
         logger.info(f"重み合計: {valid_weights.sum():.6f}")
@@ -1192,7 +1368,13 @@ def calculate_portfolio_returns_robust(
             logger.info(f"重み: {ticker} = {valid_weights[i]:.4f}")
         
         # 加重ポートフォリオリターンを計算（リスク分析と同じ方式）
-        portfolio_returns = (returns_df[valid_tickers] * valid_weights).sum(axis=1)
+        # 欠損値は0として扱い（pandasのsum(skipna=True)と同じ）、1回の行列ベクトル積で集計
+        # 列位置で一度だけ選択（ファンシーインデックスで得たコピーのため、キャッシュ済みのreturns_dfは変更されない）
+        valid_idx = returns_df.columns.get_indexer(valid_tickers)
+        returns_mat = returns_df.to_numpy(dtype=np.float64)[:, valid_idx]
+        returns_mat[np.isnan(returns_mat)] = 0.0
+        weights = np.ascontiguousarray(valid_weights, dtype=np.float64)
+        portfolio_returns = pd.Series(returns_mat @ weights, index=returns_df.index)
         
         # 最終的な欠損値処理
         portfolio_returns = portfolio_returns.dropna()
@@ -1213,7 +1395,7 @@ def calculate_portfolio_returns_robust(
         
         # Streamlit用のエラー表示
         try:
-            import streamlit as st
+            st = _lazy_st()
             st.error(f"ファクター分析計算エラー: {str(e)}")
             with st.expander("エラー詳細"):
                 st.code(error_details)
@@ -1230,55 +1412,136 @@ def calculate_portfolio_returns(portfolio_df: pd.DataFrame, current_prices: Dict
     return pd.Series()
 
 
-def simple_ols_regression(y: pd.Series, X: pd.DataFrame) -> Dict[str, any]:
+def _ols_core(X: np.ndarray, y: np.ndarray):
+    """
+    OLSの数値計算カーネル（NumPy配列のみを扱うためnumbaでJITコンパイル可能）
+    
+    Args:
+        X: 説明変数行列（定数項を含む、float64）
+        y: 従属変数（float64）
+    
+    Returns:
+        Tuple: (ベータ, 予測値, 残差, R², 調整済みR², 標準誤差)
+    """
+    n, k = X.shape
+    
+    # ベータ計算: 最小二乗解を直接求める（逆行列を明示的に計算しない）
+    betas = np.linalg.lstsq(X, y, rcond=-1.0)[0]
+    
+    # 予測値と残差
+    y_pred = X @ betas
+    residuals = y - y_pred
+    
+    # R squared
+    ss_res = np.sum(residuals ** 2)
+    ss_tot = np.sum((y - np.mean(y)) ** 2)
+    r_squared = 1 - (ss_res / ss_tot)
+    adj_r_squared = 1 - (1 - r_squared) * (n - 1) / (n - k)
+    
+    # 標準誤差: diag((X'X)^-1) をCholesky分解から計算 (X'X)^-1 = L^-T L^-1
+    mse = ss_res / (n - k)
+    L = np.linalg.cholesky(X.T @ X)
+    L_inv = np.linalg.solve(L, np.eye(k))
+    se_beta = np.sqrt(mse * np.sum(L_inv ** 2, axis=0))
+    
+    return betas, y_pred, residuals, r_squared, adj_r_squared, se_beta
+
+
+_ols_core_compiled = None
+
+
+def _get_ols_core():
+    """
+    numba（とscipy）が利用可能ならJITコンパイル済みのOLSカーネルを返す（初回呼び出し時にコンパイル）
+    
+    コンパイルには数秒かかるため、同じ形状の回帰を繰り返すループ（ローリング・ブートストラップ等）からのみ使う
+    """
+    global _ols_core_compiled
+    if _ols_core_compiled is None:
+        if NUMBA_AVAILABLE and SCIPY_AVAILABLE:
+            from numba import njit
+            _ols_core_compiled = _with_ols_core_fallback(njit(cache=True)(_ols_core))
+        else:
+            _ols_core_compiled = _ols_core
+    return _ols_core_compiled
+
+
+def _with_ols_core_fallback(jitted):
+    """
+    JIT版カーネルの型推論・コンパイルに失敗した場合にNumPy版へ切り替えるラッパーを返す
+    
+    Args:
+        jitted: njitでラップしたOLSカーネル
+    
+    Returns:
+        Callable: OLSカーネル
+    """
+    from numba.core.errors import NumbaError
+    
+    def ols_core(X: np.ndarray, y: np.ndarray):
+        global _ols_core_compiled
+        try:
+            return jitted(X, y)
+        except (NumbaError, ImportError) as e:
+            logger.warning(f"OLSカーネルのJITコンパイルに失敗したためNumPy版を使用: {str(e)}")
+            _ols_core_compiled = _ols_core
+            return _ols_core(X, y)
+    
+    return ols_core
+
+
+def simple_ols_regression(
+    y: pd.Series,
+    X,
+    columns: Optional[List[str]] = None,
+    use_jit: bool = False
+) -> Dict[str, any]:
     """
     簡単なOLS回帰（statsmodelsが利用できない場合の代替）
     
     Args:
         y: 従属変数
-        X: 説明変数（定数項を含む）
+        X: 説明変数（定数項を含む、DataFrameまたはNumPy配列）
+        columns: Xが配列の場合の説明変数名（結果のラベルにのみ使用）
+        use_jit: JITコンパイル済みカーネルを使うか（回帰を繰り返すループから呼ぶ場合のみTrue、
+                 1回だけの回帰ではコンパイル時間が計算時間を大きく上回る）
     
     Returns:
         Dict: 回帰結果
     """
     try:
-        # 行列計算による最小二乗法
-        X_array = X.values
-        y_array = y.values
+        if isinstance(X, pd.DataFrame):
+            columns = X.columns
+            X = X.values
         
-        # ベータ計算: β = (X'X)^-1 X'y
-        XtX_inv = np.linalg.inv(X_array.T @ X_array)
-        Xty = X_array.T @ y_array
-        betas = XtX_inv @ Xty
+        # 行列計算による最小二乗法（数値計算はNumPy配列のカーネルで実行）
+        X_array = np.ascontiguousarray(X, dtype=np.float64)
+        y_array = np.ascontiguousarray(y.values, dtype=np.float64)
         
-        # 予測値と残差
-        y_pred = X_array @ betas
-        residuals = y_array - y_pred
+        ols_core = _get_ols_core() if use_jit else _ols_core
+        betas, y_pred, residuals, r_squared, adj_r_squared, se_beta = ols_core(X_array, y_array)
         
-        # 統計量計算
         n = len(y)
         k = X.shape[1]
         
-        # R squared
-        ss_res = np.sum(residuals ** 2)
-        ss_tot = np.sum((y_array - np.mean(y_array)) ** 2)
-        r_squared = 1 - (ss_res / ss_tot)
-        adj_r_squared = 1 - (1 - r_squared) * (n - 1) / (n - k)
-        
-        # 標準誤差（簡易版）
-        mse = ss_res / (n - k)
-        var_beta = mse * np.diag(XtX_inv)
-        se_beta = np.sqrt(var_beta)
-        
-        # t統計量とp値（簡易版）
+        # t統計量とF統計量（定数項を除くk-1個の説明変数の同時検定）
         t_stats = betas / se_beta
-        # 簡易的なp値計算（正確ではないが近似）
-        p_values = 2 * (1 - np.abs(t_stats) / (np.abs(t_stats) + 1))
+        f_value = (r_squared / (k - 1)) / ((1 - r_squared) / (n - k))
+        
+        # p値（Student-t分布・F分布）
+        try:
+            from scipy import stats as scipy_stats
+            p_values = 2.0 * scipy_stats.t.sf(np.abs(t_stats), df=n - k)
+            f_pvalue = float(scipy_stats.f.sf(f_value, k - 1, n - k))
+        except ImportError:
+            # scipyが利用できない場合は正規分布で近似
+            p_values = np.array([math.erfc(abs(t) / math.sqrt(2)) for t in t_stats])
+            f_pvalue = np.nan
         
         # 結果を辞書にまとめ
-        params = pd.Series(betas, index=X.columns)
-        pvalues = pd.Series(p_values, index=X.columns)
-        tvalues = pd.Series(t_stats, index=X.columns)
+        params = pd.Series(betas, index=columns)
+        pvalues = pd.Series(p_values, index=columns)
+        tvalues = pd.Series(t_stats, index=columns)
         
         return {
             'params': params,
@@ -1288,8 +1551,8 @@ def simple_ols_regression(y: pd.Series, X: pd.DataFrame) -> Dict[str, any]:
             'rsquared_adj': adj_r_squared,
             'resid': pd.Series(residuals, index=y.index),
             'fittedvalues': pd.Series(y_pred, index=y.index),
-            'fvalue': 0,  # F統計量は簡略化
-            'f_pvalue': 0.05  # 簡略化
+            'fvalue': f_value,
+            'f_pvalue': f_pvalue
         }
         
     except Exception as e:
@@ -1312,25 +1575,31 @@ def perform_factor_regression(
         Dict: 回帰分析結果（ベータ、アルファ、統計量など）
     """
     try:
-        # データを結合（共通の日付のみ）
-        df = pd.concat([
-            portfolio_returns.rename('Portfolio'),
-            factor_data
-        ], axis=1).dropna()
+        factor_names = ['Mkt-RF', 'SMB', 'HML', 'RMW', 'CMA', 'Mom']
+        
+        # 共通の日付に揃え、欠損を含む行をNumPyのマスクで除外
+        p, f = portfolio_returns.align(factor_data, join='inner', axis=0)
+        f_values = f.to_numpy(dtype=np.float64)
+        mask = ~(np.isnan(p.to_numpy(dtype=np.float64)) | np.isnan(f_values).any(axis=1))
         
-        if df.empty:
+        if not mask.any():
             logger.error("ファクター回帰用のデータが不足")
             return {}
         
         # 超過リターンを計算（ポートフォリオリターン - リスクフリーレート）
-        excess_portfolio_returns = df['Portfolio'] - df['RF']
+        excess_portfolio_returns = pd.Series(
+            p.to_numpy(dtype=np.float64)[mask] - f['RF'].to_numpy(dtype=np.float64)[mask],
+            index=p.index[mask]
+        )
         
-        # 説明変数（ファクター）
-        X = df[['Mkt-RF', 'SMB', 'HML', 'RMW', 'CMA', 'Mom']].copy()
+        # 説明変数（先頭列が定数項＝アルファ）
+        design_columns = ['const'] + factor_names
+        X = np.c_[np.ones(mask.sum()), f[factor_names].to_numpy(dtype=np.float64)[mask]]
         
         if STATSMODELS_AVAILABLE:
-            # statsmodelsを使用
-            X = sm.add_constant(X)  # 定数項（アルファ）を追加
+            # statsmodelsを使用（パラメータ名のためラベル付きで渡す）
+            sm, _ = _lazy_sm()
+            X = pd.DataFrame(X, index=excess_portfolio_returns.index, columns=design_columns)
             model = sm.OLS(excess_portfolio_returns, X).fit()
             
             # 結果を整理
@@ -1343,21 +1612,17 @@ def perform_factor_regression(
                 'adj_r_squared': model.rsquared_adj,
                 'f_statistic': model.fvalue,
                 'f_pvalue': model.f_pvalue,
-                'n_observations': len(df),
+                'n_observations': len(X),
                 'factor_pvalues': model.pvalues.drop('const').to_dict(),
                 'factor_tvalues': model.tvalues.drop('const').to_dict(),
                 'residuals': model.resid,
                 'fitted_values': model.fittedvalues
             }
         else:
-            # 代替実装を使用
-            X['const'] = 1  # 定数項を追加
-            X = X[['const'] + [col for col in X.columns if col != 'const']]  # 定数項を先頭に
-            
-            model_result = simple_ols_regression(excess_portfolio_returns, X)
+            # 代替実装を使用（設計行列は配列のまま渡し、ラベルは結果にのみ付与）
+            model_result = simple_ols_regression(excess_portfolio_returns, X, columns=design_columns)
             
             if model_result:
-                factor_names = ['Mkt-RF', 'SMB', 'HML', 'RMW', 'CMA', 'Mom']
                 results = {
                     'model': MockModel(),
                     'betas': {name: model_result['params'][name] for name in factor_names if name in model_result['params']},
@@ -1367,7 +1632,7 @@ def perform_factor_regression(
                     'adj_r_squared': model_result['rsquared_adj'],
                     'f_statistic': model_result['fvalue'],
                     'f_pvalue': model_result['f_pvalue'],
-                    'n_observations': len(df),
+                    'n_observations': len(X),
                     'factor_pvalues': {name: model_result['pvalues'][name] for name in factor_names if name in model_result['pvalues']},
                     'factor_tvalues': {name: model_result['tvalues'][name] for name in factor_names if name in model_result['tvalues']},
                     'residuals': model_result['resid'],
@@ -1384,6 +1649,43 @@ def perform_factor_regression(
         return {}
 
 
+def _rolling_ols_params(Z: np.ndarray, y: np.ndarray, window: int) -> np.ndarray:
+    """
+    全ローリングウィンドウのOLS係数を一括計算
+    
+    各ウィンドウの正規方程式 Z'Z β = Z'y を累積和の差分から組み立て、
+    (ウィンドウ数, k, k) のスタックとしてLAPACKで一度に解く
+    
+    Args:
+        Z: 説明変数行列（N×k、定数項を含む）
+        y: 従属変数（長さN）
+        window: ウィンドウ長
+    
+    Returns:
+        np.ndarray: 係数（(N-window+1)×k、i行目はi+window-1日目で終わるウィンドウ）
+    """
+    k = Z.shape[1]
+    
+    # 先頭にゼロ行を持つ累積和にすると、ウィンドウ和は cum[i+window] - cum[i] で揃って取り出せる
+    ZtZ_cum = np.zeros((len(Z) + 1, k, k))
+    np.cumsum(Z[:, :, None] * Z[:, None, :], axis=0, out=ZtZ_cum[1:])
+    Zty_cum = np.zeros((len(Z) + 1, k))
+    np.cumsum(Z * y[:, None], axis=0, out=Zty_cum[1:])
+    
+    A = ZtZ_cum[window:] - ZtZ_cum[:-window]
+    b = Zty_cum[window:] - Zty_cum[:-window]
+    
+    # 特異（または悪条件）なウィンドウのみ擬似逆行列で解き、残りは一括solve
+    singular = ~(np.linalg.cond(A) < 1.0 / np.finfo(np.float64).eps)
+    coefs = np.empty_like(b)
+    if (~singular).any():
+        coefs[~singular] = np.linalg.solve(A[~singular], b[~singular, :, None])[:, :, 0]
+    if singular.any():
+        coefs[singular] = (np.linalg.pinv(A[singular]) @ b[singular, :, None])[:, :, 0]
+    
+    return coefs
+
+
 def calculate_rolling_betas(
     portfolio_returns: pd.Series,
     factor_data: pd.DataFrame,
@@ -1399,54 +1701,46 @@ def calculate_rolling_betas(
     
     Returns:
         pd.DataFrame: ローリングベータの時系列
+    
+    Note:
+        係数のみを推定するため、t値・p値・標準誤差は計算しない
     """
     try:
-        # データを結合
-        df = pd.concat([
-            portfolio_returns.rename('Portfolio'),
-            factor_data
-        ], axis=1).dropna()
-        
-        if len(df) < window:
-            logger.warning(f"データが不足（{len(df)}日）、ローリング計算をスキップ（最低{window}日必要）")
+        factor_names = ['Mkt-RF', 'SMB', 'HML', 'RMW', 'CMA', 'Mom']
+        
+        # 共通の日付に揃え、欠損を含む行をNumPyのマスクで除外
+        idx = portfolio_returns.index.intersection(factor_data.index)
+        pr = portfolio_returns.reindex(idx).to_numpy(dtype=np.float64)
+        fd = factor_data.reindex(idx).to_numpy(dtype=np.float64)
+        mask = np.isfinite(pr) & np.all(np.isfinite(fd), axis=1)
+        idx, pr, fd = idx[mask], pr[mask], fd[mask]
+        
+        if len(idx) < window:
+            logger.warning(f"データが不足（{len(idx)}日）、ローリング計算をスキップ（最低{window}日必要）")
             return pd.DataFrame()
         
         # 超過リターンを計算
-        excess_portfolio_returns = df['Portfolio'] - df['RF']
+        rf_col = factor_data.columns.get_loc('RF')
+        y = pr - fd[:, rf_col]
         
-        # 説明変数
-        factor_names = ['Mkt-RF', 'SMB', 'HML', 'RMW', 'CMA', 'Mom']
-        X = df[factor_names]
+        # 説明変数（先頭列が定数項）
+        factor_cols = factor_data.columns.get_indexer(factor_names)
+        Z = np.column_stack([np.ones(len(idx)), fd[:, factor_cols]])
         
         if STATSMODELS_AVAILABLE:
-            # statsmodelsを使用
-            X_with_const = sm.add_constant(X)
-            rolling_model = RollingOLS(excess_portfolio_returns, X_with_const, window=window).fit()
+            # statsmodelsを使用（パラメータ名のためラベル付きで渡す）
+            sm, RollingOLS = _lazy_sm()
+            X_with_const = pd.DataFrame(Z, index=idx, columns=['const'] + factor_names)
+            # 係数のみ推定（共分散・t値の計算を省略し、窓が埋まるまでの区間は推定しない）
+            rolling_model = RollingOLS(
+                pd.Series(y, index=idx), X_with_const, window=window, min_nobs=window
+            ).fit(params_only=True)
             rolling_betas = rolling_model.params.drop(columns='const')
         else:
-            # 代替実装：簡易ローリング回帰
-            rolling_betas = pd.DataFrame(index=df.index[window-1:], columns=factor_names)
+            # 代替実装：累積和による閉形式ローリング回帰（全ウィンドウを一括で解く）
+            coefs = _rolling_ols_params(Z, y, window)
             
-            for i in range(window-1, len(df)):
-                start_idx = i - window + 1
-                end_idx = i + 1
-                
-                # ウィンドウ内データ
-                y_window = excess_portfolio_returns.iloc[start_idx:end_idx]
-                X_window = X.iloc[start_idx:end_idx].copy()
-                X_window['const'] = 1
-                X_window = X_window[['const'] + factor_names]
-                
-                # 回帰計算
-                try:
-                    model_result = simple_ols_regression(y_window, X_window)
-                    if model_result:
-                        for factor in factor_names:
-                            if factor in model_result['params']:
-                                rolling_betas.loc[df.index[i], factor] = model_result['params'][factor]
-                except:
-                    # エラー時はNaN
-                    pass
+            rolling_betas = pd.DataFrame(coefs[:, 1:], index=idx[window-1:], columns=factor_names)
         
         logger.info(f"ローリングベータ計算完了: {len(rolling_betas)}期間（{window}日窓）")
         return rolling_betas
@@ -1471,11 +1765,14 @@ def calculate_factor_contributions(
         pd.DataFrame: 日次ファクター寄与度
     """
     try:
-        contributions = pd.DataFrame(index=factor_data.index)
-        
-        for factor, beta in betas.items():
-            if factor in factor_data.columns:
-                contributions[factor] = factor_data[factor] * beta
+        # ベータをファクター列の順序に揃え、1回のブロードキャストで全列を計算
+        cols = [factor for factor in betas if factor in factor_data.columns]
+        beta_vec = np.asarray([betas[factor] for factor in cols], dtype=np.float64)
+        contributions = pd.DataFrame(
+            factor_data[cols].to_numpy() * beta_vec,
+            index=factor_data.index,
+            columns=cols
+        )
         
         logger.info(f"ファクター寄与度計算完了: {len(contributions)}日分")
         return contributions
@@ -1485,6 +1782,41 @@ def calculate_factor_contributions(
         return pd.DataFrame()
 
 
+# ファクターベータの解釈テキスト（ベータ > 0.2: high, < -0.2: low, それ以外: neutral）
+FACTOR_INTERPRETATIONS = MappingProxyType({
+    'Mkt-RF': {
+        'high': '市場リスクに対し攻撃的（ハイベータ）',
+        'low': '市場リスクに対し守備的（ローベータ）',
+        'neutral': '市場リスクと同程度'
+    },
+    'SMB': {
+        'high': '小型株バイアス（小型株効果を享受）',
+        'low': '大型株バイアス（小型株効果に対し逆相関）',
+        'neutral': '規模に対しニュートラル'
+    },
+    'HML': {
+        'high': 'バリュー株バイアス（割安株選好）',
+        'low': 'グロース株バイアス（成長株選好）',
+        'neutral': 'バリュー/グロースに対しニュートラル'
+    },
+    'RMW': {
+        'high': '高収益性企業への傾斜',
+        'low': '低収益性企業への傾斜',
+        'neutral': '収益性に対しニュートラル'
+    },
+    'CMA': {
+        'high': '保守的投資企業への傾斜',
+        'low': '積極的投資企業への傾斜',
+        'neutral': '投資姿勢に対しニュートラル'
+    },
+    'Mom': {
+        'high': 'モメンタム効果を享受（上昇トレンド追随）',
+        'low': 'モメンタム効果に対し逆相関（逆張り）',
+        'neutral': 'モメンタムに対しニュートラル'
+    }
+})
+
+
 def get_factor_interpretation(factor_name: str, beta_value: float) -> str:
     """
     ファクターベータの解釈を返す
@@ -1496,40 +1828,7 @@ def get_factor_interpretation(factor_name: str, beta_value: float) -> str:
     Returns:
         str: 解釈テキスト
     """
-    interpretations = {
-        'Mkt-RF': {
-            'high': '市場リスクに対し攻撃的（ハイベータ）',
-            'low': '市場リスクに対し守備的（ローベータ）',
-            'neutral': '市場リスクと同程度'
-        },
-        'SMB': {
-            'high': '小型株バイアス（小型株効果を享受）',
-            'low': '大型株バイアス（小型株効果に対し逆相関）',
-            'neutral': '規模に対しニュートラル'
-        },
-        'HML': {
-            'high': 'バリュー株バイアス（割安株選好）',
-            'low': 'グロース株バイアス（成長株選好）',
-            'neutral': 'バリュー/グロースに対しニュートラル'
-        },
-        'RMW': {
-            'high': '高収益性企業への傾斜',
-            'low': '低収益性企業への傾斜',
-            'neutral': '収益性に対しニュートラル'
-        },
-        'CMA': {
-            'high': '保守的投資企業への傾斜',
-            'low': '積極的投資企業への傾斜',
-            'neutral': '投資姿勢に対しニュートラル'
-        },
-        'Mom': {
-            'high': 'モメンタム効果を享受（上昇トレンド追随）',
-            'low': 'モメンタム効果に対し逆相関（逆張り）',
-            'neutral': 'モメンタムに対しニュートラル'
-        }
-    }
-    
-    if factor_name not in interpretations:
+    if factor_name not in FACTOR_INTERPRETATIONS:
         return f'{factor_name}: {beta_value:.3f}'
     
     if beta_value > 0.2:
@@ -1539,4 +1838,4 @@ def get_factor_interpretation(factor_name: str, beta_value: float) -> str:
     else:
         category = 'neutral'
     
-    return interpretations[factor_name][category]
\ No newline at end of file
+    return FACTOR_INTERPRETATIONS[factor_name][category]
\ No newline at end of file
@@ -3,10 +3,13 @@ Gemini APIを使用した市場動向要約モジュール
 """
 
 import os
+import functools
 import logging
-from typing import Dict, Any, Optional
+import numpy as np
+from typing import Callable, Dict, Any, Iterator, Optional
 from datetime import datetime
 import google.generativeai as genai
+from utils.text_utils import to_safe_text, truncate_text
 import sys
 import locale
 
@@ -27,30 +30,45 @@ ensure_utf8_encoding()
 
 logger = logging.getLogger(__name__)
 
+# プロンプトに含める記事テキストの最大文字数
+MAX_ARTICLES_CHARS = 15000
+
+# レスポンスの安全化が必要か（Windowsのコンソール出力のみ。SDKはUTF-8をそのまま送受信できる）
+SANITIZE_RESPONSE_TEXT = sys.platform == "win32"
+
 
 def safe_text_processing(text: str) -> str:
-    """テキストを安全に処理する（エンコーディングエラー回避）"""
-    if not isinstance(text, str):
-        text = str(text)
+    """
+    テキストを安全に処理する（エンコーディングエラー回避）
     
+    スクレイピング時に安全化済みのテキスト（SafeText）はそのまま返す
+    """
     try:
-        # Unicode正規化
-        import unicodedata
-        text = unicodedata.normalize('NFC', text)
-        
-        # 問題のある文字を安全な文字に置換
-        text = text.encode('utf-8', errors='replace').decode('utf-8')
-        
-        return text
+        return to_safe_text(text)
     except Exception as e:
         logger.warning(f"テキスト処理エラー: {e}")
         # フォールバック：ASCII安全な文字のみ保持
-        return ''.join(char for char in text if ord(char) < 128)
+        return ''.join(char for char in str(text) if ord(char) < 128)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_model(model_name: str, api_key: str):
+    """APIキーを設定してモデルを生成（同じモデル名・APIキーの組み合わせは再利用）"""
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
 
 
 class GeminiClient:
     """Gemini APIクライアント"""
     
+    # 生成設定（全インスタンス共通）
+    GENERATION_CONFIG = genai.GenerationConfig(
+        temperature=0.7,
+        top_p=0.95,
+        top_k=40,
+        max_output_tokens=8192,
+    )
+    
     def __init__(self, model_name: str = "gemini-1.5-pro"):
         """
         Gemini APIクライアントを初期化
@@ -66,20 +84,12 @@ class GeminiClient:
                 ".envファイルにGEMINI_API_KEYを設定してください。"
             )
         
-        # APIキーを設定
-        genai.configure(api_key=self.api_key)
-        
-        # モデルを初期化
+        # APIキーを設定してモデルを初期化（キャッシュ済みなら再利用）
         self.model_name = model_name
-        self.model = genai.GenerativeModel(model_name)
+        self.model = _get_model(model_name, self.api_key)
         
         # 生成設定
-        self.generation_config = genai.GenerationConfig(
-            temperature=0.7,
-            top_p=0.95,
-            top_k=40,
-            max_output_tokens=8192,
-        )
+        self.generation_config = self.GENERATION_CONFIG
         
         logger.info(f"Gemini APIクライアントを初期化: モデル={model_name}")
     
@@ -102,6 +112,32 @@ class GeminiClient:
         Returns:
             生成された市場動向要約
         """
+        return "".join(self.generate_market_summary_stream(
+            articles_text, start_date, end_date, performance_summary
+        ))
+    
+    def generate_market_summary_stream(
+        self,
+        articles_text: str,
+        start_date: datetime,
+        end_date: datetime,
+        performance_summary: str
+    ) -> Iterator[str]:
+        """
+        市場動向の要約をストリーミングで生成（生成されたテキストを到着順に返す）
+        
+        Args:
+            articles_text: スクレイピングした記事の統合テキスト
+            start_date: 分析期間の開始日
+            end_date: 分析期間の終了日
+            performance_summary: ポートフォリオパフォーマンスサマリー
+            
+        Yields:
+            生成された市場動向要約の断片
+        """
+        # 後続の文字列処理が上限文字数分だけで済むよう、最初に一度だけ切り詰める
+        articles_text = truncate_text(articles_text, MAX_ARTICLES_CHARS)
+        
         prompt = self._create_market_summary_prompt(
             articles_text, start_date, end_date, performance_summary
         )
@@ -109,21 +145,8 @@ class GeminiClient:
         try:
             logger.info("Gemini APIで市場動向要約を生成中...")
             
-            # プロンプトをさらに安全に処理
-            safe_prompt = safe_text_processing(prompt)
-            
-            response = self.model.generate_content(
-                safe_prompt,
-                generation_config=self.generation_config
-            )
-            
-            if response.text:
-                logger.info("市場動向要約の生成に成功")
-                # レスポンステキストも安全に処理
-                return safe_text_processing(response.text)
-            else:
-                logger.error("Gemini APIから空のレスポンス")
-                raise Exception("要約の生成に失敗しました")
+            yield from self.generate_text_stream(prompt)
+            logger.info("市場動向要約の生成に成功")
                 
         except UnicodeEncodeError as e:
             logger.error(f"文字エンコーディングエラー: {e}")
@@ -132,6 +155,40 @@ class GeminiClient:
             logger.error(f"Gemini API エラー: {e}")
             raise Exception(f"市場動向要約の生成中にエラーが発生しました: {str(e)}")
     
+    def generate_text_stream(self, prompt: str) -> Iterator[str]:
+        """
+        プロンプトに対する応答をストリーミングで生成（生成されたテキストを到着順に返す）
+        
+        Args:
+            prompt: 送信するプロンプト
+            
+        Yields:
+            生成されたテキストの断片
+        """
+        # SDKはUTF-8をネイティブに扱うため、プロンプトはそのまま送信
+        response = self.model.generate_content(
+            prompt,
+            generation_config=self.generation_config,
+            stream=True
+        )
+        
+        has_text = False
+        for chunk in response:
+            try:
+                text = chunk.text
+            except ValueError:
+                # テキストを含まないチャンク（終了通知など）はスキップ
+                continue
+            
+            if text:
+                has_text = True
+                # Windowsではコンソール出力に備えてチャンク単位で安全化
+                yield safe_text_processing(text) if SANITIZE_RESPONSE_TEXT else text
+        
+        if not has_text:
+            logger.error("Gemini APIから空のレスポンス")
+            raise Exception("要約の生成に失敗しました")
+    
     def _create_market_summary_prompt(
         self,
         articles_text: str,
@@ -145,19 +202,15 @@ class GeminiClient:
         start_date_str = f"{start_date.year}年{start_date.month}月{start_date.day}日"
         end_date_str = f"{end_date.year}年{end_date.month}月{end_date.day}日"
         
-        # テキストを安全に処理
-        safe_articles_text = safe_text_processing(articles_text[:15000])
-        safe_performance_summary = safe_text_processing(performance_summary)
-        
         prompt = f"""以下のニュース記事とポートフォリオパフォーマンスデータを基に、
 {start_date_str}から{end_date_str}までの
 包括的な運用レポートを作成してください。
 
 【ニュース記事から抽出した市場情報】
-{safe_articles_text}
+{articles_text}
 
 【ポートフォリオパフォーマンスデータ】
-{safe_performance_summary}
+{performance_summary}
 
 【レポート構成と詳細要件】
 
@@ -265,12 +318,21 @@ def create_performance_summary_text(portfolio_performance: Dict[str, Any], bench
         summary_parts.append(f"\n【個別銘柄パフォーマンス】")
         summary_parts.append(f"総銘柄数: {len(ticker_performance)}銘柄")
         
-        # パフォーマンス順にソート
-        sorted_tickers = sorted(ticker_performance.items(), key=lambda x: x[1]['performance_pct'], reverse=True)
+        # リターンを一度だけ配列化し、並べ替え・勝率・統計をNumPyで集計
+        tickers = list(ticker_performance.keys())
+        returns = np.fromiter(
+            (ticker_performance[ticker]['performance_pct'] for ticker in tickers),
+            dtype=np.float64,
+            count=len(tickers)
+        )
+        
+        # パフォーマンス順にソート（同値は元の順序を維持）
+        order = np.argsort(-returns, kind='stable')
+        sorted_tickers = [(tickers[i], ticker_performance[tickers[i]]) for i in order]
         
         # 勝率計算
-        positive_count = sum(1 for _, data in sorted_tickers if data['performance_pct'] > 0)
-        win_rate = (positive_count / len(sorted_tickers)) * 100
+        positive_count = int((returns > 0).sum())
+        win_rate = 100.0 * positive_count / returns.size
         summary_parts.append(f"勝率: {win_rate:.1f}% ({positive_count}/{len(sorted_tickers)}銘柄がプラス)")
         
         # 全銘柄リスト
@@ -298,15 +360,16 @@ def create_performance_summary_text(portfolio_performance: Dict[str, Any], bench
             summary_parts.append(f"   終了価格: {data['end_price']:.2f} {data.get('currency', 'USD')}")
         
         # 統計サマリー
-        returns = [data['performance_pct'] for data in ticker_performance.values()]
-        if returns:
-            import statistics
+        if returns.size:
+            mean_return, median_return = returns.mean(), np.median(returns)
+            max_return, min_return = returns.max(), returns.min()
+            std_return = returns.std(ddof=1) if returns.size > 1 else 0.0  # 標本標準偏差
             summary_parts.append(f"\n【銘柄リターン統計】")
-            summary_parts.append(f"平均リターン: {statistics.mean(returns):+.2f}%")
-            summary_parts.append(f"中央値リターン: {statistics.median(returns):+.2f}%")
-            summary_parts.append(f"最大リターン: {max(returns):+.2f}%")
-            summary_parts.append(f"最小リターン: {min(returns):+.2f}%")
-            summary_parts.append(f"リターン標準偏差: {statistics.stdev(returns):.2f}%")
+            summary_parts.append(f"平均リターン: {mean_return:+.2f}%")
+            summary_parts.append(f"中央値リターン: {median_return:+.2f}%")
+            summary_parts.append(f"最大リターン: {max_return:+.2f}%")
+            summary_parts.append(f"最小リターン: {min_return:+.2f}%")
+            summary_parts.append(f"リターン標準偏差: {std_return:.2f}%")
     
     return "\n".join(summary_parts)
 
@@ -316,7 +379,8 @@ def generate_gemini_investment_report(
     from_date: datetime,
     to_date: datetime,
     news_articles_text: str,
-    model_name: str = "gemini-1.5-pro"
+    model_name: str = "gemini-1.5-pro",
+    on_text: Optional[Callable[[str], None]] = None
 ) -> Dict[str, Any]:
     """
     Gemini APIを使用して投資レポートを生成
@@ -327,6 +391,7 @@ def generate_gemini_investment_report(
         to_date: レポート期間の終了日
         news_articles_text: スクレイピングしたニュース記事のテキスト
         model_name: 使用するGeminiモデル名
+        on_text: 生成途中のレポート全文を受け取るコールバック（画面への逐次表示用）
         
     Returns:
         生成されたレポート情報
@@ -344,13 +409,18 @@ def generate_gemini_investment_report(
         # Geminiクライアントを初期化
         client = GeminiClient(model_name=model_name)
         
-        # 市場動向要約を生成
-        report_content = client.generate_market_summary(
+        # 市場動向要約を生成（コールバックがあれば断片の到着ごとに途中経過を渡す）
+        chunks = []
+        for chunk in client.generate_market_summary_stream(
             articles_text=news_articles_text,
             start_date=from_date,
             end_date=to_date,
             performance_summary=performance_summary
-        )
+        ):
+            chunks.append(chunk)
+            if on_text is not None:
+                on_text("".join(chunks))
+        report_content = "".join(chunks)
         
         return {
             "success": True,
@@ -3,6 +3,8 @@ Google Custom Search API を使用した金融ニュース検索モジュール
 """
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional
 from datetime import datetime
 import logging
@@ -27,6 +29,23 @@ class GoogleSearchClient:
             )
         
         self.service = build("customsearch", "v1", developerKey=self.api_key)
+        self._thread_local = threading.local()
+    
+    def _get_service(self):
+        """
+        スレッドごとのAPIサービスを取得
+        
+        googleapiclientが内部で使うhttplib2はスレッドセーフではないため、
+        メインスレッド以外ではスレッドごとにサービスを生成して使い回す
+        """
+        if threading.current_thread() is threading.main_thread():
+            return self.service
+        
+        service = getattr(self._thread_local, 'service', None)
+        if service is None:
+            service = build("customsearch", "v1", developerKey=self.api_key)
+            self._thread_local.service = service
+        return service
     
     def search_financial_news(
         self, 
@@ -58,7 +77,7 @@ class GoogleSearchClient:
             logger.info(f"Google Search APIで検索: {full_query}")
             
             # 検索実行
-            results = self.service.cse().list(
+            results = self._get_service().cse().list(
                 q=full_query,
                 cx=self.search_engine_id,
                 num=min(num_results, 10),  # 最大10件
@@ -106,27 +125,37 @@ class GoogleSearchClient:
         Returns:
             全検索結果の統合リスト
         """
-        all_results = []
-        seen_urls = set()  # 重複URL除去用
+        if not queries:
+            return []
         
-        for query in queries:
-            try:
-                results = self.search_financial_news(
+        # 各クエリは独立したHTTPリクエストのため並行して実行
+        results_by_query = [[] for _ in queries]
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            futures = {
+                executor.submit(
+                    self.search_financial_news,
                     start_date=start_date,
                     end_date=end_date,
                     query=query,
                     num_results=num_per_query
-                )
-                
-                # 重複を除いて追加
-                for result in results:
-                    if result['url'] not in seen_urls:
-                        all_results.append(result)
-                        seen_urls.add(result['url'])
-                        
-            except Exception as e:
-                logger.warning(f"クエリ '{query}' の検索でエラー: {e}")
-                continue
+                ): i
+                for i, query in enumerate(queries)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results_by_query[i] = future.result()
+                except Exception as e:
+                    logger.warning(f"クエリ '{queries[i]}' の検索でエラー: {e}")
+        
+        # クエリの順序で重複を除いて統合
+        all_results = []
+        seen_urls = set()  # 重複URL除去用
+        for results in results_by_query:
+            for result in results:
+                if result['url'] not in seen_urls:
+                    all_results.append(result)
+                    seen_urls.add(result['url'])
         
         logger.info(f"合計 {len(all_results)} 件の一意なニュース記事を取得")
         return all_results
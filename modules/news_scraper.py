@@ -3,16 +3,96 @@
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import asyncio
+import importlib.util
 import logging
+import threading
+from functools import lru_cache
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional
 from urllib.parse import urlparse
 import re
 
+from utils.text_utils import SafeText, to_safe_text
+
+# HTMLパーサー: selectolax（C実装）を優先し、利用できない場合はBeautifulSoup（lxmlがあればlxml）を使用
+# （selectolax 1.0以降はLexborバックエンドのみ、それ以前はModestバックエンドを使用）
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+        SELECTOLAX_AVAILABLE = True
+    except ImportError:
+        SELECTOLAX_AVAILABLE = False
+
+# 非同期HTTPクライアント（大量URLのスクレイピング用、利用できない場合はスレッド並行処理のみ）
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# HTTP/2はh2パッケージがある場合のみ有効化
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+BS4_PARSER = 'lxml' if importlib.util.find_spec('lxml') is not None else 'html.parser'
+
+# テキストクリーンアップ用の正規表現（記事ごとに再利用）
+WHITESPACE_RE = re.compile(r'\s+')
+EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+
+# HTML先頭部分の<meta>で宣言された文字コード（Content-Typeにcharsetがない場合に使用）
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([A-Za-z0-9_.:\-]+)', re.IGNORECASE)
+META_CHARSET_SCAN_BYTES = 4096
+
+# この件数を超えるURLはasyncio+httpxで取得（スレッドプールより多数の同時接続を低コストで扱える）
+ASYNC_SCRAPE_THRESHOLD = 50
+
 logger = logging.getLogger(__name__)
 
 
+# サイト別のコンテンツセレクター
+SITE_SELECTORS = {
+    'bloomberg.co.jp': {
+        'content': ['article', '.article-body', '.story-body'],
+        'remove': ['.ad', '.advertisement', 'aside', 'nav']
+    },
+    'jp.reuters.com': {
+        'content': ['article', '.article-body', '[data-testid="article-body"]'],
+        'remove': ['.ad', '.social-links', '.related-content']
+    },
+    'nikkei.com': {
+        'content': ['article', '.article-body', '.cmn-article_text'],
+        'remove': ['.ad', '.subscription-promo', '.related-articles']
+    },
+    'default': {
+        'content': ['article', 'main', '.article-body', '.content', '[role="main"]'],
+        'remove': ['script', 'style', '.ad', '.advertisement', 'aside', 'nav', 'header', 'footer']
+    }
+}
+
+# 不要要素・本文のセレクターをそれぞれ1つのCSSセレクターに結合しておく（1回の走査で全て取得）
+for _site_config in SITE_SELECTORS.values():
+    _site_config['remove_joined'] = ', '.join(_site_config['remove'])
+    _site_config['content_joined'] = ', '.join(_site_config['content'])
+
+
+@lru_cache(maxsize=64)
+def _config_for_domain(domain: str) -> Dict[str, List[str]]:
+    """ドメインに対応するサイト設定を取得（同一ドメインの判定結果はキャッシュ）"""
+    for site, config in SITE_SELECTORS.items():
+        if site in domain:
+            return config
+    
+    return SITE_SELECTORS['default']
+
+
 class NewsScraper:
     """ニュース記事スクレイパー"""
     
@@ -29,44 +109,90 @@ class NewsScraper:
             'User-Agent': user_agent or 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        # サイト別のコンテンツセレクター
-        self.site_selectors = {
-            'bloomberg.co.jp': {
-                'content': ['article', '.article-body', '.story-body'],
-                'remove': ['.ad', '.advertisement', 'aside', 'nav']
-            },
-            'jp.reuters.com': {
-                'content': ['article', '.article-body', '[data-testid="article-body"]'],
-                'remove': ['.ad', '.social-links', '.related-content']
-            },
-            'nikkei.com': {
-                'content': ['article', '.article-body', '.cmn-article_text'],
-                'remove': ['.ad', '.subscription-promo', '.related-articles']
-            },
-            'default': {
-                'content': ['article', 'main', '.article-body', '.content', '[role="main"]'],
-                'remove': ['script', 'style', '.ad', '.advertisement', 'aside', 'nav', 'header', 'footer']
-            }
-        }
+        # 接続を使い回すHTTPセッション（TLSハンドシェイクを記事間で共有、並行取得に合わせたプールサイズ）
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # サイト別のコンテンツセレクター（モジュール共通の設定を参照）
+        self.site_selectors = SITE_SELECTORS
     
     def _get_site_config(self, url: str) -> Dict[str, List[str]]:
         """URLに基づいてサイト固有の設定を取得"""
-        domain = urlparse(url).netloc
+        return _config_for_domain(urlparse(url).netloc)
+    
+    @staticmethod
+    def _parse_html(html):
+        """HTMLをパースしてドキュメントツリーを返す"""
+        if SELECTOLAX_AVAILABLE:
+            return HTMLParser(html)
+        return BeautifulSoup(html, BS4_PARSER)
+    
+    @staticmethod
+    def _response_html(response):
+        """
+        レスポンスからパーサーに渡すHTMLを取得（デコードは最大1回）
+        
+        Content-Typeで文字コードが宣言されていればその文字コードでデコードし、
+        宣言がなければバイト列のままパーサーに渡して<meta>の宣言から判定させる
+        
+        Args:
+            response: requests / httpx のレスポンス
+            
+        Returns:
+            str または bytes: パーサーに渡すHTML
+        """
+        if 'charset=' in response.headers.get('Content-Type', '').lower():
+            return response.text
         
-        for site, config in self.site_selectors.items():
-            if site in domain:
-                return config
+        if not SELECTOLAX_AVAILABLE:
+            # BeautifulSoupはバイト列から<meta>の宣言を読み取ってデコードする
+            return response.content
         
-        return self.site_selectors['default']
+        # selectolax（Lexbor）はバイト列をUTF-8として扱うため、<meta>の宣言を先に確認
+        content = response.content
+        match = META_CHARSET_RE.search(content[:META_CHARSET_SCAN_BYTES])
+        encoding = match.group(1).decode('ascii') if match else 'utf-8'
+        try:
+            return content.decode(encoding, errors='replace')
+        except LookupError:
+            return content.decode('utf-8', errors='replace')
+    
+    @staticmethod
+    def _select(tree, selector: str) -> list:
+        """CSSセレクターに一致する要素を取得"""
+        if SELECTOLAX_AVAILABLE:
+            return tree.css(selector)
+        return tree.select(selector)
+    
+    @staticmethod
+    def _matches(node, selector: str) -> bool:
+        """要素がCSSセレクターに一致するか判定"""
+        if SELECTOLAX_AVAILABLE:
+            return node.css_matches(selector)
+        return node.css.match(selector)
+    
+    @staticmethod
+    def _node_text(node, separator: str = '') -> str:
+        """要素のテキストを取得（各テキスト断片は前後の空白を除去）"""
+        if SELECTOLAX_AVAILABLE:
+            return node.text(separator=separator, strip=True)
+        return node.get_text(separator=separator, strip=True)
     
     def _clean_text(self, text: str) -> str:
         """テキストをクリーンアップ"""
         # 余分な空白を削除
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         # 前後の空白を削除
         text = text.strip()
         # 連続する改行を単一の改行に
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = EXCESS_NEWLINES_RE.sub('\n\n', text)
         
         return text
     
@@ -84,119 +210,255 @@ class NewsScraper:
             logger.info(f"記事をスクレイピング: {url}")
             
             # HTTPリクエスト
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
             
-            # HTMLパース
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # サイト設定を取得
-            config = self._get_site_config(url)
-            
-            # 不要な要素を削除
-            for selector in config['remove']:
-                for element in soup.select(selector):
-                    element.decompose()
+            return self._extract_article(url, self._response_html(response))
             
-            # タイトル取得
-            title = None
-            title_elements = soup.select('h1, .article-title, [class*="title"]')
-            if title_elements:
-                title = title_elements[0].get_text(strip=True)
-            
-            # 本文取得
-            content = None
-            for selector in config['content']:
-                content_elements = soup.select(selector)
-                if content_elements:
-                    # 複数要素の場合は結合
-                    content_texts = []
-                    for elem in content_elements:
-                        text = elem.get_text(separator='\n', strip=True)
-                        if text and len(text) > 100:  # 短すぎるテキストは除外
-                            content_texts.append(text)
-                    
-                    if content_texts:
-                        content = '\n\n'.join(content_texts)
-                        break
+        except requests.RequestException as e:
+            logger.error(f"記事取得エラー ({url}): {e}")
+            return self._error_result(url, f'記事の取得に失敗しました: {str(e)}')
+        except Exception as e:
+            logger.error(f"予期しないエラー ({url}): {e}")
+            return self._error_result(url, f'予期しないエラーが発生しました: {str(e)}')
+    
+    async def scrape_article_async(self, client, url: str) -> Dict[str, str]:
+        """
+        記事本文を非同期でスクレイピング
+        
+        Args:
+            client: httpx.AsyncClient
+            url: 記事のURL
             
-            # 本文が見つからない場合、段落タグから取得を試みる
-            if not content:
-                paragraphs = soup.find_all('p')
-                content_texts = []
-                for p in paragraphs:
-                    text = p.get_text(strip=True)
-                    if text and len(text) > 50:  # 短い段落は除外
-                        content_texts.append(text)
-                
-                if content_texts:
-                    content = '\n\n'.join(content_texts[:20])  # 最初の20段落まで
+        Returns:
+            記事情報（タイトル、本文、エラー情報など）
+        """
+        try:
+            logger.info(f"記事をスクレイピング: {url}")
             
-            # テキストクリーンアップ
-            if content:
-                content = self._clean_text(content)
+            # HTTPリクエスト
+            response = await client.get(url, timeout=self.timeout)
+            response.raise_for_status()
             
-            return {
-                'url': url,
-                'title': title or 'タイトル不明',
-                'content': content or '本文を取得できませんでした',
-                'success': bool(content),
-                'error': None
-            }
+            # パースはイベントループを止めないようワーカースレッドで実行
+            return await asyncio.to_thread(self._extract_article, url, self._response_html(response))
             
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"記事取得エラー ({url}): {e}")
-            return {
-                'url': url,
-                'title': 'エラー',
-                'content': '',
-                'success': False,
-                'error': f'記事の取得に失敗しました: {str(e)}'
-            }
+            return self._error_result(url, f'記事の取得に失敗しました: {str(e)}')
         except Exception as e:
             logger.error(f"予期しないエラー ({url}): {e}")
-            return {
-                'url': url,
-                'title': 'エラー',
-                'content': '',
-                'success': False,
-                'error': f'予期しないエラーが発生しました: {str(e)}'
-            }
+            return self._error_result(url, f'予期しないエラーが発生しました: {str(e)}')
+    
+    @staticmethod
+    def _error_result(url: str, error: str) -> Dict[str, str]:
+        """取得失敗時の記事情報を生成"""
+        return {
+            'url': url,
+            'title': 'エラー',
+            'content': '',
+            'success': False,
+            'error': error
+        }
+    
+    def _extract_article(self, url: str, html) -> Dict[str, str]:
+        """
+        取得済みHTMLからタイトルと本文を抽出
+        
+        Args:
+            url: 記事のURL（サイト設定の判定に使用）
+            html: 記事のHTML（文字列またはバイト列）
+            
+        Returns:
+            記事情報（タイトル、本文など）
+        """
+        # HTMLパース
+        tree = self._parse_html(html)
+        
+        # サイト設定を取得
+        config = self._get_site_config(url)
+        
+        # 不要な要素を削除（子孫を先に削除するため文書順の逆順で処理）
+        for element in reversed(self._select(tree, config['remove_joined'])):
+            element.decompose()
+        
+        # タイトル取得
+        title = None
+        title_elements = self._select(tree, 'h1, .article-title, [class*="title"]')
+        if title_elements:
+            title = self._node_text(title_elements[0])
+        
+        # 本文取得
+        # 全セレクターの候補を1回の走査で取得し、優先順にセレクターへ振り分ける
+        content = None
+        content_elements = self._select(tree, config['content_joined'])
+        element_texts = {}  # 要素ごとのテキスト（複数セレクターに一致しても抽出は1回）
+        for selector in config['content']:
+            # 複数要素の場合は結合
+            content_texts = []
+            for i, elem in enumerate(content_elements):
+                if not self._matches(elem, selector):
+                    continue
+                if i not in element_texts:
+                    element_texts[i] = self._node_text(elem, separator='\n')
+                text = element_texts[i]
+                if text and len(text) > 100:  # 短すぎるテキストは除外
+                    content_texts.append(text)
+            
+            if content_texts:
+                content = '\n\n'.join(content_texts)
+                break
+        
+        # 本文が見つからない場合、段落タグから取得を試みる
+        if not content:
+            paragraphs = self._select(tree, 'p')
+            content_texts = []
+            for p in paragraphs:
+                text = self._node_text(p)
+                if text and len(text) > 50:  # 短い段落は除外
+                    content_texts.append(text)
+            
+            if content_texts:
+                content = '\n\n'.join(content_texts[:20])  # 最初の20段落まで
+        
+        # テキストクリーンアップと安全化（NFC正規化は取り込み時に一度だけ行う）
+        if content:
+            content = to_safe_text(self._clean_text(content))
+        if title:
+            title = to_safe_text(title)
+        
+        return {
+            'url': url,
+            'title': title or 'タイトル不明',
+            'content': content or '本文を取得できませんでした',
+            'success': bool(content),
+            'error': None
+        }
     
     def scrape_multiple_articles(
         self,
         urls: List[str],
         delay: float = 1.0,
-        max_articles: Optional[int] = None
+        max_articles: Optional[int] = None,
+        max_workers: int = 8
     ) -> List[Dict[str, str]]:
         """
-        複数の記事をスクレイピング
+        複数の記事を並行してスクレイピング
+        
+        異なるサイトへのリクエストは並行して実行し、同一ドメインへのリクエストは
+        1件ずつ、前回のリクエストから最低delay秒の間隔を空けて実行する
         
         Args:
             urls: 記事URLのリスト
-            delay: リクエスト間の待機時間（秒）
+            delay: 同一ドメインへのリクエスト間の待機時間（秒）
             max_articles: 最大取得記事数
+            max_workers: 並行実行するワーカー数
             
         Returns:
-            記事情報のリスト
+            記事情報のリスト（入力URLと同じ順序）
         """
-        results = []
         urls_to_scrape = urls[:max_articles] if max_articles else urls
+        if not urls_to_scrape:
+            return []
         
-        for i, url in enumerate(urls_to_scrape):
-            # スクレイピング実行
-            result = self.scrape_article(url)
-            results.append(result)
-            
-            # 最後のURLでない場合は待機
-            if i < len(urls_to_scrape) - 1:
-                time.sleep(delay)
+        # 大量のURLはイベントループ上で非同期に取得（実行中のイベントループがない場合のみ）
+        if HTTPX_AVAILABLE and len(urls_to_scrape) > ASYNC_SCRAPE_THRESHOLD:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self.scrape_multiple_articles_async(urls_to_scrape, delay=delay))
+        
+        # ドメインごとのロックと最終リクエスト時刻
+        domain_locks = {urlparse(url).netloc: threading.Lock() for url in urls_to_scrape}
+        last_request = {}
+        
+        def scrape_politely(url: str) -> Dict[str, str]:
+            domain = urlparse(url).netloc
+            with domain_locks[domain]:
+                # 同一ドメインへの前回リクエストからdelay秒経過するまで待機
+                if domain in last_request:
+                    wait = delay - (time.monotonic() - last_request[domain])
+                    if wait > 0:
+                        time.sleep(wait)
+                try:
+                    return self.scrape_article(url)
+                finally:
+                    last_request[domain] = time.monotonic()
+        
+        results = [None] * len(urls_to_scrape)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls_to_scrape))) as executor:
+            futures = {executor.submit(scrape_politely, url): i for i, url in enumerate(urls_to_scrape)}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
         
         # 成功した記事の数をログ出力
         successful = sum(1 for r in results if r['success'])
         logger.info(f"スクレイピング完了: {successful}/{len(results)} 件成功")
         
         return results
+    
+    async def scrape_multiple_articles_async(
+        self,
+        urls: List[str],
+        delay: float = 1.0,
+        max_articles: Optional[int] = None,
+        concurrency: int = 32
+    ) -> List[Dict[str, str]]:
+        """
+        複数の記事をasyncio+httpxで非同期にスクレイピング（数百〜数千件向け）
+        
+        同一ドメインへのリクエストはscrape_multiple_articlesと同様に1件ずつ、
+        前回のリクエストから最低delay秒の間隔を空けて実行する
+        
+        Args:
+            urls: 記事URLのリスト
+            delay: 同一ドメインへのリクエスト間の待機時間（秒）
+            max_articles: 最大取得記事数
+            concurrency: 同時に実行するリクエスト数の上限
+            
+        Returns:
+            記事情報のリスト（入力URLと同じ順序）
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("非同期スクレイピングにはhttpxが必要です")
+        
+        urls_to_scrape = urls[:max_articles] if max_articles else urls
+        if not urls_to_scrape:
+            return []
+        
+        # 全体の同時接続数とドメインごとのロック・最終リクエスト時刻
+        semaphore = asyncio.Semaphore(concurrency)
+        domain_locks = {urlparse(url).netloc: asyncio.Lock() for url in urls_to_scrape}
+        last_request = {}
+        
+        async def scrape_politely(client, url: str) -> Dict[str, str]:
+            domain = urlparse(url).netloc
+            async with domain_locks[domain]:
+                # 同一ドメインへの前回リクエストからdelay秒経過するまで待機
+                if domain in last_request:
+                    wait = delay - (time.monotonic() - last_request[domain])
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                async with semaphore:
+                    try:
+                        return await self.scrape_article_async(client, url)
+                    finally:
+                        last_request[domain] = time.monotonic()
+        
+        # 接続プール・HTTP/2・リトライはトランスポートで設定（requests版のセッションと同等の再試行）
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=concurrency),
+            retries=2
+        )
+        async with httpx.AsyncClient(headers=self.headers, follow_redirects=True, transport=transport) as client:
+            results = await asyncio.gather(*(scrape_politely(client, url) for url in urls_to_scrape))
+        
+        # 成功した記事の数をログ出力
+        successful = sum(1 for r in results if r['success'])
+        logger.info(f"スクレイピング完了: {successful}/{len(results)} 件成功")
+        
+        return list(results)
 
 
 def scrape_news_articles(
@@ -227,19 +489,17 @@ def scrape_news_articles(
         max_articles=max_articles
     )
     
-    # 成功した記事のテキストを統合
-    combined_text_parts = []
-    
-    for article in articles:
-        if article['success'] and article['content']:
-            # ソース情報を含めて追加
-            text_part = f"--- 記事タイトル: {article['title']} ---\n"
-            text_part += f"ソース: {article['url']}\n\n"
-            text_part += article['content']
-            combined_text_parts.append(text_part)
+    # 成功した記事のテキストをソース情報付きで統合
+    combined_text_parts = [
+        f"--- 記事タイトル: {article['title']} ---\nソース: {to_safe_text(article['url'])}\n\n{article['content']}"
+        for article in articles
+        if article['success'] and article['content']
+    ]
     
-    # 全記事を結合
-    combined_text = "\n\n" + "="*50 + "\n\n".join(combined_text_parts)
+    # 全記事を区切り線で結合
+    separator = "\n\n" + "=" * 50 + "\n\n"
+    # タイトル・本文・URLは安全化済みで、区切りはASCIIのみのため結合結果も安全化済みとして扱う
+    combined_text = SafeText(separator.join(combined_text_parts))
     
     logger.info(f"統合テキスト生成完了: {len(combined_text)} 文字")
     
@@ -6,10 +6,70 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
+import functools
+import importlib.util
 import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# numbaは重いため、損益カーネルの初回使用時にインポートしてJITコンパイルする
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+# 通貨と為替レートシンボル（対JPY）の対応
+RATE_MAPPING = {
+    'USD': 'USDJPY=X',
+    'EUR': 'EURJPY=X',
+    'GBP': 'GBPJPY=X',
+    'AUD': 'AUDJPY=X',
+    'CAD': 'CADJPY=X',
+    'CHF': 'CHFJPY=X'
+}
+
+# 為替レートが取得できない場合の概算レート（対JPY）
+FALLBACK_RATES = {
+    'USD': 150.0,
+    'EUR': 160.0,
+    'GBP': 180.0,
+    'AUD': 100.0,
+    'CAD': 110.0,
+    'CHF': 165.0,
+    'HKD': 19.0,
+    'SGD': 110.0,
+    'CNY': 21.0,
+    'KRW': 0.11
+}
+
+# バリュエーション統計の計算精度（表示用の統計のためfloat32で十分、メモリ転送量を半減）
+VALUATION_PRECISION = np.float32
+
+# バリュエーション統計を指標ごとにスレッドで並行計算する最小銘柄数（小規模ではスレッドの起動コストが上回る）
+VALUATION_PARALLEL_MIN_POSITIONS = 5000
+
+# ティッカーサフィックスと地域の対応（本社所在国が不明な場合のフォールバック）
+TICKER_SUFFIX_REGION = {
+    'T': '日本', 'JP': '日本',
+    'AS': '欧州', 'PA': '欧州', 'DE': '欧州', 'MI': '欧州', 'L': '欧州', 'SW': '欧州',
+    'TO': '北米（その他）', 'V': '北米（その他）',
+    'AX': 'アジア太平洋', 'HK': 'アジア太平洋', 'SS': 'アジア太平洋', 'KS': 'アジア太平洋'
+}
+TICKER_SUFFIX_RE = re.compile(r'\.(' + '|'.join(TICKER_SUFFIX_REGION) + r')$')
+
+# ETF等の商品を示すティッカー内の文字列
+ETF_INDICATORS = ('ETF', 'FUND', 'GOLD', 'GLD', 'SLV', 'GLDM', 'EPI', 'INDEX', 'SPDR', 'ISHARES', 'VANGUARD')
+ETF_INDICATOR_RE = re.compile('|'.join(ETF_INDICATORS))
+
+# 明確にアメリカ企業と判断できる有名企業（サフィックスのないティッカーのうち米国に分類するもの）
+WELL_KNOWN_US_COMPANIES = frozenset([
+    'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'META', 'NVDA', 'JPM',
+    'JNJ', 'V', 'PG', 'UNH', 'HD', 'MA', 'DIS', 'BAC', 'ADBE', 'CRM',
+    'NFLX', 'KO', 'PEP', 'ORCL', 'CSCO', 'INTC', 'VZ', 'PFE', 'TMO',
+    'NKE', 'MRK', 'ABT', 'CVX', 'WMT', 'XOM', 'LLY', 'COST', 'SPGI',
+    'ZTS', 'CAT', 'MSTR', 'IONQ'
+])
+
 
 def calculate_pnl(
     ticker: str,
@@ -21,6 +81,9 @@ def calculate_pnl(
     """
     単一銘柄の損益計算（日本円ベース）
     
+    個別銘柄の表示用。ポートフォリオ全体の一括計算には calculate_portfolio_pnl を使用する
+    （同じ計算式を全銘柄まとめて実行するため、この関数は呼び出さない）
+    
     Args:
         ticker: ティッカーシンボル
         shares: 保有株数
@@ -60,7 +123,8 @@ def calculate_pnl(
             'pnl_percentage': pnl_percentage
         }
         
-        logger.debug(f"損益計算完了 {ticker}: {pnl_amount:,.0f}円 ({pnl_percentage:.2f}%)")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"損益計算完了 {ticker}: {pnl_amount:,.0f}円 ({pnl_percentage:.2f}%)")
         return result
         
     except Exception as e:
@@ -97,41 +161,113 @@ def calculate_portfolio_pnl(
     Returns:
         pd.DataFrame: 損益計算結果
     """
-    pnl_results = []
-    
-    for _, row in portfolio_df.iterrows():
-        ticker = row['Ticker']
-        shares = row['Shares']
-        avg_cost_jpy = row['AvgCostJPY']
-        
-        # 現在株価を取得
-        current_price_local = current_prices.get(ticker, 0)
-        
-        # 通貨と為替レートを取得
-        currency = currency_mapping.get(ticker, 'USD')
-        exchange_rate = get_exchange_rate_for_currency(currency, exchange_rates)
-        
-        # 損益計算
-        pnl_data = calculate_pnl(
-            ticker=ticker,
-            shares=shares,
-            avg_cost_jpy=avg_cost_jpy,
-            current_price_local=current_price_local,
-            exchange_rate=exchange_rate
+    ticker_series = portfolio_df['Ticker']
+    # 入力列は結果のDataFrameがportfolio_dfとメモリを共有しないようコピーして取得
+    tickers = ticker_series.to_numpy(copy=True)
+    shares = portfolio_df['Shares'].to_numpy(copy=True)
+    avg_cost_jpy = portfolio_df['AvgCostJPY'].to_numpy(copy=True)
+    
+    # 現在株価を取得（取得できない銘柄は0）
+    current_price_local = ticker_series.map(current_prices).astype(np.float64).fillna(0.0).to_numpy()
+    
+    # 通貨と為替レートを取得（レート表はポートフォリオ計算ごとに1回だけ作成）
+    rate_table = _build_currency_rate_table(exchange_rates)
+    currency_series = ticker_series.map(currency_mapping).fillna('USD')
+    currencies = currency_series.to_numpy()
+    exchange_rate = currency_series.map(rate_table).astype(np.float64).fillna(1.0).to_numpy()
+    
+    # 損益計算（全銘柄を一括で計算、calculate_pnlと同じ計算式）
+    pnl_kernel = _get_pnl_kernel()
+    if pnl_kernel is not None:
+        # numba: 全列の計算を1回のループに融合（中間配列を作らない）
+        n = len(tickers)
+        current_price_jpy = np.empty(n)
+        current_value_jpy = np.empty(n)
+        cost_basis_jpy = np.empty(n)
+        pnl_amount = np.empty(n)
+        pnl_percentage = np.empty(n)
+        pnl_kernel(
+            current_price_local, exchange_rate,
+            np.ascontiguousarray(shares, dtype=np.float64),
+            np.ascontiguousarray(avg_cost_jpy, dtype=np.float64),
+            current_price_jpy, current_value_jpy, cost_basis_jpy, pnl_amount, pnl_percentage
         )
-        
-        # 通貨情報を追加
-        pnl_data['currency'] = currency
-        
-        pnl_results.append(pnl_data)
+    else:
+        current_price_jpy = current_price_local * exchange_rate
+        current_value_jpy = current_price_jpy * shares
+        cost_basis_jpy = avg_cost_jpy * shares
+        pnl_amount = current_value_jpy - cost_basis_jpy
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pnl_percentage = np.where(cost_basis_jpy > 0, pnl_amount / cost_basis_jpy * 100, 0.0)
     
-    # DataFrameに変換
-    pnl_df = pd.DataFrame(pnl_results)
+    # DataFrameに変換（列配列から直接作成し、この関数内で作成した配列は再コピーしない）
+    pnl_df = pd.DataFrame({
+        'ticker': tickers,
+        'shares': shares,
+        'avg_cost_jpy': avg_cost_jpy,
+        'current_price_local': current_price_local,
+        'current_price_jpy': current_price_jpy,
+        'exchange_rate': exchange_rate,
+        'current_value_jpy': current_value_jpy,
+        'cost_basis_jpy': cost_basis_jpy,
+        'pnl_amount': pnl_amount,
+        'pnl_percentage': pnl_percentage,
+        'currency': pd.Categorical(currencies)
+    }, copy=False)
     
     logger.info(f"ポートフォリオ損益計算完了: {len(pnl_df)}銘柄")
     return pnl_df
 
 
+def _pnl_kernel(
+    prices: np.ndarray,
+    exchange_rates: np.ndarray,
+    shares: np.ndarray,
+    avg_costs: np.ndarray,
+    out_price_jpy: np.ndarray,
+    out_value: np.ndarray,
+    out_cost_basis: np.ndarray,
+    out_pnl: np.ndarray,
+    out_pnl_pct: np.ndarray
+) -> None:
+    """
+    損益計算カーネル（NumPy配列のみを扱うためnumbaでJITコンパイル可能）
+    
+    Args:
+        prices: 現在株価（現地通貨、float64）
+        exchange_rates: 為替レート（float64）
+        shares: 保有株数（float64）
+        avg_costs: 日本円ベース平均購入単価（float64）
+        out_price_jpy: 円換算株価の出力先
+        out_value: 現在評価額の出力先
+        out_cost_basis: 投資額（簿価）の出力先
+        out_pnl: 損益額の出力先
+        out_pnl_pct: 損益率の出力先
+    """
+    for i in range(prices.shape[0]):
+        price_jpy = prices[i] * exchange_rates[i]
+        value = price_jpy * shares[i]
+        cost_basis = avg_costs[i] * shares[i]
+        pnl = value - cost_basis
+        out_price_jpy[i] = price_jpy
+        out_value[i] = value
+        out_cost_basis[i] = cost_basis
+        out_pnl[i] = pnl
+        out_pnl_pct[i] = pnl / cost_basis * 100 if cost_basis > 0 else 0.0
+
+
+_pnl_kernel_compiled = None
+
+
+def _get_pnl_kernel():
+    """numbaが利用可能ならJITコンパイル済みの損益カーネルを返す（利用できない場合はNone）"""
+    global _pnl_kernel_compiled
+    if _pnl_kernel_compiled is None and NUMBA_AVAILABLE:
+        from numba import njit
+        _pnl_kernel_compiled = njit(cache=True)(_pnl_kernel)
+    return _pnl_kernel_compiled
+
+
 def get_exchange_rate_for_currency(currency: str, exchange_rates: Dict[str, float]) -> float:
     """
     通貨に対応する為替レートを取得
@@ -146,34 +282,26 @@ def get_exchange_rate_for_currency(currency: str, exchange_rates: Dict[str, floa
     if currency == 'JPY':
         return 1.0
     
-    rate_mapping = {
-        'USD': 'USDJPY=X',
-        'EUR': 'EURJPY=X',
-        'GBP': 'GBPJPY=X',
-        'AUD': 'AUDJPY=X',
-        'CAD': 'CADJPY=X',
-        'CHF': 'CHFJPY=X'
-    }
-    
-    rate_symbol = rate_mapping.get(currency)
+    rate_symbol = RATE_MAPPING.get(currency)
     if rate_symbol and rate_symbol in exchange_rates:
         return exchange_rates[rate_symbol]
     
     # フォールバック：概算レート
-    fallback_rates = {
-        'USD': 150.0,
-        'EUR': 160.0,
-        'GBP': 180.0,
-        'AUD': 100.0,
-        'CAD': 110.0,
-        'CHF': 165.0,
-        'HKD': 19.0,
-        'SGD': 110.0,
-        'CNY': 21.0,
-        'KRW': 0.11
-    }
+    return FALLBACK_RATES.get(currency, 1.0)
+
+
+def _build_currency_rate_table(exchange_rates: Dict[str, float]) -> Dict[str, float]:
+    """
+    既知の全通貨について通貨→為替レート（対JPY）の対応表を作成
     
-    return fallback_rates.get(currency, 1.0)
+    Args:
+        exchange_rates: 為替レート辞書
+    
+    Returns:
+        dict: 通貨コードと為替レートの対応（表にない通貨のレートは1.0として扱う）
+    """
+    currencies = {'JPY'} | RATE_MAPPING.keys() | FALLBACK_RATES.keys()
+    return {currency: get_exchange_rate_for_currency(currency, exchange_rates) for currency in currencies}
 
 
 def calculate_portfolio_summary(pnl_df: pd.DataFrame) -> Dict[str, float]:
@@ -187,26 +315,35 @@ def calculate_portfolio_summary(pnl_df: pd.DataFrame) -> Dict[str, float]:
         dict: ポートフォリオサマリー
     """
     try:
+        pnl_amounts = pnl_df['pnl_amount'].to_numpy(dtype=np.float64)
+        pnl_percentages = pnl_df['pnl_percentage'].to_numpy(dtype=np.float64)
+        
         total_cost_basis = pnl_df['cost_basis_jpy'].sum()
         total_current_value = pnl_df['current_value_jpy'].sum()
-        total_pnl_amount = pnl_df['pnl_amount'].sum()
+        total_pnl_amount = np.nansum(pnl_amounts)
         
         overall_pnl_percentage = (total_pnl_amount / total_cost_basis) * 100 if total_cost_basis > 0 else 0
         
         # 勝率計算
-        profitable_positions = (pnl_df['pnl_amount'] > 0).sum()
+        profitable_positions = int((pnl_amounts > 0).sum())
         total_positions = len(pnl_df)
         win_rate = (profitable_positions / total_positions) * 100 if total_positions > 0 else 0
         
-        # 最大・最小損益
-        max_gain = pnl_df['pnl_amount'].max()
-        max_loss = pnl_df['pnl_amount'].min()
-        max_gain_pct = pnl_df['pnl_percentage'].max()
-        max_loss_pct = pnl_df['pnl_percentage'].min()
-        
-        # 最大・最小損益銘柄
-        max_gain_ticker = pnl_df.loc[pnl_df['pnl_amount'].idxmax(), 'ticker'] if not pnl_df.empty else ''
-        max_loss_ticker = pnl_df.loc[pnl_df['pnl_amount'].idxmin(), 'ticker'] if not pnl_df.empty else ''
+        if total_positions > 0:
+            # 最大・最小損益（位置を求めて金額と銘柄を同時に取得）
+            max_idx = np.nanargmax(pnl_amounts)
+            min_idx = np.nanargmin(pnl_amounts)
+            max_gain = pnl_amounts[max_idx]
+            max_loss = pnl_amounts[min_idx]
+            max_gain_pct = np.nanmax(pnl_percentages)
+            max_loss_pct = np.nanmin(pnl_percentages)
+            
+            # 最大・最小損益銘柄
+            max_gain_ticker = pnl_df['ticker'].iat[max_idx]
+            max_loss_ticker = pnl_df['ticker'].iat[min_idx]
+        else:
+            max_gain = max_loss = max_gain_pct = max_loss_pct = np.nan
+            max_gain_ticker = max_loss_ticker = ''
         
         summary = {
             'total_positions': total_positions,
@@ -252,61 +389,45 @@ def calculate_sector_allocation_by_region(pnl_df: pd.DataFrame, ticker_countries
             
         from modules.country_fetcher import classify_region_by_country
         
-        # 地域分類関数
-        def get_region_for_ticker(ticker):
-            if ticker_countries and ticker in ticker_countries:
-                country = ticker_countries[ticker]
-                if country and country.strip():  # 空文字もチェック
-                    return classify_region_by_country(country)
-            
-            # フォールバック：ティッカーサフィックスベース
-            ticker_str = str(ticker)
-            if '.T' in ticker_str or '.JP' in ticker_str:
-                return '日本'
-            elif '.AS' in ticker_str or '.PA' in ticker_str or '.DE' in ticker_str or '.MI' in ticker_str or '.L' in ticker_str or '.SW' in ticker_str:
-                return '欧州'
-            elif '.TO' in ticker_str or '.V' in ticker_str:
-                return '北米（その他）'
-            elif '.AX' in ticker_str:
-                return 'アジア太平洋'
-            elif '.HK' in ticker_str or '.SS' in ticker_str or '.KS' in ticker_str:
-                return 'アジア太平洋'
-            else:
-                # ETFや不明確な商品の検出
-                ticker_upper = ticker.upper()
-                etf_indicators = ['ETF', 'FUND', 'GOLD', 'GLD', 'SLV', 'GLDM', 'EPI', 'INDEX', 'SPDR', 'ISHARES', 'VANGUARD']
-                is_likely_etf = any(indicator in ticker_upper for indicator in etf_indicators)
-                
-                if is_likely_etf:
-                    return 'その他'
-                else:
-                    # 明確にアメリカ企業と判断できる有名企業のみアメリカに分類
-                    well_known_us_companies = [
-                        'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'META', 'NVDA', 'JPM',
-                        'JNJ', 'V', 'PG', 'UNH', 'HD', 'MA', 'DIS', 'BAC', 'ADBE', 'CRM', 
-                        'NFLX', 'KO', 'PEP', 'ORCL', 'CSCO', 'INTC', 'VZ', 'PFE', 'TMO',
-                        'NKE', 'MRK', 'ABT', 'CVX', 'WMT', 'XOM', 'LLY', 'COST', 'SPGI', 
-                        'ZTS', 'CAT', 'MSTR', 'IONQ'
-                    ]
-                    
-                    if ticker_upper in well_known_us_companies:
-                        return '米国'
-                    else:
-                        return 'その他'
-        
-        # 地域分類を適用
-        pnl_df_copy = pnl_df.copy()
-        pnl_df_copy['country'] = pnl_df_copy['ticker'].apply(get_region_for_ticker)
-        
-        logger.info(f"地域分類結果: {pnl_df_copy['country'].value_counts().to_dict()}")
-        
-        # 地域別集計
-        sector_allocation = pnl_df_copy.groupby('country').agg({
-            'current_value_jpy': 'sum',
-            'cost_basis_jpy': 'sum',
-            'pnl_amount': 'sum',
-            'ticker': 'count'
-        }).rename(columns={'ticker': 'position_count'})
+        # 本社所在国が取得できている銘柄は国から地域を分類（同じ国の分類は1回だけ）
+        valid_countries = {
+            ticker: country for ticker, country in (ticker_countries or {}).items()
+            if isinstance(country, str) and country.strip()
+        }
+        region_by_country = {country: classify_region_by_country(country) for country in set(valid_countries.values())}
+        tickers = pnl_df['ticker'].astype(str)
+        country_region = tickers.map(valid_countries).map(region_by_country)
+        
+        # フォールバック：ティッカーサフィックスベース
+        suffix_region = tickers.str.extract(TICKER_SUFFIX_RE, expand=False).map(TICKER_SUFFIX_REGION)
+        
+        # サフィックスもない場合：ETFや不明確な商品を除き、有名な米国企業のみ米国に分類
+        tickers_upper = tickers.str.upper()
+        is_likely_etf = tickers_upper.str.contains(ETF_INDICATOR_RE)
+        is_well_known_us = tickers_upper.isin(WELL_KNOWN_US_COMPANIES)
+        default_region = pd.Series(np.where(is_well_known_us & ~is_likely_etf, '米国', 'その他'), index=pnl_df.index)
+        
+        # 地域分類（元のDataFrameはコピーせず、分類結果をカテゴリ型のgroupbyキーとして渡す）
+        region_series = country_region.fillna(suffix_region).fillna(default_region).astype('category').rename('country')
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"地域分類結果: {region_series.value_counts().to_dict()}")
+        
+        # 地域別集計（地域は数種類のみのため、groupbyを使わずコードごとにbincountで合計）
+        codes, regions = pd.factorize(region_series, sort=True)
+        n_regions = len(regions)
+        sector_allocation = pd.DataFrame(
+            {
+                column: np.bincount(
+                    codes,
+                    weights=np.nan_to_num(pnl_df[column].to_numpy(dtype=np.float64)),
+                    minlength=n_regions
+                )
+                for column in ('current_value_jpy', 'cost_basis_jpy', 'pnl_amount')
+            },
+            index=pd.CategoricalIndex(regions, name='country')
+        )
+        sector_allocation['position_count'] = np.bincount(codes, minlength=n_regions)
         
         if sector_allocation.empty:
             logger.warning("地域集計結果が空です")
@@ -321,11 +442,10 @@ def calculate_sector_allocation_by_region(pnl_df: pd.DataFrame, ticker_countries
         else:
             sector_allocation['allocation_percentage'] = 0
         
-        # 損益率を計算
-        sector_allocation['pnl_percentage'] = sector_allocation.apply(
-            lambda row: (row['pnl_amount'] / row['cost_basis_jpy'] * 100) if row['cost_basis_jpy'] > 0 else 0, 
-            axis=1
-        )
+        # 損益率を計算（簿価が0以下のグループは0）
+        cost = sector_allocation['cost_basis_jpy'].to_numpy()
+        pnl = sector_allocation['pnl_amount'].to_numpy()
+        sector_allocation['pnl_percentage'] = np.where(cost > 0, pnl / np.where(cost == 0, 1, cost) * 100, 0.0)
         
         result_df = sector_allocation.reset_index()
         logger.info(f"地域配分計算完了: {len(result_df)}地域")
@@ -365,14 +485,14 @@ def calculate_sector_allocation(pnl_df: pd.DataFrame, ticker_info: dict = None)
             else:
                 return "その他"
         
-        # セクター分類を適用
-        pnl_df_copy = pnl_df.copy()
-        pnl_df_copy['sector'] = pnl_df_copy['ticker'].apply(get_sector_for_ticker)
+        # セクター分類（元のDataFrameはコピーせず、分類結果をカテゴリ型のgroupbyキーとして渡す）
+        sector_series = pnl_df['ticker'].apply(get_sector_for_ticker).astype('category').rename('sector')
         
-        logger.info(f"セクター分類結果: {pnl_df_copy['sector'].value_counts().to_dict()}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"セクター分類結果: {sector_series.value_counts().to_dict()}")
         
         # セクター別集計
-        sector_allocation = pnl_df_copy.groupby('sector').agg({
+        sector_allocation = pnl_df.groupby(sector_series, observed=True).agg({
             'current_value_jpy': 'sum',
             'cost_basis_jpy': 'sum',
             'pnl_amount': 'sum',
@@ -392,11 +512,10 @@ def calculate_sector_allocation(pnl_df: pd.DataFrame, ticker_info: dict = None)
         else:
             sector_allocation['allocation_percentage'] = 0
         
-        # 損益率を計算
-        sector_allocation['pnl_percentage'] = sector_allocation.apply(
-            lambda row: (row['pnl_amount'] / row['cost_basis_jpy'] * 100) if row['cost_basis_jpy'] > 0 else 0, 
-            axis=1
-        )
+        # 損益率を計算（簿価が0以下のグループは0）
+        cost = sector_allocation['cost_basis_jpy'].to_numpy()
+        pnl = sector_allocation['pnl_amount'].to_numpy()
+        sector_allocation['pnl_percentage'] = np.where(cost > 0, pnl / np.where(cost == 0, 1, cost) * 100, 0.0)
         
         result_df = sector_allocation.reset_index()
         logger.info(f"セクター配分計算完了: {len(result_df)}セクター")
@@ -422,15 +541,20 @@ def calculate_performance_metrics(pnl_df: pd.DataFrame, risk_free_rate: float =
         if pnl_df.empty:
             return {}
         
-        # 重み（時価総額比率）を計算
-        total_value = pnl_df['current_value_jpy'].sum()
-        weights = pnl_df['current_value_jpy'] / total_value if total_value > 0 else np.ones(len(pnl_df)) / len(pnl_df)
+        # 欠損値は集計から除外（pandasの集計と同じ扱い）
+        values = np.nan_to_num(pnl_df['current_value_jpy'].to_numpy(dtype=np.float64))
+        pnl_pct = pnl_df['pnl_percentage'].to_numpy(dtype=np.float64)
         
-        # 重み付き平均リターン
-        weighted_return = (pnl_df['pnl_percentage'] * weights).sum()
+        # 重み付き平均リターン（時価総額比率で加重、重み配列は作らず内積で計算）
+        total_value = values.sum()
+        if total_value > 0:
+            weighted_return = float(np.nan_to_num(pnl_pct) @ values / total_value)
+        else:
+            # 評価額がない場合は等加重（均等重みの配列は作らず、スカラーの平均で計算）
+            weighted_return = float(np.nansum(pnl_pct) / pnl_pct.size)
         
         # 銘柄別リターンの標準偏差（簡易版）
-        returns_std = pnl_df['pnl_percentage'].std()
+        returns_std = np.nanstd(pnl_pct, ddof=1) if np.count_nonzero(~np.isnan(pnl_pct)) > 1 else np.nan
         
         # シャープレシオ（簡易計算）
         excess_return = weighted_return - risk_free_rate
@@ -473,17 +597,25 @@ def calculate_position_sizing_analysis(pnl_df: pd.DataFrame) -> Dict[str, any]:
         
         # 各ポジションの比率
         pnl_df['position_weight'] = pnl_df['current_value_jpy'] / total_value * 100
+        position_weights = pnl_df['position_weight'].to_numpy(dtype=np.float64)
+        valid_weights = position_weights[~np.isnan(position_weights)]
         
-        # 集中度分析
-        top_5_weight = pnl_df.nlargest(5, 'position_weight')['position_weight'].sum()
-        top_10_weight = pnl_df.nlargest(10, 'position_weight')['position_weight'].sum()
+        # 集中度分析（上位10銘柄だけを部分ソートで取り出し、上位5銘柄もそこから集計）
+        k = min(10, valid_weights.size)
+        top_weights = np.sort(np.partition(valid_weights, -k)[-k:])[::-1] if k > 0 else valid_weights
+        top_5_weight = top_weights[:5].sum()
+        top_10_weight = top_weights.sum()
         
         # ハーフィンダール指数（集中度指標）
-        hhi = (pnl_df['position_weight'] ** 2).sum()
+        hhi = (valid_weights ** 2).sum()
         
         # 等分散からの偏差
         equal_weight = 100 / len(pnl_df)
-        weight_variance = pnl_df['position_weight'].var()
+        weight_variance = valid_weights.var(ddof=1) if valid_weights.size > 1 else np.nan
+        
+        # 最大・最小ポジション
+        max_idx = np.nanargmax(position_weights)
+        min_idx = np.nanargmin(position_weights)
         
         analysis = {
             'total_positions': len(pnl_df),
@@ -492,10 +624,10 @@ def calculate_position_sizing_analysis(pnl_df: pd.DataFrame) -> Dict[str, any]:
             'herfindahl_index': hhi,
             'equal_weight_benchmark': equal_weight,
             'weight_variance': weight_variance,
-            'max_position_weight': pnl_df['position_weight'].max(),
-            'min_position_weight': pnl_df['position_weight'].min(),
-            'largest_position': pnl_df.loc[pnl_df['position_weight'].idxmax(), 'ticker'],
-            'smallest_position': pnl_df.loc[pnl_df['position_weight'].idxmin(), 'ticker']
+            'max_position_weight': position_weights[max_idx],
+            'min_position_weight': position_weights[min_idx],
+            'largest_position': pnl_df['ticker'].iat[max_idx],
+            'smallest_position': pnl_df['ticker'].iat[min_idx]
         }
         
         logger.info(f"ポジションサイジング分析完了: 上位5銘柄集中度 {top_5_weight:.1f}%")
@@ -506,10 +638,13 @@ def calculate_position_sizing_analysis(pnl_df: pd.DataFrame) -> Dict[str, any]:
         return {}
 
 
+@functools.lru_cache(maxsize=1)
 def get_etf_benchmark_data() -> Dict[str, Dict[str, Optional[float]]]:
     """
     ベンチマークETFのバリュエーション指標を取得
     
+    固定値のため初回呼び出し時に一度だけ作成し、以降は同じ辞書を返す（呼び出し側で変更しないこと）
+    
     Returns:
         Dict[str, Dict[str, Optional[float]]]: ETF別バリュエーション指標辞書
     """
@@ -595,6 +730,71 @@ def get_etf_benchmark_data() -> Dict[str, Dict[str, Optional[float]]]:
         return {}
 
 
+def _valuation_stats_for_metric(
+    label: str,
+    metric_values: np.ndarray,
+    portfolio_weights: np.ndarray,
+    etf_values: Dict[str, Optional[float]]
+) -> Dict[str, any]:
+    """
+    1つのバリュエーション指標についてポートフォリオ統計の行を作成
+    
+    Args:
+        label: 指標の日本語ラベル
+        metric_values: ポートフォリオの銘柄順に並んだ指標値（欠損はNaN）
+        portfolio_weights: 銘柄ごとの重み（時価評価額）
+        etf_values: ベンチマークETF名と指標値の辞書
+    
+    Returns:
+        dict: 統計結果の行（指標、ETF値、ポートフォリオ統計）
+    """
+    # 欠損値を除外
+    valid = ~np.isnan(metric_values)
+    metric_array = metric_values[valid]
+    weights_array = portfolio_weights[valid]
+    
+    result_row = {
+        '指標': label
+    }
+    # ETF列を指標の右に追加
+    result_row.update(etf_values)
+    
+    if metric_array.size == 0:
+        # データがない場合でもETFデータは表示
+        result_row.update({
+            '加重平均': None,
+            '中央値': None,
+            '25%タイル': None,
+            '75%タイル': None,
+            '最小値': None,
+            '最大値': None,
+            '有効銘柄数': 0
+        })
+        return result_row
+    
+    # 統計計算
+    # 加重平均
+    total_weight = weights_array.sum()
+    weighted_avg = float(np.sum(metric_array * weights_array) / total_weight) if total_weight > 0 else None
+    
+    # パーセンタイル（最小・最大を含めて1回の呼び出しで計算）
+    min_val, q25, median, q75, max_val = (
+        float(value) for value in np.quantile(metric_array, [0.0, 0.25, 0.5, 0.75, 1.0])
+    )
+    
+    # ポートフォリオ統計を追加
+    result_row.update({
+        '加重平均': weighted_avg,
+        '中央値': median,
+        '25%タイル': q25,
+        '75%タイル': q75,
+        '最小値': min_val,
+        '最大値': max_val,
+        '有効銘柄数': int(metric_array.size)
+    })
+    return result_row
+
+
 def calculate_portfolio_valuation_metrics(pnl_df: pd.DataFrame, ticker_complete_info: dict, include_etf_benchmarks: bool = True) -> pd.DataFrame:
     """
     ポートフォリオのバリュエーション指標統計を計算（ベンチマークETF比較含む）
@@ -636,80 +836,32 @@ def calculate_portfolio_valuation_metrics(pnl_df: pd.DataFrame, ticker_complete_
             'profitMargins': '純利益率'
         }
         
-        results = []
+        # 銘柄×指標の表を一度だけ作成し、ポートフォリオの銘柄順に揃える（情報のない銘柄はNaN）
+        info_df = pd.DataFrame.from_dict(
+            {
+                ticker: {metric: info.get(metric) for metric in valuation_keys}
+                for ticker, info in ticker_complete_info.items() if info
+            },
+            orient='index'
+        ).reindex(index=pnl_df['ticker'].to_numpy(), columns=valuation_keys)
+        
+        # 重み（時価評価額）
+        portfolio_weights = pnl_df['current_value_jpy'].to_numpy(dtype=VALUATION_PRECISION)
+        
+        # 指標ごとの統計は互いに独立のため、大規模ポートフォリオではスレッドで並行計算
+        def metric_stats(metric: str) -> Dict[str, any]:
+            return _valuation_stats_for_metric(
+                japanese_labels[metric],
+                info_df[metric].to_numpy(dtype=VALUATION_PRECISION),
+                portfolio_weights,
+                {etf_name: etf_data.get(metric) for etf_name, etf_data in etf_benchmark_data.items()}
+            )
         
-        for metric in valuation_keys:
-            # 各銘柄のバリュエーション指標と重みを取得
-            metric_data = []
-            weights = []
-            
-            for _, row in pnl_df.iterrows():
-                ticker = row['ticker']
-                portfolio_weight = row['current_value_jpy']
-                
-                if ticker in ticker_complete_info:
-                    metric_value = ticker_complete_info[ticker].get(metric)
-                    if metric_value is not None and pd.notna(metric_value):
-                        metric_data.append(metric_value)
-                        weights.append(portfolio_weight)
-            
-            # ベンチマークETFデータを取得（該当する指標のみ）
-            etf_values = {}
-            for etf_name, etf_data in etf_benchmark_data.items():
-                etf_values[etf_name] = etf_data.get(metric)
-            
-            if not metric_data:
-                # データがない場合でもETFデータは表示
-                result_row = {
-                    '指標': japanese_labels[metric]
-                }
-                # ETF列を指標の右に追加
-                result_row.update(etf_values)
-                # ポートフォリオ統計を追加
-                result_row.update({
-                    '加重平均': None,
-                    '中央値': None,
-                    '25%タイル': None,
-                    '75%タイル': None,
-                    '最小値': None,
-                    '最大値': None,
-                    '有効銘柄数': 0
-                })
-                results.append(result_row)
-                continue
-            
-            # numpy配列に変換
-            metric_array = np.array(metric_data)
-            weights_array = np.array(weights)
-            
-            # 統計計算
-            # 加重平均
-            total_weight = weights_array.sum()
-            weighted_avg = np.sum(metric_array * weights_array) / total_weight if total_weight > 0 else None
-            
-            # パーセンタイル
-            q25 = np.percentile(metric_array, 25)
-            median = np.percentile(metric_array, 50)
-            q75 = np.percentile(metric_array, 75)
-            min_val = np.min(metric_array)
-            max_val = np.max(metric_array)
-            
-            result_row = {
-                '指標': japanese_labels[metric]
-            }
-            # ETF列を指標の右に追加
-            result_row.update(etf_values)
-            # ポートフォリオ統計を追加
-            result_row.update({
-                '加重平均': weighted_avg,
-                '中央値': median,
-                '25%タイル': q25,
-                '75%タイル': q75,
-                '最小値': min_val,
-                '最大値': max_val,
-                '有効銘柄数': len(metric_data)
-            })
-            results.append(result_row)
+        if len(pnl_df) >= VALUATION_PARALLEL_MIN_POSITIONS:
+            with ThreadPoolExecutor(max_workers=min(len(valuation_keys), os.cpu_count() or 1)) as executor:
+                results = list(executor.map(metric_stats, valuation_keys))
+        else:
+            results = [metric_stats(metric) for metric in valuation_keys]
         
         result_df = pd.DataFrame(results)
         logger.info(f"バリュエーション統計計算完了: {len(result_df)}指標")
@@ -7,20 +7,154 @@ import yfinance as yf
 import pandas as pd
 import numpy as np
 import streamlit as st
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple, Union
 import logging
 import time
+import asyncio
+import atexit
+import functools
+import importlib.util
+import shelve
+import threading
+from datetime import date, datetime
+from pathlib import Path
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import quote
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from utils.disk_cache import cache_file_path, load_pickle_cache, save_pickle_cache
+
+try:
+    from curl_cffi import requests as curl_requests
+    CURL_CFFI_AVAILABLE = True
+except ImportError:
+    CURL_CFFI_AVAILABLE = False
+
+try:
+    from yfinance.data import YfData
+    YFDATA_AVAILABLE = True
+except ImportError:
+    YFDATA_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# HTTP/2はh2パッケージがある場合のみ有効化
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
 logger = logging.getLogger(__name__)
 
+# 共有セッションのコネクションプールサイズ（ワーカースレッド数より大きく取る）
+YF_SESSION_POOL_SIZE = 20
+
+# 複数銘柄の現在値を1リクエストで返すYahoo Financeのクォートエンドポイント
+YAHOO_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+
+# クォートエンドポイント1リクエストあたりの銘柄数（URL長の制限）
+QUOTE_BATCH_SIZE = 200
+
+# 非同期取得で使用するYahoo Financeのチャートエンドポイント（crumb不要）
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+YAHOO_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
+}
+
+# 非同期取得の同時接続数
+ASYNC_FETCH_CONCURRENCY = 50
+
 
-def get_current_prices(tickers: List[str]) -> Dict[str, float]:
+def _create_yf_session():
+    """
+    yfinance呼び出しで共有するHTTPセッションを生成
+    
+    Returns:
+        Session: curl_cffiが利用可能な場合はそのSession、それ以外はrequests.Session
+    """
+    if CURL_CFFI_AVAILABLE:
+        # yfinanceの既定バックエンドと同じブラウザ偽装セッション
+        return curl_requests.Session(impersonate="chrome")
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=YF_SESSION_POOL_SIZE, pool_maxsize=YF_SESSION_POOL_SIZE)
+    session.mount('https://', adapter)
+    return session
+
+
+# 全yfinance呼び出しで共有し、Keep-Aliveで接続とCookie/crumbを再利用する
+_SESSION = _create_yf_session()
+
+# ティッカーサフィックスと上場通貨の対応（該当なしは米国株としてUSD）
+TICKER_SUFFIX_CURRENCY = {
+    # 日本
+    'T': 'JPY', 'JP': 'JPY', 'OS': 'JPY',
+    # 欧州（オランダ・フランス・ドイツ・イタリア・スペイン）
+    'AS': 'EUR', 'PA': 'EUR', 'DE': 'EUR', 'MI': 'EUR', 'MC': 'EUR',
+    # 英国
+    'L': 'GBP', 'LON': 'GBP',
+    # カナダ
+    'TO': 'CAD', 'V': 'CAD',
+    # オーストラリア
+    'AX': 'AUD',
+    # 香港
+    'HK': 'HKD',
+    # 中国
+    'SS': 'CNY', 'SZ': 'CNY',
+    # 韓国
+    'KS': 'KRW',
+    # シンガポール
+    'SI': 'SGD'
+}
+
+# 過去の終値データの保持精度（株価は有効桁数6〜7桁で十分なためfloat32）
+HISTORICAL_PRICE_PRECISION = np.float32
+
+# 為替レートペアのマッピング
+RATE_MAPPING = {
+    'USD': 'USDJPY=X',
+    'EUR': 'EURJPY=X',
+    'GBP': 'GBPJPY=X',
+    'AUD': 'AUDJPY=X',
+    'CAD': 'CADJPY=X',
+    'CHF': 'CHFJPY=X'
+}
+
+# 為替レートが取得できない場合の概算レート
+FALLBACK_RATES = {
+    'USD': 150.0,
+    'EUR': 160.0,
+    'GBP': 180.0,
+    'AUD': 100.0,
+    'CAD': 110.0,
+    'CHF': 165.0,
+    'HKD': 19.0,
+    'SGD': 110.0
+}
+
+# Streamlitのメモリキャッシュの下に置く永続キャッシュ（再起動後も当日分を再利用）
+PRICE_CACHE_DIR = Path("data_cache") / "prices"
+
+# 企業名の永続キャッシュ（企業名はほぼ変わらないため30日間再利用）
+COMPANY_NAME_DB_PATH = PRICE_CACHE_DIR / "company_names"
+COMPANY_NAME_CACHE_TTL = 30 * 86400
+_company_name_db_lock = threading.Lock()
+_company_name_db = None  # 初回アクセス時に一度だけ開くshelveハンドル
+
+# バックグラウンド更新中のキャッシュキー（同一キーの多重更新を防ぐ）
+_refreshing_keys = set()
+_refreshing_lock = threading.Lock()
+
+
+def get_current_prices(tickers: List[str], notify: bool = True) -> Dict[str, float]:
     """
     複数銘柄の現在株価を一括取得
     
     Args:
         tickers: ティッカーシンボルのリスト
+        notify: 取得失敗を画面に表示するか（バックグラウンド更新ではFalseとしログのみ出力）
     
     Returns:
         Dict[str, float]: ティッカーをキーとした現在株価の辞書
@@ -29,62 +163,291 @@ def get_current_prices(tickers: List[str]) -> Dict[str, float]:
     failed_tickers = []
     
     try:
-        # 並列処理で株価を取得
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_ticker = {
-                executor.submit(get_single_price, ticker): ticker 
-                for ticker in tickers
-            }
-            
-            for future in as_completed(future_to_ticker):
-                ticker = future_to_ticker[future]
+        # クォートエンドポイントで一括取得（最大QUOTE_BATCH_SIZE銘柄を1リクエストで取得）
+        if tickers:
+            if YFDATA_AVAILABLE:
                 try:
-                    price = future.result()
-                    if price is not None:
-                        prices[ticker] = price
-                    else:
-                        failed_tickers.append(ticker)
+                    prices.update(_fetch_quote_prices(tickers))
                 except Exception as e:
-                    logger.error(f"株価取得エラー {ticker}: {str(e)}")
-                    failed_tickers.append(ticker)
+                    logger.warning(f"クォート一括取得エラー: {str(e)}")
+                    prices.update(_download_latest_prices(tickers))
+            else:
+                prices.update(_download_latest_prices(tickers))
+        
+        # 一括取得で欠けた銘柄のみ個別取得でフォールバック
+        missing_tickers = [ticker for ticker in tickers if ticker not in prices]
+        
+        # 欠けた銘柄はイベントループ上でまとめて非同期取得（スレッドを生成しない）
+        if missing_tickers and _can_run_async():
+            prices.update(asyncio.run(fetch_latest_prices_async(missing_tickers)))
+            missing_tickers = [ticker for ticker in missing_tickers if ticker not in prices]
+        
+        if missing_tickers:
+            logger.info(f"個別取得にフォールバック: {len(missing_tickers)}銘柄")
+            
+            # Tickersを一度だけ生成し、各ハンドルのfast_infoをスレッド間で共有
+            handles = yf.Tickers(" ".join(missing_tickers), session=_SESSION).tickers
+            
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                future_to_ticker = {
+                    executor.submit(get_single_price, ticker, handles.get(ticker.upper())): ticker 
+                    for ticker in missing_tickers
+                }
+                
+                for future in as_completed(future_to_ticker):
+                    ticker = future_to_ticker[future]
+                    try:
+                        price = future.result()
+                        if price is not None:
+                            prices[ticker] = price
+                        else:
+                            failed_tickers.append(ticker)
+                    except Exception as e:
+                        logger.error(f"株価取得エラー {ticker}: {str(e)}")
+                        failed_tickers.append(ticker)
         
         if failed_tickers:
-            st.warning(f"以下の銘柄の株価取得に失敗しました: {failed_tickers}")
+            if notify:
+                st.warning(f"以下の銘柄の株価取得に失敗しました: {failed_tickers}")
+            else:
+                logger.warning(f"以下の銘柄の株価取得に失敗しました: {failed_tickers}")
         
         logger.info(f"株価取得完了: {len(prices)}/{len(tickers)}銘柄")
         return prices
         
     except Exception as e:
         logger.error(f"株価一括取得エラー: {str(e)}")
-        st.error(f"株価取得中にエラーが発生しました: {str(e)}")
+        if notify:
+            st.error(f"株価取得中にエラーが発生しました: {str(e)}")
+        return {}
+
+
+def _fetch_quote_prices(tickers: List[str]) -> Dict[str, float]:
+    """
+    クォートエンドポイントから複数銘柄の現在株価を一括取得
+    
+    cookie・crumbの取得はyfinanceのYfDataに任せ、共有セッション上でリクエストする。
+    
+    Args:
+        tickers: ティッカーシンボルのリスト
+    
+    Returns:
+        Dict[str, float]: 取得できた銘柄をキーとした現在株価の辞書
+    """
+    yf_data = YfData(session=_SESSION)
+    chunks = [tickers[i:i + QUOTE_BATCH_SIZE] for i in range(0, len(tickers), QUOTE_BATCH_SIZE)]
+    
+    def fetch_chunk(chunk: List[str]) -> List[dict]:
+        data = yf_data.get_raw_json(YAHOO_QUOTE_URL, params={'symbols': ','.join(chunk)})
+        return data['quoteResponse']['result'] or []
+    
+    # URL長の制限のため分割したチャンクのみ並列化
+    if len(chunks) == 1:
+        chunk_results = [fetch_chunk(chunks[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(chunks), 4)) as executor:
+            chunk_results = list(executor.map(fetch_chunk, chunks))
+    
+    # レスポンスのシンボルは大文字のため、要求したティッカー表記に戻す
+    requested = {ticker.upper(): ticker for ticker in tickers}
+    
+    prices = {}
+    for quotes in chunk_results:
+        for quote_data in quotes:
+            ticker = requested.get(str(quote_data.get('symbol', '')).upper())
+            price = quote_data.get('regularMarketPrice')
+            if ticker is None or price is None or pd.isna(price) or price <= 0:
+                continue
+            prices[ticker] = float(price)
+    
+    logger.info(f"クォート一括取得完了: {len(prices)}/{len(tickers)}銘柄")
+    return prices
+
+
+def _download_latest_prices(tickers: List[str]) -> Dict[str, float]:
+    """
+    yf.downloadで複数銘柄の最新終値を一括取得（クォートエンドポイントが使えない場合用）
+    
+    Args:
+        tickers: ティッカーシンボルのリスト
+    
+    Returns:
+        Dict[str, float]: 取得できた銘柄をキーとした最新終値の辞書
+    """
+    prices = {}
+    
+    try:
+        data = yf.download(
+            tickers,
+            period="2d",
+            interval="1d",
+            group_by='ticker',
+            threads=True,
+            progress=False,
+            auto_adjust=False,
+            session=_SESSION
+        )
+        
+        if not data.empty:
+            for ticker in tickers:
+                price = _extract_latest_close(data, ticker, len(tickers) == 1)
+                if price is not None:
+                    prices[ticker] = price
+                    
+    except Exception as e:
+        logger.warning(f"株価一括ダウンロードエラー: {str(e)}")
+    
+    return prices
+
+
+def _extract_latest_close(data: pd.DataFrame, ticker: str, single: bool) -> Optional[float]:
+    """
+    yf.downloadの結果から指定銘柄の最新終値を抽出
+    
+    Args:
+        data: yf.download(group_by='ticker')の結果
+        ticker: ティッカーシンボル
+        single: 単一銘柄でのダウンロードかどうか
+    
+    Returns:
+        float: 最新終値、取得できない場合はNone
+    """
+    if (ticker, 'Close') in data.columns:
+        close = data[(ticker, 'Close')]
+    elif single and 'Close' in data.columns:
+        # 単一銘柄でカラムがMultiIndexにならないバージョン向け
+        close = data['Close']
+    else:
+        return None
+    
+    close = close.dropna()
+    if close.empty:
+        return None
+    
+    latest_price = close.iloc[-1]
+    if latest_price <= 0:
+        return None
+    
+    return float(latest_price)
+
+
+def _can_run_async() -> bool:
+    """
+    asyncio.runで非同期取得できるかを判定（httpxがあり、実行中のイベントループがない場合のみ）
+    
+    Returns:
+        bool: 非同期取得が可能かどうか
+    """
+    if not HTTPX_AVAILABLE:
+        return False
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return True
+    return False
+
+
+async def _fetch_chart_price_async(client, semaphore: asyncio.Semaphore, symbol: str) -> Optional[float]:
+    """
+    チャートエンドポイントから単一シンボルの最新価格を非同期で取得
+    
+    Args:
+        client: httpx.AsyncClient
+        semaphore: 同時接続数を制限するセマフォ
+        symbol: ティッカーシンボルまたは通貨ペアシンボル
+    
+    Returns:
+        float: 最新価格、取得失敗時はNone
+    """
+    async with semaphore:
+        try:
+            response = await client.get(
+                YAHOO_CHART_URL.format(symbol=quote(symbol, safe='')),
+                params={'range': '1d', 'interval': '1d'}
+            )
+            response.raise_for_status()
+            meta = response.json()['chart']['result'][0]['meta']
+        except Exception as e:
+            logger.warning(f"非同期価格取得エラー {symbol}: {str(e)}")
+            return None
+    
+    price = meta.get('regularMarketPrice')
+    if price is None or pd.isna(price) or price <= 0:
+        return None
+    
+    return float(price)
+
+
+async def fetch_latest_prices_async(
+    symbols: List[str],
+    concurrency: int = ASYNC_FETCH_CONCURRENCY
+) -> Dict[str, float]:
+    """
+    複数シンボルの最新価格をイベントループ上で並行して取得
+    
+    Args:
+        symbols: ティッカーシンボルまたは通貨ペアシンボルのリスト
+        concurrency: 同時接続数
+    
+    Returns:
+        Dict[str, float]: 取得できたシンボルをキーとした最新価格の辞書
+    """
+    if not HTTPX_AVAILABLE:
+        raise ImportError("非同期取得にはhttpxが必要です")
+    
+    if not symbols:
         return {}
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    # 接続プール・HTTP/2・リトライはトランスポートで設定
+    transport = httpx.AsyncHTTPTransport(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=concurrency),
+        retries=2
+    )
+    async with httpx.AsyncClient(
+        headers=YAHOO_REQUEST_HEADERS, timeout=10, follow_redirects=True, transport=transport
+    ) as client:
+        results = await asyncio.gather(*(_fetch_chart_price_async(client, semaphore, symbol) for symbol in symbols))
+    
+    prices = {symbol: price for symbol, price in zip(symbols, results) if price is not None}
+    logger.info(f"非同期価格取得完了: {len(prices)}/{len(symbols)}件")
+    return prices
 
 
-def get_single_price(ticker: str) -> Optional[float]:
+def get_single_price(ticker: str, stock: Optional[yf.Ticker] = None) -> Optional[float]:
     """
     単一銘柄の現在株価を取得
     
     Args:
         ticker: ティッカーシンボル
+        stock: 生成済みのTickerハンドル（yf.Tickersから渡す場合）
     
     Returns:
         float: 現在株価、取得失敗時はNone
     """
     try:
-        stock = yf.Ticker(ticker)
+        if stock is None:
+            stock = yf.Ticker(ticker, session=_SESSION)
         
-        # 最新の株価データを取得（1日分）
-        data = stock.history(period="1d", interval="1m")
+        # 軽量なクォート情報から最新株価を取得
+        latest_price = None
+        try:
+            latest_price = stock.fast_info.get('last_price')
+        except Exception as e:
+            logger.debug(f"fast_info取得エラー {ticker}: {str(e)}")
         
-        if data.empty:
-            # 分足データが取得できない場合は日足で試行
+        if latest_price is None or pd.isna(latest_price):
+            # クォート情報が取得できない場合は日足で試行
             data = stock.history(period="2d")
             if data.empty:
                 logger.warning(f"株価データが取得できません: {ticker}")
                 return None
-        
-        # 最新の終値を取得
-        latest_price = data['Close'].iloc[-1]
+            
+            # 最新の終値を取得
+            latest_price = data['Close'].iloc[-1]
         
         if pd.isna(latest_price) or latest_price <= 0:
             logger.warning(f"無効な株価データ: {ticker} = {latest_price}")
@@ -116,23 +479,49 @@ def get_exchange_rates() -> Dict[str, float]:
     rates = {}
     
     try:
-        for pair_symbol, pair_name in currency_pairs.items():
-            try:
-                ticker = yf.Ticker(pair_symbol)
-                data = ticker.history(period="1d")
+        pair_symbols = list(currency_pairs)
+        
+        # 全通貨ペアをyf.downloadで一括取得
+        try:
+            data = yf.download(
+                pair_symbols,
+                period="1d",
+                group_by='ticker',
+                threads=True,
+                progress=False,
+                auto_adjust=False,
+                session=_SESSION
+            )
+            
+            if not data.empty:
+                for pair_symbol in pair_symbols:
+                    rate = _extract_latest_close(data, pair_symbol, len(pair_symbols) == 1)
+                    if rate is not None:
+                        rates[pair_symbol] = rate
+                        logger.debug(f"為替レート取得成功: {currency_pairs[pair_symbol]} = {rate}")
+                        
+        except Exception as e:
+            logger.warning(f"為替レート一括ダウンロードエラー: {str(e)}")
+        
+        # 一括取得で欠けた通貨ペアのみ並列で個別取得
+        missing_pairs = [pair_symbol for pair_symbol in pair_symbols if pair_symbol not in rates]
+        
+        if missing_pairs and _can_run_async():
+            rates.update(asyncio.run(fetch_latest_prices_async(missing_pairs)))
+            missing_pairs = [pair_symbol for pair_symbol in missing_pairs if pair_symbol not in rates]
+        
+        if missing_pairs:
+            with ThreadPoolExecutor(max_workers=len(missing_pairs)) as executor:
+                future_to_pair = {
+                    executor.submit(_fetch_exchange_rate, pair_symbol, currency_pairs[pair_symbol]): pair_symbol
+                    for pair_symbol in missing_pairs
+                }
                 
-                if not data.empty:
-                    rate = data['Close'].iloc[-1]
-                    if not pd.isna(rate) and rate > 0:
-                        rates[pair_symbol] = float(rate)
-                        logger.debug(f"為替レート取得成功: {pair_name} = {rate}")
-                    else:
-                        logger.warning(f"無効な為替レートデータ: {pair_name}")
-                else:
-                    logger.warning(f"為替レートデータが取得できません: {pair_name}")
-                    
-            except Exception as e:
-                logger.error(f"為替レート取得エラー {pair_name}: {str(e)}")
+                for future in as_completed(future_to_pair):
+                    pair_symbol = future_to_pair[future]
+                    rate = future.result()
+                    if rate is not None:
+                        rates[pair_symbol] = rate
         
         logger.info(f"為替レート取得完了: {len(rates)}ペア")
         return rates
@@ -142,6 +531,39 @@ def get_exchange_rates() -> Dict[str, float]:
         return {}
 
 
+def _fetch_exchange_rate(pair_symbol: str, pair_name: str) -> Optional[float]:
+    """
+    単一通貨ペアの為替レートを取得
+    
+    Args:
+        pair_symbol: 通貨ペアのシンボル（例: USDJPY=X）
+        pair_name: ログ表示用の通貨ペア名
+    
+    Returns:
+        float: 為替レート、取得失敗時はNone
+    """
+    try:
+        ticker = yf.Ticker(pair_symbol, session=_SESSION)
+        data = ticker.history(period="1d")
+        
+        if data.empty:
+            logger.warning(f"為替レートデータが取得できません: {pair_name}")
+            return None
+        
+        rate = data['Close'].iloc[-1]
+        if pd.isna(rate) or rate <= 0:
+            logger.warning(f"無効な為替レートデータ: {pair_name}")
+            return None
+        
+        logger.debug(f"為替レート取得成功: {pair_name} = {rate}")
+        return float(rate)
+        
+    except Exception as e:
+        logger.error(f"為替レート取得エラー {pair_name}: {str(e)}")
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
 def determine_currency_from_ticker(ticker: str) -> str:
     """
     ティッカーシンボルから上場通貨を判定
@@ -152,51 +574,44 @@ def determine_currency_from_ticker(ticker: str) -> str:
     Returns:
         str: 通貨コード（USD, JPY, EUR等）
     """
-    ticker = ticker.upper().strip()
-    
-    # 日本株の判定
-    if any(suffix in ticker for suffix in ['.T', '.JP', '.OS']):
-        return 'JPY'
-    
-    # 欧州株の判定
-    if any(suffix in ticker for suffix in ['.AS', '.PA', '.DE', '.MI', '.MC']):
-        if '.AS' in ticker:  # オランダ
-            return 'EUR'
-        elif '.PA' in ticker:  # フランス
-            return 'EUR'
-        elif '.DE' in ticker:  # ドイツ
-            return 'EUR'
-        elif '.MI' in ticker:  # イタリア
-            return 'EUR'
-        elif '.MC' in ticker:  # スペイン
-            return 'EUR'
-    
-    # 英国株の判定
-    if '.L' in ticker or '.LON' in ticker:
-        return 'GBP'
-    
-    # カナダ株の判定
-    if any(suffix in ticker for suffix in ['.TO', '.V']):
-        return 'CAD'
-    
-    # オーストラリア株の判定
-    if '.AX' in ticker:
-        return 'AUD'
-    
-    # 香港株の判定
-    if '.HK' in ticker:
-        return 'HKD'
-    
-    # その他のアジア株
-    if any(suffix in ticker for suffix in ['.SS', '.SZ']):  # 中国
-        return 'CNY'
-    elif '.KS' in ticker:  # 韓国
-        return 'KRW'
-    elif '.SI' in ticker:  # シンガポール
-        return 'SGD'
-    
-    # デフォルトは米国株（USD）
-    return 'USD'
+    parts = ticker.upper().strip().rsplit('.', 1)
+    
+    # サフィックスがない場合は米国株（USD）
+    if len(parts) != 2:
+        return 'USD'
+    
+    return TICKER_SUFFIX_CURRENCY.get(parts[1], 'USD')
+
+
+def _get_jpy_rate(currency: str, exchange_rates: Dict[str, float]) -> float:
+    """
+    通貨の対円レートを取得（為替レートがない場合は概算レートにフォールバック）
+    
+    Args:
+        currency: 通貨コード
+        exchange_rates: 為替レート辞書
+    
+    Returns:
+        float: 1通貨単位あたりの円換算レート（不明な通貨は1.0）
+    """
+    if currency == 'JPY':
+        return 1.0
+    
+    rate_symbol = RATE_MAPPING.get(currency)
+    
+    if rate_symbol and rate_symbol in exchange_rates:
+        return exchange_rates[rate_symbol]
+    
+    logger.warning(f"為替レートが見つかりません: {currency}")
+    
+    # フォールバック：概算レートを使用
+    if currency in FALLBACK_RATES:
+        rate = FALLBACK_RATES[currency]
+        st.warning(f"概算レートを使用: {currency} = {rate} JPY")
+        return rate
+    
+    st.error(f"通貨 {currency} の換算レートが不明です")
+    return 1.0  # 換算しない
 
 
 def convert_to_jpy(price: float, currency: str, exchange_rates: Dict[str, float]) -> float:
@@ -214,45 +629,26 @@ def convert_to_jpy(price: float, currency: str, exchange_rates: Dict[str, float]
     if currency == 'JPY':
         return price
     
-    # 為替レートペアのマッピング
-    rate_mapping = {
-        'USD': 'USDJPY=X',
-        'EUR': 'EURJPY=X',
-        'GBP': 'GBPJPY=X',
-        'AUD': 'AUDJPY=X',
-        'CAD': 'CADJPY=X',
-        'CHF': 'CHFJPY=X'
-    }
+    return price * _get_jpy_rate(currency, exchange_rates)
+
+
+def convert_to_jpy_vec(prices: pd.Series, currencies: pd.Series, exchange_rates: Dict[str, float]) -> np.ndarray:
+    """
+    現地通貨価格を一括で日本円に換算（ベクトル化版）
     
-    rate_symbol = rate_mapping.get(currency)
+    Args:
+        prices: 現地通貨での価格
+        currencies: pricesと同じ並びの通貨コード
+        exchange_rates: 為替レート辞書
     
-    if rate_symbol and rate_symbol in exchange_rates:
-        rate = exchange_rates[rate_symbol]
-        jpy_price = price * rate
-        logger.debug(f"通貨換算: {price} {currency} × {rate} = {jpy_price} JPY")
-        return jpy_price
-    else:
-        logger.warning(f"為替レートが見つかりません: {currency}")
-        # フォールバック：概算レートを使用
-        fallback_rates = {
-            'USD': 150.0,  # 概算レート
-            'EUR': 160.0,
-            'GBP': 180.0,
-            'AUD': 100.0,
-            'CAD': 110.0,
-            'CHF': 165.0,
-            'HKD': 19.0,
-            'SGD': 110.0
-        }
-        
-        if currency in fallback_rates:
-            rate = fallback_rates[currency]
-            jpy_price = price * rate
-            st.warning(f"概算レートを使用: {currency} = {rate} JPY")
-            return jpy_price
-        else:
-            st.error(f"通貨 {currency} の換算レートが不明です")
-            return price  # 換算せずに返す
+    Returns:
+        np.ndarray: 日本円換算価格
+    """
+    # 通貨ごとにレートを1回だけ解決してから一括で乗算
+    rate_table = {currency: _get_jpy_rate(currency, exchange_rates) for currency in pd.unique(currencies)}
+    rate_series = currencies.map(rate_table)
+    
+    return prices.to_numpy(dtype=np.float64) * rate_series.to_numpy(dtype=np.float64)
 
 
 def get_stock_chart_data(ticker: str, period: str = "1mo") -> pd.DataFrame:
@@ -267,7 +663,7 @@ def get_stock_chart_data(ticker: str, period: str = "1mo") -> pd.DataFrame:
         pd.DataFrame: OHLCV データ
     """
     try:
-        stock = yf.Ticker(ticker)
+        stock = yf.Ticker(ticker, session=_SESSION)
         data = stock.history(period=period, interval="1d")
         
         if data.empty:
@@ -295,6 +691,12 @@ def get_historical_data(tickers: List[str], period: str = "5y") -> pd.DataFrame:
     Returns:
         pd.DataFrame: 各銘柄の調整後終値データ
     """
+    # 当日中は同じ銘柄・期間の再ダウンロードを避ける
+    cache_path = _disk_cache_path('historical', (*sorted(set(tickers)), period))
+    cached = _load_disk_cache(cache_path)
+    if cached is not None:
+        return cached[[ticker for ticker in dict.fromkeys(tickers) if ticker in cached.columns]]
+    
     try:
         with st.spinner(f"過去データを取得中... (期間: {period})"):
             # yfinanceで一括ダウンロード
@@ -305,36 +707,38 @@ def get_historical_data(tickers: List[str], period: str = "5y") -> pd.DataFrame:
                 group_by='ticker',
                 auto_adjust=True,
                 prepost=True,
-                threads=True
+                threads=True,
+                session=_SESSION
             )
             
             if data.empty:
                 logger.warning("過去データが取得できませんでした")
                 return pd.DataFrame()
             
-            # 単一銘柄の場合の処理
-            if len(tickers) == 1:
-                if 'Close' in data.columns:
-                    result = pd.DataFrame({tickers[0]: data['Close']})
-                else:
-                    logger.warning(f"終値データが見つかりません: {tickers[0]}")
-                    return pd.DataFrame()
-            else:
-                # 複数銘柄の場合、Closeカラムのみ抽出
-                result = pd.DataFrame()
-                for ticker in tickers:
-                    try:
-                        if (ticker, 'Close') in data.columns:
-                            result[ticker] = data[(ticker, 'Close')]
-                        elif ticker in data.columns and 'Close' in data[ticker].columns:
-                            result[ticker] = data[ticker]['Close']
-                    except Exception as e:
-                        logger.warning(f"データ抽出エラー {ticker}: {str(e)}")
+            # 各銘柄の終値カラムを特定（取得できなかった銘柄は含めない）
+            close_columns = {}
+            for ticker in tickers:
+                if (ticker, 'Close') in data.columns:
+                    close_columns[ticker] = data[(ticker, 'Close')]
+                elif len(tickers) == 1 and 'Close' in data.columns:
+                    # 単一銘柄でカラムがMultiIndexにならないバージョン向け
+                    close_columns[ticker] = data['Close']
+            
+            if not close_columns:
+                logger.warning(f"終値データが見つかりません: {tickers}")
+                return pd.DataFrame()
+            
+            # 確保済みの2次元配列に終値を詰め、DataFrameは最後に一度だけ構築
+            values = np.empty((len(data.index), len(close_columns)), dtype=HISTORICAL_PRICE_PRECISION)
+            for j, close in enumerate(close_columns.values()):
+                values[:, j] = close.to_numpy(dtype=HISTORICAL_PRICE_PRECISION)
+            result = pd.DataFrame(values, index=data.index, columns=list(close_columns), copy=False)
             
             # NaN値の処理
             result = result.dropna(how='all')  # すべてがNaNの行を削除
             
             logger.info(f"過去データ取得完了: {len(result)}日分, {len(result.columns)}銘柄")
+            _save_disk_cache(cache_path, result)
             return result
             
     except Exception as e:
@@ -343,6 +747,106 @@ def get_historical_data(tickers: List[str], period: str = "5y") -> pd.DataFrame:
         return pd.DataFrame()
 
 
+def _seconds_since_midnight() -> float:
+    """
+    本日0時（ローカル時刻）からの経過秒数（当日中のみ有効なキャッシュの有効期間として使用）
+    
+    Returns:
+        float: 経過秒数
+    """
+    return time.time() - datetime.combine(date.today(), datetime.min.time()).timestamp()
+
+
+def _disk_cache_path(name: str, key_parts: Tuple[str, ...]) -> Path:
+    """
+    ディスクキャッシュのファイルパスを生成（同じキーは同じファイルを上書きし、有効期間は当日中）
+    
+    Args:
+        name: キャッシュ名
+        key_parts: キャッシュキーを構成する文字列
+    
+    Returns:
+        Path: キャッシュファイルのパス
+    """
+    return cache_file_path(PRICE_CACHE_DIR, name, key_parts)
+
+
+def _load_disk_cache(cache_path: Path) -> Optional[Union[dict, pd.DataFrame]]:
+    """
+    ディスクキャッシュを読み込む（未保存・前日以前の保存ならNone）
+    
+    Args:
+        cache_path: キャッシュファイルのパス
+    
+    Returns:
+        Optional[Union[dict, pd.DataFrame]]: キャッシュ済みデータ
+    """
+    return load_pickle_cache(cache_path, _seconds_since_midnight())
+
+
+def _save_disk_cache(cache_path: Path, value: Union[dict, pd.DataFrame]):
+    """
+    ディスクキャッシュに保存（前日以前に保存されたファイルは削除）
+    
+    Args:
+        cache_path: キャッシュファイルのパス
+        value: 保存するデータ
+    """
+    save_pickle_cache(cache_path, value, _seconds_since_midnight())
+
+
+def _refresh_disk_cache(cache_path: Path, fetch: Callable[[], dict]):
+    """
+    バックグラウンドでデータを再取得してディスクキャッシュを更新
+    
+    Args:
+        cache_path: キャッシュファイルのパス
+        fetch: データ取得関数
+    """
+    try:
+        _save_disk_cache(cache_path, fetch())
+    except Exception as e:
+        logger.warning(f"ディスクキャッシュ更新エラー ({cache_path.name}): {str(e)}")
+    finally:
+        with _refreshing_lock:
+            _refreshing_keys.discard(cache_path)
+
+
+def _get_with_disk_cache(name: str, key_parts: Tuple[str, ...], fetch: Callable[[], dict],
+                         refresh: Optional[Callable[[], dict]] = None) -> dict:
+    """
+    ディスクキャッシュ経由でデータを取得（stale-while-revalidate）
+    
+    ヒット時はキャッシュを即座に返し、バックグラウンドで再取得してキャッシュを更新する。
+    ミス時は同期的に取得して保存する。
+    バックグラウンドのスレッドにはScriptRunContextが無くStreamlitの表示が破棄されるため、
+    再取得には画面出力を行わない関数を使う。
+    
+    Args:
+        name: キャッシュ名
+        key_parts: キャッシュキーを構成する文字列
+        fetch: データ取得関数
+        refresh: バックグラウンド再取得用の関数（画面出力を行わないこと、省略時はfetch）
+    
+    Returns:
+        dict: 取得したデータ
+    """
+    cache_path = _disk_cache_path(name, key_parts)
+    
+    cached = _load_disk_cache(cache_path)
+    if cached is not None:
+        with _refreshing_lock:
+            start_refresh = cache_path not in _refreshing_keys
+            _refreshing_keys.add(cache_path)
+        if start_refresh:
+            threading.Thread(target=_refresh_disk_cache, args=(cache_path, refresh or fetch), daemon=True).start()
+        return cached
+    
+    result = fetch()
+    _save_disk_cache(cache_path, result)
+    return result
+
+
 @st.cache_data(ttl=300)  # 5分間キャッシュ
 def cached_get_current_prices(tickers_tuple: Tuple[str, ...]) -> Dict[str, float]:
     """
@@ -354,7 +858,12 @@ def cached_get_current_prices(tickers_tuple: Tuple[str, ...]) -> Dict[str, float
     Returns:
         Dict[str, float]: 株価辞書
     """
-    return get_current_prices(list(tickers_tuple))
+    tickers = list(tickers_tuple)
+    return _get_with_disk_cache(
+        'prices', tuple(sorted(tickers)),
+        lambda: get_current_prices(tickers),
+        refresh=lambda: get_current_prices(tickers, notify=False)
+    )
 
 
 @st.cache_data(ttl=900)  # 15分間キャッシュ
@@ -365,7 +874,7 @@ def cached_get_exchange_rates() -> Dict[str, float]:
     Returns:
         Dict[str, float]: 為替レート辞書
     """
-    return get_exchange_rates()
+    return _get_with_disk_cache('fx', (), get_exchange_rates)
 
 
 def get_company_names(tickers: List[str]) -> Dict[str, str]:
@@ -382,11 +891,19 @@ def get_company_names(tickers: List[str]) -> Dict[str, str]:
     failed_tickers = []
     
     try:
+        # 永続キャッシュ済みの企業名をまとめて読み込み、未取得分のみ問い合わせる
+        company_names.update(_load_cached_company_names(tickers))
+        pending = [ticker for ticker in tickers if ticker not in company_names]
+        fetched_names = {}
+        
+        # Tickersを一度だけ生成し、共有セッション上のハンドルを各スレッドに渡す
+        handles = yf.Tickers(" ".join(pending), session=_SESSION).tickers if pending else {}
+        
         # 並列処理で企業名を取得
         with ThreadPoolExecutor(max_workers=10) as executor:
             future_to_ticker = {
-                executor.submit(get_single_company_name, ticker): ticker 
-                for ticker in tickers
+                executor.submit(_fetch_company_name, ticker, handles.get(ticker.upper())): ticker 
+                for ticker in pending
             }
             
             for future in as_completed(future_to_ticker):
@@ -395,6 +912,7 @@ def get_company_names(tickers: List[str]) -> Dict[str, str]:
                     company_name = future.result()
                     if company_name:
                         company_names[ticker] = company_name
+                        fetched_names[ticker] = company_name
                     else:
                         failed_tickers.append(ticker)
                         company_names[ticker] = ticker  # フォールバック
@@ -403,6 +921,9 @@ def get_company_names(tickers: List[str]) -> Dict[str, str]:
                     failed_tickers.append(ticker)
                     company_names[ticker] = ticker  # フォールバック
         
+        # 新たに取得した企業名は一度の書き込みでまとめて保存
+        _save_cached_company_names(fetched_names)
+        
         if failed_tickers:
             logger.warning(f"以下の銘柄の企業名取得に失敗しました: {failed_tickers}")
         
@@ -414,27 +935,48 @@ def get_company_names(tickers: List[str]) -> Dict[str, str]:
         return {ticker: ticker for ticker in tickers}  # フォールバック
 
 
-def get_single_company_name(ticker: str) -> Optional[str]:
+def get_single_company_name(ticker: str, stock: Optional[yf.Ticker] = None) -> Optional[str]:
     """
     単一銘柄の企業名を取得
     
     Args:
         ticker: ティッカーシンボル
+        stock: 生成済みのTickerハンドル（yf.Tickersから渡す場合）
+    
+    Returns:
+        str: 企業名、取得失敗時はNone
+    """
+    cached_name = _load_cached_company_names([ticker]).get(ticker)
+    if cached_name is not None:
+        return cached_name
+    
+    company_name = _fetch_company_name(ticker, stock)
+    if company_name:
+        _save_cached_company_names({ticker: company_name})
+    return company_name
+
+
+def _fetch_company_name(ticker: str, stock: Optional[yf.Ticker] = None) -> Optional[str]:
+    """
+    Yahoo Financeから単一銘柄の企業名を取得（永続キャッシュは参照しない）
+    
+    Args:
+        ticker: ティッカーシンボル
+        stock: 生成済みのTickerハンドル（yf.Tickersから渡す場合）
     
     Returns:
         str: 企業名、取得失敗時はNone
     """
     try:
-        stock = yf.Ticker(ticker)
+        if stock is None:
+            stock = yf.Ticker(ticker, session=_SESSION)
         info = stock.info
         
-        # longNameを最優先で取得
-        if 'longName' in info and info['longName']:
-            return info['longName']
+        # longNameを最優先で取得、なければshortNameを試行
+        company_name = info.get('longName') or info.get('shortName')
         
-        # shortNameも試行
-        if 'shortName' in info and info['shortName']:
-            return info['shortName']
+        if company_name:
+            return company_name
         
         # 企業名が取得できない場合
         logger.warning(f"企業名が取得できません: {ticker}")
@@ -445,6 +987,89 @@ def get_single_company_name(ticker: str) -> Optional[str]:
         return None
 
 
+def _open_company_name_db():
+    """
+    企業名の永続キャッシュ（shelve）を初回のみ開き、以降は同じハンドルを返す
+    （呼び出し側で _company_name_db_lock を保持すること）
+    
+    Returns:
+        shelve.Shelf: 企業名キャッシュ
+    """
+    global _company_name_db
+    if _company_name_db is None:
+        PRICE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _company_name_db = shelve.open(str(COMPANY_NAME_DB_PATH))
+        atexit.register(_close_company_name_db)
+    return _company_name_db
+
+
+def _close_company_name_db():
+    """
+    企業名の永続キャッシュを閉じる（プロセス終了時）
+    """
+    global _company_name_db
+    with _company_name_db_lock:
+        if _company_name_db is not None:
+            try:
+                _company_name_db.close()
+            except Exception as e:
+                logger.warning(f"企業名キャッシュクローズエラー: {str(e)}")
+            _company_name_db = None
+
+
+def _load_cached_company_names(tickers: List[str]) -> Dict[str, str]:
+    """
+    永続キャッシュから企業名をまとめて読み込む（期限切れ・未保存の銘柄は含まない）
+    
+    Args:
+        tickers: ティッカーシンボルのリスト
+    
+    Returns:
+        Dict[str, str]: キャッシュ済みの企業名辞書
+    """
+    entries = {}
+    try:
+        with _company_name_db_lock:
+            if _company_name_db is None and not PRICE_CACHE_DIR.exists():
+                return {}
+            db = _open_company_name_db()
+            for ticker in tickers:
+                entry = db.get(ticker)
+                if entry is not None:
+                    entries[ticker] = entry
+    except Exception as e:
+        logger.warning(f"企業名キャッシュ読み込みエラー: {str(e)}")
+        return {}
+    
+    now = time.time()
+    return {
+        ticker: company_name
+        for ticker, (company_name, saved_at) in entries.items()
+        if now - saved_at <= COMPANY_NAME_CACHE_TTL
+    }
+
+
+def _save_cached_company_names(company_names: Dict[str, str]):
+    """
+    企業名をまとめて永続キャッシュに保存（書き込み後に一度だけ同期）
+    
+    Args:
+        company_names: ティッカーをキーとした企業名辞書
+    """
+    if not company_names:
+        return
+    
+    try:
+        saved_at = time.time()
+        with _company_name_db_lock:
+            db = _open_company_name_db()
+            for ticker, company_name in company_names.items():
+                db[ticker] = (company_name, saved_at)
+            db.sync()
+    except Exception as e:
+        logger.warning(f"企業名キャッシュ保存エラー: {str(e)}")
+
+
 @st.cache_data(ttl=3600)  # 1時間キャッシュ（企業名は変わりにくいため長めに設定）
 def cached_get_company_names(tickers_tuple: Tuple[str, ...]) -> Dict[str, str]:
     """
@@ -456,4 +1081,5 @@ def cached_get_company_names(tickers_tuple: Tuple[str, ...]) -> Dict[str, str]:
     Returns:
         Dict[str, str]: 企業名辞書
     """
+    # 企業名は銘柄単位の永続キャッシュ（shelve）で保持しているため、ここでは重ねてディスクキャッシュしない
     return get_company_names(list(tickers_tuple))
\ No newline at end of file
@@ -6,10 +6,142 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
+import importlib.util
 import logging
 
 logger = logging.getLogger(__name__)
 
+# numbaが利用可能な場合は繰り返し呼ばれる小さな計算をJITコンパイルする
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+
+def _quadratic_form(cov_values: np.ndarray, weights: np.ndarray) -> Tuple[float, np.ndarray]:
+    """
+    ポートフォリオ分散 w'Σw を計算
+    
+    Args:
+        cov_values: 共分散行列
+        weights: ポートフォリオ重み
+    
+    Returns:
+        Tuple[float, np.ndarray]: ポートフォリオ分散と Σw（限界リスク計算で再利用）
+    """
+    quadratic_form_kernel = _get_quadratic_form_kernel()
+    if quadratic_form_kernel is not None:
+        weights = np.ascontiguousarray(weights, dtype=np.float64)
+        cov_values = np.ascontiguousarray(cov_values, dtype=np.float64)
+        
+        # JITカーネルは境界チェックを行わないため、NumPy版（w @ Σ @ w）と同様に形状不一致はここで例外とする
+        if weights.ndim != 1 or cov_values.ndim != 2 or not (weights.shape[0] == cov_values.shape[0] == cov_values.shape[1]):
+            raise ValueError(
+                f"共分散行列と重みの形状が一致しません: cov={cov_values.shape}, weights={weights.shape}"
+            )
+        
+        cov_w = np.empty(weights.shape[0])
+        variance = quadratic_form_kernel(cov_values, weights, cov_w)
+        return variance, cov_w
+    
+    cov_w = cov_values @ weights
+    return weights @ cov_w, cov_w
+
+
+def _quadratic_form_kernel(cov_values: np.ndarray, weights: np.ndarray, out_cov_w: np.ndarray) -> float:
+    """
+    ポートフォリオ分散カーネル（NumPy配列のみを扱うためnumbaでJITコンパイル可能）
+    
+    Args:
+        cov_values: 共分散行列（float64）
+        weights: ポートフォリオ重み（float64）
+        out_cov_w: Σw の出力先
+    
+    Returns:
+        float: ポートフォリオ分散
+    """
+    n = weights.shape[0]
+    variance = 0.0
+    for i in range(n):
+        total = 0.0
+        for j in range(n):
+            total += cov_values[i, j] * weights[j]
+        out_cov_w[i] = total
+        variance += weights[i] * total
+    return variance
+
+
+def _drawdown_kernel(returns: np.ndarray) -> Tuple[float, int, int, float]:
+    """
+    ドローダウン計算カーネル（累積リターン・最高値・ドローダウン期間を1回の走査で計算）
+    
+    NaNの位置はpandas版と同様に累積計算から除外し、ドローダウン期間の状態も変えない。
+    
+    Args:
+        returns: リターン系列（float64）
+    
+    Returns:
+        Tuple[float, int, int, float]: 最大ドローダウン、最長ドローダウン期間、
+        終了したドローダウン回数、直近のドローダウン
+    """
+    cumulative = 1.0
+    peak = np.nan
+    max_drawdown = np.nan
+    current_drawdown = np.nan
+    in_drawdown = False
+    start_idx = 0
+    max_duration = 0
+    n_periods = 0
+    
+    for i in range(returns.shape[0]):
+        r = returns[i]
+        if np.isnan(r):
+            current_drawdown = np.nan
+            continue
+        
+        cumulative *= 1.0 + r
+        if np.isnan(peak) or cumulative > peak:
+            peak = cumulative
+        
+        dd = (cumulative - peak) / peak
+        current_drawdown = dd
+        if np.isnan(dd):
+            continue
+        
+        if np.isnan(max_drawdown) or dd < max_drawdown:
+            max_drawdown = dd
+        
+        if dd < 0 and not in_drawdown:
+            in_drawdown = True
+            start_idx = i
+        elif dd >= 0 and in_drawdown:
+            in_drawdown = False
+            n_periods += 1
+            if i - start_idx > max_duration:
+                max_duration = i - start_idx
+    
+    return max_drawdown, max_duration, n_periods, current_drawdown
+
+
+_quadratic_form_kernel_compiled = None
+_drawdown_kernel_compiled = None
+
+
+def _get_quadratic_form_kernel():
+    """numbaが利用可能ならJITコンパイル済みのポートフォリオ分散カーネルを返す（利用できない場合はNone）"""
+    global _quadratic_form_kernel_compiled
+    if _quadratic_form_kernel_compiled is None and NUMBA_AVAILABLE:
+        from numba import njit
+        _quadratic_form_kernel_compiled = njit(cache=True)(_quadratic_form_kernel)
+    return _quadratic_form_kernel_compiled
+
+
+def _get_drawdown_kernel():
+    """numbaが利用可能ならJITコンパイル済みのドローダウンカーネルを返す（利用できない場合はNone）"""
+    global _drawdown_kernel_compiled
+    if _drawdown_kernel_compiled is None and NUMBA_AVAILABLE:
+        from numba import njit
+        # 最高値が0の場合の0除算はpandas版と同様にNaN/infとする
+        _drawdown_kernel_compiled = njit(cache=True, error_model='numpy')(_drawdown_kernel)
+    return _drawdown_kernel_compiled
+
 
 def calculate_volatility(returns: pd.Series, annualize: bool = True) -> float:
     """
@@ -39,7 +171,8 @@ def calculate_volatility(returns: pd.Series, annualize: bool = True) -> float:
 
 def calculate_portfolio_risk(
     returns: pd.DataFrame, 
-    weights: np.ndarray
+    weights: np.ndarray,
+    cov_matrix: Optional[pd.DataFrame] = None
 ) -> Dict[str, any]:
     """
     ポートフォリオ全体のリスク計算（日次ベース）
@@ -47,6 +180,7 @@ def calculate_portfolio_risk(
     Args:
         returns: 各銘柄の日次リターンDataFrame
         weights: 各銘柄の重み（時価総額比率）
+        cov_matrix: 計算済みの日次共分散行列（省略時はreturnsから計算）
     
     Returns:
         dict: ポートフォリオリスク指標（日次ベース）
@@ -56,21 +190,25 @@ def calculate_portfolio_risk(
             return {}
         
         # 日次共分散行列計算（年率換算しない）
-        daily_cov_matrix = returns.cov()
+        daily_cov_matrix = returns.cov() if cov_matrix is None else cov_matrix
         
         # 日次ポートフォリオボラティリティ
-        daily_portfolio_variance = np.dot(weights.T, np.dot(daily_cov_matrix, weights))
+        daily_portfolio_variance, _ = _quadratic_form(daily_cov_matrix.to_numpy(dtype=np.float64), weights)
         daily_portfolio_volatility = np.sqrt(daily_portfolio_variance)
         
         # 相関行列
         correlation_matrix = returns.corr()
         
-        # 平均相関
-        n = len(correlation_matrix)
-        avg_correlation = (correlation_matrix.sum().sum() - n) / (n * (n - 1)) if n > 1 else 0
+        # 平均相関（対角成分を除いた相関の平均、NaNは除外）
+        corr_values = correlation_matrix.to_numpy()
+        n = corr_values.shape[0]
+        avg_correlation = (np.nansum(corr_values) - n) / (n * (n - 1)) if n > 1 else 0
         
-        # 銘柄別日次ボラティリティ
-        daily_individual_volatilities = returns.std()
+        # 銘柄別日次ボラティリティ（共分散行列の対角成分から求め、リターンの再走査を省く）
+        daily_individual_volatilities = pd.Series(
+            np.sqrt(np.diag(daily_cov_matrix.to_numpy(dtype=np.float64))),
+            index=daily_cov_matrix.index
+        )
         
         # 重み付き平均ボラティリティ（日次）
         weighted_avg_vol = (daily_individual_volatilities * weights).sum()
@@ -116,14 +254,19 @@ def calculate_var_cvar(
         
         results = {}
         
-        for confidence in confidence_levels:
-            # VaR計算
-            var_percentile = (1 - confidence) * 100
-            var = np.percentile(portfolio_returns.dropna(), var_percentile)
-            
+        # 一度だけソートし、全信頼水準のVaRとCVaRで共有
+        sorted_returns = np.sort(portfolio_returns.dropna().to_numpy(dtype=np.float64))
+        
+        # VaR計算（全信頼水準を一括で計算）
+        var_percentiles = [(1 - confidence) * 100 for confidence in confidence_levels]
+        var_values = np.percentile(sorted_returns, var_percentiles)
+        
+        # VaR以下のリターンの件数（ソート済みなので二分探索で求まる）
+        tail_counts = np.searchsorted(sorted_returns, var_values, side='right')
+        
+        for confidence, var, tail_count in zip(confidence_levels, var_values, tail_counts):
             # CVaR計算（VaRを下回る損失の平均）
-            tail_returns = portfolio_returns[portfolio_returns <= var]
-            cvar = tail_returns.mean() if not tail_returns.empty else var
+            cvar = sorted_returns[:tail_count].mean() if tail_count > 0 else var
             
             results[f'VaR_{int(confidence*100)}'] = var
             results[f'CVaR_{int(confidence*100)}'] = cvar
@@ -140,7 +283,8 @@ def stress_test_scenario(
     returns: pd.DataFrame,
     weights: np.ndarray,
     stress_factor: float = 2.0,
-    correlation_shock: float = 0.9
+    correlation_shock: float = 0.9,
+    cov_matrix: Optional[pd.DataFrame] = None
 ) -> Dict[str, float]:
     """
     ストレスシナリオ分析（日次ベース）
@@ -150,6 +294,7 @@ def stress_test_scenario(
         weights: ポートフォリオ重み
         stress_factor: ボラティリティ増加倍率
         correlation_shock: ストレス時の相関係数
+        cov_matrix: 計算済みの日次共分散行列（省略時はreturnsから計算）
     
     Returns:
         dict: ストレステスト結果（日次ボラティリティベース）
@@ -159,26 +304,25 @@ def stress_test_scenario(
             return {}
         
         # 通常時の日次共分散行列（年率換算しない）
-        daily_normal_cov = returns.cov()
+        daily_normal_cov = returns.cov() if cov_matrix is None else cov_matrix
         
-        # ストレス時の共分散行列構築
-        daily_normal_vol = np.sqrt(np.diag(daily_normal_cov))
+        # ストレス時の銘柄別ボラティリティ
+        daily_normal_cov_values = daily_normal_cov.to_numpy(dtype=np.float64)
+        daily_normal_vol = np.sqrt(np.diag(daily_normal_cov_values))
         daily_stressed_vol = daily_normal_vol * stress_factor
         
-        # 相関行列をストレス値に変更
-        n = len(returns.columns)
-        stressed_corr = np.full((n, n), correlation_shock)
-        np.fill_diagonal(stressed_corr, 1.0)
-        
-        # ストレス時共分散行列
-        daily_stressed_cov = np.outer(daily_stressed_vol, daily_stressed_vol) * stressed_corr
-        
         # 通常時ポートフォリオボラティリティ（日次）
-        daily_normal_portfolio_var = np.dot(weights.T, np.dot(daily_normal_cov, weights))
+        daily_normal_portfolio_var, _ = _quadratic_form(daily_normal_cov_values, weights)
         daily_normal_portfolio_vol = np.sqrt(daily_normal_portfolio_var)
         
         # ストレス時ポートフォリオボラティリティ（日次）
-        daily_stressed_portfolio_var = np.dot(weights.T, np.dot(daily_stressed_cov, weights))
+        # 相関を対角1・非対角correlation_shockに置き換えた共分散行列の二次形式は
+        # c(Σw_iσ_i)² + (1-c)Σ(w_iσ_i)² と等しいため、N×N行列を作らずに計算する
+        weighted_stressed_vol = weights * daily_stressed_vol
+        daily_stressed_portfolio_var = (
+            correlation_shock * weighted_stressed_vol.sum() ** 2
+            + (1 - correlation_shock) * np.dot(weighted_stressed_vol, weighted_stressed_vol)
+        )
         daily_stressed_portfolio_vol = np.sqrt(daily_stressed_portfolio_var)
         
         # ストレス倍率
@@ -202,7 +346,8 @@ def stress_test_scenario(
 
 def calculate_risk_contribution(
     returns: pd.DataFrame,
-    weights: np.ndarray
+    weights: np.ndarray,
+    cov_matrix: Optional[pd.DataFrame] = None
 ) -> Dict[str, any]:
     """
     リスク寄与度分析（日次ベース）
@@ -210,6 +355,7 @@ def calculate_risk_contribution(
     Args:
         returns: 銘柄リターンデータ
         weights: ポートフォリオ重み
+        cov_matrix: 計算済みの日次共分散行列（省略時はreturnsから計算）
     
     Returns:
         dict: リスク寄与度分析結果（日次ボラティリティベース）
@@ -219,14 +365,14 @@ def calculate_risk_contribution(
             return {}
         
         # 日次共分散行列（年率換算しない）
-        daily_cov_matrix = returns.cov()
+        daily_cov_matrix = returns.cov() if cov_matrix is None else cov_matrix
         
         # ポートフォリオ分散（日次）
-        daily_portfolio_variance = np.dot(weights.T, np.dot(daily_cov_matrix, weights))
+        daily_portfolio_variance, cov_w = _quadratic_form(daily_cov_matrix.to_numpy(dtype=np.float64), weights)
         daily_portfolio_volatility = np.sqrt(daily_portfolio_variance)
         
         # 各銘柄のリスク寄与度（偏微分）
-        marginal_risk = np.dot(daily_cov_matrix, weights) / daily_portfolio_volatility if daily_portfolio_volatility > 0 else np.zeros_like(weights)
+        marginal_risk = cov_w / daily_portfolio_volatility if daily_portfolio_volatility > 0 else np.zeros_like(weights)
         
         # リスク寄与額
         risk_contribution = weights * marginal_risk
@@ -314,39 +460,48 @@ def calculate_maximum_drawdown(returns: pd.Series) -> Dict[str, float]:
         if returns.empty:
             return {}
         
-        # 累積リターンを計算
-        cumulative_returns = (1 + returns).cumprod()
-        
-        # 過去の最高値を記録
-        rolling_max = cumulative_returns.expanding().max()
-        
-        # ドローダウンを計算
-        drawdown = (cumulative_returns - rolling_max) / rolling_max
-        
-        # 最大ドローダウン
-        max_drawdown = drawdown.min()
-        
-        # ドローダウン期間
-        dd_periods = []
-        in_drawdown = False
-        start_idx = 0
-        
-        for i, dd in enumerate(drawdown):
-            if dd < 0 and not in_drawdown:
-                in_drawdown = True
-                start_idx = i
-            elif dd >= 0 and in_drawdown:
-                in_drawdown = False
-                dd_periods.append(i - start_idx)
-        
-        # 最長ドローダウン期間
-        max_drawdown_duration = max(dd_periods) if dd_periods else 0
+        drawdown_kernel = _get_drawdown_kernel()
+        if drawdown_kernel is not None:
+            # numba: 累積リターン・最高値・ドローダウン期間を1回のループで計算
+            max_drawdown, max_drawdown_duration, drawdown_periods, current_drawdown = drawdown_kernel(
+                returns.to_numpy(dtype=np.float64)
+            )
+        else:
+            # 累積リターンを計算
+            cumulative_returns = (1 + returns).cumprod()
+            
+            # 過去の最高値を記録
+            rolling_max = cumulative_returns.expanding().max()
+            
+            # ドローダウンを計算
+            drawdown = (cumulative_returns - rolling_max) / rolling_max
+            
+            # 最大ドローダウン
+            max_drawdown = drawdown.min()
+            
+            # ドローダウン期間（NaNの位置は状態を変えずに読み飛ばす）
+            dd_values = drawdown.to_numpy(dtype=np.float64)
+            valid_positions = np.flatnonzero(~np.isnan(dd_values))
+            in_drawdown = (dd_values[valid_positions] < 0).astype(np.int8)
+            
+            # ドローダウンの開始（0→1）と終了（1→0）の位置
+            edges = np.diff(in_drawdown, prepend=np.int8(0))
+            starts = valid_positions[edges == 1]
+            ends = valid_positions[edges == -1]
+            
+            # 末尾で継続中のドローダウンは期間に含めない
+            dd_periods = ends - starts[:len(ends)]
+            
+            # 最長ドローダウン期間
+            max_drawdown_duration = int(dd_periods.max()) if len(dd_periods) > 0 else 0
+            drawdown_periods = len(dd_periods)
+            current_drawdown = drawdown.iloc[-1]
         
         result = {
             'max_drawdown': max_drawdown,
             'max_drawdown_duration': max_drawdown_duration,
-            'current_drawdown': drawdown.iloc[-1],
-            'drawdown_periods': len(dd_periods)
+            'current_drawdown': current_drawdown,
+            'drawdown_periods': drawdown_periods
         }
         
         logger.info(f"最大ドローダウン計算完了: {max_drawdown:.2%}")
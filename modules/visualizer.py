@@ -3,16 +3,474 @@
 チャートとグラフの生成機能
 """
 
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from __future__ import annotations
+
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import hashlib
+import importlib.metadata
+import importlib.util
 import logging
+import threading
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 logger = logging.getLogger(__name__)
 
+# numbaが利用可能な場合は長い系列の間引き（LTTB）をJITコンパイルする
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+# plotly はインポートが重いため使用時に遅延インポートする
+PLOTLY_AVAILABLE = importlib.util.find_spec('plotly') is not None
+go = None
+pio = None
+make_subplots = None
+
+
+def _lazy_go():
+    """plotly.graph_objectsを初回使用時にインポート"""
+    global go
+    if go is None:
+        import plotly.graph_objects as go
+    return go
+
+
+def _lazy_pio():
+    """plotly.ioを初回使用時にインポート"""
+    global pio
+    if pio is None:
+        import plotly.io as pio
+    return pio
+
+
+def _lazy_make_subplots():
+    """plotly.subplots.make_subplotsを初回使用時にインポート"""
+    global make_subplots
+    if make_subplots is None:
+        from plotly.subplots import make_subplots
+    return make_subplots
+
+
+def _plotly_major_version() -> int:
+    """インストール済みplotlyのメジャーバージョン（未インストール時は0）"""
+    try:
+        return int(importlib.metadata.version('plotly').split('.')[0])
+    except Exception:
+        return 0
+
+# 生成済みFigureのキャッシュ件数
+FIGURE_CACHE_SIZE = 64
+
+# キー -> [Figure, シリアライズ済みJSON（.json 経由で初めて要求された時に作成）]
+_figure_cache: "OrderedDict[str, list]" = OrderedDict()
+_figure_cache_lock = threading.Lock()
+
+# ファクター名の日本語表記
+FACTOR_NAMES_JP = {
+    'Mkt-RF': '市場プレミアム',
+    'SMB': '小型株プレミアム',
+    'HML': 'バリュープレミアム',
+    'RMW': '収益性プレミアム',
+    'CMA': '投資プレミアム',
+    'Mom': 'モメンタムプレミアム'
+}
+
+# 分析期間ラベルの日本語表記
+PERIOD_LABELS_JP = {
+    '1mo': '1ヶ月',
+    '3mo': '3ヶ月',
+    '6mo': '6ヶ月',
+    'ytd': '年初来',
+    '1y': '1年',
+    '2y': '2年',
+    '5y': '5年'
+}
+
+# ファクター系列の線色
+FACTOR_COLOR_PALETTE = ('blue', 'red', 'green', 'orange', 'purple', 'brown')
+
+# ダッシュボード用チャートを並列生成する際のワーカー数
+DASHBOARD_MAX_WORKERS = 4
+
+# WebGL描画に切り替える点数の閾値（これ以下はSVGのまま）
+SCATTERGL_THRESHOLD = 1000
+
+# Scattergl が使えない環境では Scatter にフォールバック
+SCATTERGL_AVAILABLE = PLOTLY_AVAILABLE
+
+# hovermode='x unified' を使う最大描画点数（トレース数×点数）
+# 超過時はホバー毎の全トレース探索・ホバーカード生成を避けるため 'closest' にする
+UNIFIED_HOVER_MAX_POINTS = 10_000
+
+# 相関ヒートマップでセル内ラベルを表示する最大セル数（超過時はラベル省略）
+HEATMAP_LABEL_CELL_LIMIT = 1024
+
+# Heatmapgl は plotly 6 で廃止されたため、それ以前のバージョンでのみ使用
+HEATMAPGL_AVAILABLE = PLOTLY_AVAILABLE and _plotly_major_version() < 6
+
+# 価格履歴チャートの1系列あたり最大描画点数（超過分はLTTBで間引き）
+LTTB_THRESHOLD = 2000
+
+
+# 「データがありません」表示の空チャート用レイアウト（モジュール読み込み時に一度だけ生成）
+# テンプレートを含めないことで、複製時のテンプレート再検証を避ける
+_EMPTY_FIG_LAYOUT = {
+    'annotations': [dict(
+        text="データがありません",
+        xref="paper", yref="paper",
+        x=0.5, y=0.5, showarrow=False
+    )]
+}
+
+
+def _empty_figure() -> go.Figure:
+    """
+    空チャートを返す（呼び出し側で update_layout されても共有レイアウトは変わらない）
+    
+    Returns:
+        plotly.graph_objects.Figure: 「データがありません」を表示する空チャート
+    """
+    go = _lazy_go()
+    return go.Figure(layout=_EMPTY_FIG_LAYOUT)
+
+
+def _scatter_trace_type(n_points: int) -> str:
+    """
+    点数に応じて散布図トレースの type を選択（dict形式トレース用）
+    
+    Args:
+        n_points: チャート全体の描画点数
+    
+    Returns:
+        str: 'scattergl'（WebGL描画）または 'scatter'（SVG描画）
+    """
+    if SCATTERGL_AVAILABLE and n_points > SCATTERGL_THRESHOLD:
+        return 'scattergl'
+    return 'scatter'
+
+
+def _fingerprint_value(value, hasher) -> None:
+    """
+    キャッシュキー用に引数の内容をハッシュへ投入
+    
+    Args:
+        value: 関数引数（DataFrame/Series/スカラーなど）
+        hasher: hashlib のハッシュオブジェクト
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        hasher.update(type(value).__name__.encode())
+        hasher.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        labels = value.columns if isinstance(value, pd.DataFrame) else [value.name]
+        hasher.update(repr(list(labels)).encode())
+    else:
+        hasher.update(repr(value).encode())
+
+
+def _figure_cache_key(name: str, args: tuple, kwargs: dict) -> str:
+    """
+    関数名と引数内容からFigureキャッシュのキーを生成
+    
+    Args:
+        name: チャート関数名
+        args: 位置引数
+        kwargs: キーワード引数
+    
+    Returns:
+        str: キャッシュキー
+    """
+    hasher = hashlib.blake2b(name.encode(), digest_size=16)
+    for arg in args:
+        _fingerprint_value(arg, hasher)
+    for key in sorted(kwargs):
+        hasher.update(key.encode())
+        _fingerprint_value(kwargs[key], hasher)
+    return hasher.hexdigest()
+
+
+def _cached_figure_entry(func, args: tuple, kwargs: dict) -> Optional[list]:
+    """
+    チャートを生成してキャッシュ（同一内容ならキャッシュ済みのエントリを返す）
+    
+    Args:
+        func: チャート生成関数
+        args: 位置引数
+        kwargs: キーワード引数
+    
+    Returns:
+        Optional[list]: [Figure, JSON または None]（キー生成失敗時はNone）
+    """
+    try:
+        key = _figure_cache_key(func.__name__, args, kwargs)
+    except Exception as e:
+        logger.debug(f"Figureキャッシュキー生成失敗 ({func.__name__}): {str(e)}")
+        return None
+    
+    with _figure_cache_lock:
+        entry = _figure_cache.get(key)
+        if entry is not None:
+            _figure_cache.move_to_end(key)
+            return entry
+    
+    fig = func(*args, **kwargs)
+    entry = [fig, None]
+    
+    # データなし・エラー時の空Figureはキャッシュしない
+    if fig.data:
+        with _figure_cache_lock:
+            _figure_cache[key] = entry
+            _figure_cache.move_to_end(key)
+            while len(_figure_cache) > FIGURE_CACHE_SIZE:
+                _figure_cache.popitem(last=False)
+    
+    return entry
+
+
+def _fig_cache(func):
+    """
+    チャート生成関数の結果（Figure）をキャッシュするデコレータ
+    
+    キャッシュヒット時は生成済みの go.Figure をそのまま返すため、呼び出し側では読み取り専用として扱う
+    （変更が必要な場合は go.Figure(fig) で複製する）。
+    `func.json(...)` でシリアライズ済みJSON文字列を取得でき、JSONも初回作成後はキャッシュされる
+    """
+    @functools.wraps(func)
+    def figure_wrapper(*args, **kwargs):
+        entry = _cached_figure_entry(func, args, kwargs)
+        if entry is None:
+            return func(*args, **kwargs)
+        return entry[0]
+    
+    @functools.wraps(func)
+    def json_wrapper(*args, **kwargs):
+        pio = _lazy_pio()
+        entry = _cached_figure_entry(func, args, kwargs)
+        if entry is None:
+            return pio.to_json(func(*args, **kwargs), validate=False)
+        if entry[1] is None:
+            entry[1] = pio.to_json(entry[0], validate=False)
+        return entry[1]
+    
+    figure_wrapper.json = json_wrapper
+    return figure_wrapper
+
+
+def _lttb_kernel(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets による間引き対象インデックスの選択
+    （前回選択点に依存する逐次処理のため、スカラーのループで記述しnumbaでJITコンパイルする）
+    
+    Args:
+        x: X座標配列（float64、単調増加）
+        y: Y座標配列（float64、NaNを含まないこと）
+        threshold: 間引き後の点数（3以上かつ点数未満）
+    
+    Returns:
+        np.ndarray: 残す点のインデックス（先頭・末尾を含む）
+    """
+    n = len(y)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[threshold - 1] = n - 1
+    
+    # 先頭・末尾を除いた点を threshold-2 個のバケットに分割
+    bucket_size = (n - 2) / (threshold - 2)
+    
+    prev = 0
+    for i in range(threshold - 2):
+        # バケット境界（最後の境界は末尾点の直前で固定、最終バケットの次は末尾点のみ）
+        start = int(i * bucket_size) + 1
+        end = n - 1 if i + 1 == threshold - 2 else int((i + 1) * bucket_size) + 1
+        if i + 2 < threshold - 2:
+            next_end = int((i + 2) * bucket_size) + 1
+        elif i + 2 == threshold - 2:
+            next_end = n - 1
+        else:
+            next_end = n
+        
+        # 次バケットの平均点
+        avg_x = 0.0
+        avg_y = 0.0
+        for k in range(end, next_end):
+            avg_x += x[k]
+            avg_y += y[k]
+        count = next_end - end
+        avg_x /= count
+        avg_y /= count
+        
+        # 前回選択点・次バケット平均点と作る三角形の面積が最大の点を採用
+        best = start
+        best_area = -1.0
+        for k in range(start, end):
+            area = abs((x[prev] - avg_x) * (y[k] - y[prev]) - (x[prev] - x[k]) * (avg_y - y[prev]))
+            if area > best_area:
+                best_area = area
+                best = k
+        prev = best
+        selected[i + 1] = prev
+    
+    return selected
+
+
+_lttb_kernel_compiled = None
+
+
+def _get_lttb_kernel():
+    """numbaが利用可能ならJITコンパイル済みのLTTBカーネルを返す（利用できない場合はNone）"""
+    global _lttb_kernel_compiled
+    if _lttb_kernel_compiled is None and NUMBA_AVAILABLE:
+        from numba import njit
+        _lttb_kernel_compiled = njit(cache=True)(_lttb_kernel)
+    return _lttb_kernel_compiled
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> Optional[np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets による間引き対象インデックスの選択
+    
+    Args:
+        x: X座標配列（数値、単調増加）
+        y: Y座標配列（NaNを含まないこと）
+        threshold: 間引き後の点数
+    
+    Returns:
+        np.ndarray: 残す点のインデックス（先頭・末尾を含む）、numbaが利用できない場合はNone
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    
+    # Pythonループでの間引きは描画より遅くなるため、JITが使えない場合は間引かない
+    kernel = _get_lttb_kernel()
+    if kernel is None:
+        return None
+    
+    return kernel(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64), threshold)
+
+
+def _to_epoch_ms(dates) -> np.ndarray:
+    """
+    日付系列をエポックミリ秒(int64)配列に変換（plotly の日付軸でそのまま解釈可能）
+    
+    タイムゾーン付きの場合は表示上の現地時刻を保つため tz を外してから変換する。
+    日付型でない場合は変換せずにそのまま配列化して返す。
+    
+    Args:
+        dates: 日付のSeries/Index/配列
+    
+    Returns:
+        np.ndarray: エポックミリ秒配列（日付型以外は元の値の配列）
+    """
+    if not (pd.api.types.is_datetime64_any_dtype(dates)):
+        return np.asarray(dates)
+    
+    date_index = pd.DatetimeIndex(dates)
+    if date_index.tz is not None:
+        date_index = date_index.tz_localize(None)
+    return date_index.as_unit('ms').asi8
+
+
+def _hovermode_for(n_points: int) -> str:
+    """
+    描画点数に応じたホバーモードを選択
+    
+    Args:
+        n_points: 全トレース合計の描画点数
+    
+    Returns:
+        str: 'x unified' または 'closest'
+    """
+    return 'x unified' if n_points < UNIFIED_HOVER_MAX_POINTS else 'closest'
+
+
+def _aggregate_allocation(allocation_df: pd.DataFrame, category_col: str) -> pd.DataFrame:
+    """
+    配分データをカテゴリ単位に集計（groupby 1回）
+    
+    配分比率は合計し、損益率は評価額・簿価があれば損益額/簿価から再計算、
+    なければ配分比率で加重平均する。
+    
+    Args:
+        allocation_df: 配分DataFrame
+        category_col: カテゴリカラム名
+    
+    Returns:
+        pd.DataFrame: カテゴリ単位の配分DataFrame
+    """
+    if {'pnl_amount', 'cost_basis_jpy'}.issubset(allocation_df.columns):
+        grouped = allocation_df.groupby(category_col, sort=False, as_index=False).agg(
+            allocation_percentage=('allocation_percentage', 'sum'),
+            pnl_amount=('pnl_amount', 'sum'),
+            cost_basis_jpy=('cost_basis_jpy', 'sum')
+        )
+        cost = grouped['cost_basis_jpy'].to_numpy(dtype=np.float64)
+        pnl = grouped['pnl_amount'].to_numpy(dtype=np.float64)
+        grouped['pnl_percentage'] = np.where(cost > 0, pnl / np.where(cost == 0, 1, cost) * 100, 0.0)
+        return grouped
+    
+    weighted = allocation_df.assign(
+        _weighted_pnl=allocation_df['pnl_percentage'] * allocation_df['allocation_percentage']
+    )
+    grouped = weighted.groupby(category_col, sort=False, as_index=False).agg(
+        allocation_percentage=('allocation_percentage', 'sum'),
+        _weighted_pnl=('_weighted_pnl', 'sum')
+    )
+    weights = grouped['allocation_percentage'].to_numpy(dtype=np.float64)
+    grouped['pnl_percentage'] = np.where(
+        weights > 0, grouped['_weighted_pnl'].to_numpy() / np.where(weights == 0, 1, weights), 0.0
+    )
+    return grouped.drop(columns='_weighted_pnl')
+
+
+def _format_percent_labels(values: np.ndarray, decimals: int = 1) -> np.ndarray:
+    """
+    数値配列を「12.3%」形式のラベル配列に一括変換
+    
+    Args:
+        values: 数値配列
+        decimals: 小数点以下の桁数
+    
+    Returns:
+        np.ndarray: パーセント表記の文字列配列
+    """
+    return np.char.mod(f'%.{decimals}f%%', np.asarray(values, dtype=float))
+
+
+def _fast_sma(arr: np.ndarray, windows) -> Dict[int, np.ndarray]:
+    """
+    累積和の差分による単純移動平均（rolling(window).mean() 相当）
+    
+    Args:
+        arr: 価格配列
+        windows: 移動平均の窓幅（int または int のリスト）
+    
+    Returns:
+        Dict[int, np.ndarray]: 窓幅 -> 移動平均配列（窓が埋まるまで/NaNを含む窓はNaN）
+    """
+    if isinstance(windows, int):
+        windows = [windows]
+    
+    values = np.asarray(arr, dtype=np.float64)
+    valid = ~np.isnan(values)
+    
+    # 累積和は全窓幅で共有（NaNは0として加算し、有効件数で判定）
+    csum = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+    ccount = np.concatenate(([0], np.cumsum(valid)))
+    
+    result = {}
+    for w in windows:
+        out = np.full(values.shape, np.nan)
+        if 0 < w <= len(values):
+            sma = (csum[w:] - csum[:-w]) / w
+            full = (ccount[w:] - ccount[:-w]) == w
+            out[w - 1:] = np.where(full, sma, np.nan)
+        result[w] = out
+    return result
+
 
 def create_pnl_chart(pnl_df: pd.DataFrame) -> go.Figure:
     """
@@ -24,25 +482,20 @@ def create_pnl_chart(pnl_df: pd.DataFrame) -> go.Figure:
     Returns:
         plotly.graph_objects.Figure: 損益チャート
     """
+    go = _lazy_go()
     try:
         if pnl_df.empty:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="データがありません",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
+            return _empty_figure()
         
         # 色の設定（損益に応じて）
-        colors = ['red' if x < 0 else 'green' for x in pnl_df['pnl_amount']]
+        colors = np.where(pnl_df['pnl_amount'].to_numpy() < 0, 'red', 'green')
         
         fig = go.Figure(data=[
             go.Bar(
                 x=pnl_df['ticker'],
                 y=pnl_df['pnl_amount'],
                 marker_color=colors,
-                text=pnl_df['pnl_percentage'].apply(lambda x: f"{x:.1f}%"),
+                text=_format_percent_labels(pnl_df['pnl_percentage'].to_numpy()),
                 textposition='auto',
                 hovertemplate='<b>%{x}</b><br>' +
                             '損益額: ¥%{y:,.0f}<br>' +
@@ -79,15 +532,10 @@ def create_allocation_pie(pnl_df: pd.DataFrame) -> go.Figure:
     Returns:
         plotly.graph_objects.Figure: 配分チャート
     """
+    go = _lazy_go()
     try:
         if pnl_df.empty:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="データがありません",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
+            return _empty_figure()
         
         fig = go.Figure(data=[
             go.Pie(
@@ -114,6 +562,7 @@ def create_allocation_pie(pnl_df: pd.DataFrame) -> go.Figure:
         return go.Figure()
 
 
+@_fig_cache
 def create_correlation_heatmap(correlation_matrix: pd.DataFrame) -> go.Figure:
     """
     相関行列ヒートマップ
@@ -124,31 +573,35 @@ def create_correlation_heatmap(correlation_matrix: pd.DataFrame) -> go.Figure:
     Returns:
         plotly.graph_objects.Figure: 相関ヒートマップ
     """
+    go = _lazy_go()
     try:
         if correlation_matrix.empty:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="データがありません",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
+            return _empty_figure()
         
-        fig = go.Figure(data=go.Heatmap(
-            z=correlation_matrix.values,
+        # 相関係数は[-1, 1]の範囲で表示も小数3桁のため float32 で十分
+        # （float16 は plotly のJSONエンコーダが非対応）
+        # セル内ラベルは z から直接整形し、丸め済みの重複配列は送らない
+        heatmap_kwargs = dict(
+            z=correlation_matrix.to_numpy(dtype=np.float32),
             x=correlation_matrix.columns,
             y=correlation_matrix.index,
             colorscale='RdBu',
             zmid=0,
             zmin=-1,
             zmax=1,
-            text=np.round(correlation_matrix.values, 3),
-            texttemplate='%{text}',
-            textfont={"size": 10},
             hovertemplate='<b>%{y} vs %{x}</b><br>' +
                          '相関係数: %{z:.3f}<br>' +
                          '<extra></extra>'
-        ))
+        )
+        
+        # セル数が多い場合はセル内ラベルを省略し（値はホバーで確認）、可能ならWebGL描画
+        if correlation_matrix.size > HEATMAP_LABEL_CELL_LIMIT:
+            heatmap_cls = go.Heatmapgl if HEATMAPGL_AVAILABLE else go.Heatmap
+        else:
+            heatmap_cls = go.Heatmap
+            heatmap_kwargs.update(texttemplate='%{z:.3f}', textfont={"size": 10})
+        
+        fig = go.Figure(data=heatmap_cls(**heatmap_kwargs))
         
         fig.update_layout(
             title='銘柄間相関係数',
@@ -177,15 +630,10 @@ def create_var_distribution(portfolio_returns: pd.Series, var_values: Dict[str,
     Returns:
         plotly.graph_objects.Figure: VaR分布チャート
     """
+    go = _lazy_go()
     try:
         if portfolio_returns.empty:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="データがありません",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
+            return _empty_figure()
         
         fig = go.Figure()
         
@@ -238,15 +686,10 @@ def create_risk_contribution_chart(risk_data: Dict[str, any]) -> go.Figure:
     Returns:
         plotly.graph_objects.Figure: リスク寄与度チャート
     """
+    go = _lazy_go()
     try:
         if not risk_data or 'tickers' not in risk_data:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="データがありません",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
+            return _empty_figure()
         
         fig = go.Figure()
         
@@ -295,15 +738,10 @@ def create_performance_summary_chart(summary: Dict[str, float]) -> go.Figure:
     Returns:
         plotly.graph_objects.Figure: サマリーチャート
     """
+    go = _lazy_go()
     try:
         if not summary:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="データがありません",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
+            return _empty_figure()
         
         # メトリクス
         metrics = ['総損益率', '勝率', '最大利益率', '最大損失率']
@@ -315,14 +753,15 @@ def create_performance_summary_chart(summary: Dict[str, float]) -> go.Figure:
         ]
         
         # 色の設定
-        colors = ['green' if v > 0 else 'red' if v < 0 else 'gray' for v in values]
+        values_arr = np.asarray(values, dtype=float)
+        colors = np.select([values_arr > 0, values_arr < 0], ['green', 'red'], default='gray')
         
         fig = go.Figure(data=[
             go.Bar(
                 x=metrics,
                 y=values,
                 marker_color=colors,
-                text=[f"{v:.1f}%" for v in values],
+                text=_format_percent_labels(values_arr),
                 textposition='auto'
             )
         ])
@@ -350,15 +789,11 @@ def create_sector_allocation_chart(allocation_df: pd.DataFrame) -> go.Figure:
     Returns:
         plotly.graph_objects.Figure: 配分チャート
     """
+    go = _lazy_go()
+    make_subplots = _lazy_make_subplots()
     try:
         if allocation_df.empty:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="データがありません",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
+            return _empty_figure()
         
         # カテゴリカラムを特定（countryまたはsector）
         category_col = None
@@ -375,6 +810,15 @@ def create_sector_allocation_chart(allocation_df: pd.DataFrame) -> go.Figure:
         
         logger.info(f"配分チャート作成: カテゴリカラム={category_col}, データ数={len(allocation_df)}")
         
+        # 銘柄単位など未集計のデータが渡された場合はカテゴリ単位に集計
+        if allocation_df[category_col].duplicated().any():
+            allocation_df = _aggregate_allocation(allocation_df, category_col)
+        
+        # 各カラムは一度だけ配列として取り出す
+        categories = allocation_df[category_col].to_numpy()
+        allocation_values = allocation_df['allocation_percentage'].to_numpy()
+        pnl_values = allocation_df['pnl_percentage'].to_numpy()
+        
         fig = make_subplots(
             rows=1, cols=2,
             subplot_titles=['配分比率', '損益率'],
@@ -384,8 +828,8 @@ def create_sector_allocation_chart(allocation_df: pd.DataFrame) -> go.Figure:
         # 配分円グラフ
         fig.add_trace(
             go.Pie(
-                labels=allocation_df[category_col],
-                values=allocation_df['allocation_percentage'],
+                labels=categories,
+                values=allocation_values,
                 textinfo='label+percent',
                 hovertemplate='<b>%{label}</b><br>' +
                             '配分比率: %{percent}<br>' +
@@ -396,13 +840,13 @@ def create_sector_allocation_chart(allocation_df: pd.DataFrame) -> go.Figure:
         )
         
         # 損益率棒グラフ
-        colors = ['green' if x > 0 else 'red' for x in allocation_df['pnl_percentage']]
+        colors = np.where(pnl_values > 0, 'green', 'red')
         fig.add_trace(
             go.Bar(
-                x=allocation_df[category_col],
-                y=allocation_df['pnl_percentage'],
+                x=categories,
+                y=pnl_values,
                 marker_color=colors,
-                text=allocation_df['pnl_percentage'].apply(lambda x: f"{x:.1f}%"),
+                text=_format_percent_labels(pnl_values),
                 textposition='auto',
                 hovertemplate='<b>%{x}</b><br>' +
                             '損益率: %{y:.1f}%<br>' +
@@ -428,6 +872,7 @@ def create_sector_allocation_chart(allocation_df: pd.DataFrame) -> go.Figure:
         return go.Figure()
 
 
+@_fig_cache
 def create_price_history_chart(
     historical_data: pd.DataFrame,
     normalize: bool = True
@@ -442,48 +887,76 @@ def create_price_history_chart(
     Returns:
         plotly.graph_objects.Figure: 価格履歴チャート
     """
+    go = _lazy_go()
     try:
         if historical_data.empty:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="データがありません",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
+            return _empty_figure()
         
-        fig = go.Figure()
-        
-        # データの準備
-        data_to_plot = historical_data.copy()
+        # データの準備（正規化時は div が新しいDataFrameを返すためコピー不要）
         if normalize:
             # 最初の値を100として正規化
-            data_to_plot = data_to_plot.div(data_to_plot.iloc[0]) * 100
-        
-        # 各銘柄の線を追加
-        for column in data_to_plot.columns:
-            fig.add_trace(go.Scatter(
-                x=data_to_plot.index,
-                y=data_to_plot[column],
-                mode='lines',
-                name=column,
-                hovertemplate='<b>%{fullData.name}</b><br>' +
-                            '日付: %{x}<br>' +
-                            f'{"正規化価格" if normalize else "価格"}: %{{y:.2f}}<br>' +
-                            '<extra></extra>'
-            ))
+            data_to_plot = historical_data.div(historical_data.iloc[0]) * 100
+        else:
+            data_to_plot = historical_data
+        
+        # 点数が多い場合はWebGL描画に切り替え
+        trace_type = _scatter_trace_type(data_to_plot.size)
+        
+        # インデックスと値配列は一度だけ取り出して各トレースで共有
+        # 日付はエポックミリ秒に変換し、Timestampの文字列化をJSONエンコード時に行わない
+        is_date_axis = pd.api.types.is_datetime64_any_dtype(data_to_plot.index)
+        index_values = _to_epoch_ms(data_to_plot.index)
+        if is_date_axis:
+            x_numeric = index_values
+        else:
+            x_numeric = np.arange(len(data_to_plot))
+        
+        hovertemplate = ('<b>%{fullData.name}</b><br>' +
+                         '日付: %{x}<br>' +
+                         f'{"正規化価格" if normalize else "価格"}: %{{y:.2f}}<br>' +
+                         '<extra></extra>')
+        
+        # 各銘柄の線を追加（長い系列はLTTBで間引き）
+        # トレースは検証コストの低いdict形式でまとめて構築
+        traces = []
+        # 表示は小数2桁のため float32 でJSONペイロードを半減
+        for column, y_values in zip(data_to_plot.columns, data_to_plot.to_numpy(dtype=np.float32).T):
+            x_values = index_values
+            if len(y_values) > LTTB_THRESHOLD:
+                positions = np.flatnonzero(~np.isnan(y_values))
+                if len(positions) > LTTB_THRESHOLD:
+                    keep = _lttb_indices(x_numeric[positions], y_values[positions], LTTB_THRESHOLD)
+                    # numbaが無く間引けない場合は全点をそのまま描画
+                    positions = positions[keep] if keep is not None else None
+                if positions is not None:
+                    x_values = index_values[positions]
+                    y_values = y_values[positions]
+            
+            traces.append({
+                'type': trace_type,
+                'x': x_values,
+                'y': y_values,
+                'mode': 'lines',
+                'name': column,
+                'hovertemplate': hovertemplate
+            })
         
         title = '価格推移（正規化）' if normalize else '価格推移'
         y_title = '正規化価格 (開始=100)' if normalize else '価格'
         
-        fig.update_layout(
+        layout = dict(
             title=title,
             xaxis_title='日付',
             yaxis_title=y_title,
             height=600,
-            hovermode='x unified'
+            hovermode=_hovermode_for(sum(len(trace['y']) for trace in traces))
         )
         
+        if is_date_axis:
+            layout['xaxis_type'] = 'date'
+        
+        fig = go.Figure(data=traces, layout=layout)
+        
         return fig
         
     except Exception as e:
@@ -503,73 +976,69 @@ def create_stock_line_chart(stock_data: pd.DataFrame, ticker: str, period: str =
     Returns:
         plotly.graph_objects.Figure: ラインチャート
     """
+    go = _lazy_go()
     try:
         if stock_data.empty:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="データがありません",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
+            return _empty_figure()
         
-        # 日付インデックスをリセット
-        stock_data_reset = stock_data.reset_index()
+        # X軸（日付）を一度だけ決定（reset_index によるDataFrameコピーを避ける）
+        if 'Date' in stock_data.columns:
+            x_axis = stock_data['Date'].to_numpy()
+        elif stock_data.index.name == 'Date' or isinstance(stock_data.index, pd.DatetimeIndex):
+            x_axis = stock_data.index.to_numpy()
+        else:
+            x_axis = np.arange(len(stock_data))
         
-        fig = go.Figure()
+        # 点数が多い場合はWebGL描画に切り替え
+        trace_type = _scatter_trace_type(len(stock_data))
         
+        # トレースは検証コストの低いdict形式でまとめて構築
         # 終値ライン
-        fig.add_trace(
-            go.Scatter(
-                x=stock_data_reset.index if 'Date' not in stock_data_reset.columns else stock_data_reset['Date'],
-                y=stock_data['Close'],
-                mode='lines',
-                name=f'{ticker} 終値',
-                line=dict(color='blue', width=2),
-                hovertemplate='<b>%{x}</b><br>終値: %{y:.2f}<extra></extra>'
-            )
-        )
+        traces = [{
+            'type': trace_type,
+            'x': x_axis,
+            'y': stock_data['Close'].to_numpy(),
+            'mode': 'lines',
+            'name': f'{ticker} 終値',
+            'line': dict(color='blue', width=2),
+            'hovertemplate': '<b>%{x}</b><br>終値: %{y:.2f}<extra></extra>'
+        }]
         
         # 移動平均線を追加（期間に応じて）
+        moving_averages = _fast_sma(stock_data['Close'].to_numpy(), [20, 50])
         if len(stock_data) >= 20:
-            ma20 = stock_data['Close'].rolling(window=20).mean()
-            fig.add_trace(
-                go.Scatter(
-                    x=stock_data_reset.index if 'Date' not in stock_data_reset.columns else stock_data_reset['Date'],
-                    y=ma20,
-                    mode='lines',
-                    name='20日移動平均',
-                    line=dict(color='orange', width=1, dash='dash'),
-                    hovertemplate='<b>%{x}</b><br>20日MA: %{y:.2f}<extra></extra>'
-                )
-            )
+            traces.append({
+                'type': trace_type,
+                'x': x_axis,
+                'y': moving_averages[20],
+                'mode': 'lines',
+                'name': '20日移動平均',
+                'line': dict(color='orange', width=1, dash='dash'),
+                'hovertemplate': '<b>%{x}</b><br>20日MA: %{y:.2f}<extra></extra>'
+            })
         
         if len(stock_data) >= 50:
-            ma50 = stock_data['Close'].rolling(window=50).mean()
-            fig.add_trace(
-                go.Scatter(
-                    x=stock_data_reset.index if 'Date' not in stock_data_reset.columns else stock_data_reset['Date'],
-                    y=ma50,
-                    mode='lines',
-                    name='50日移動平均',
-                    line=dict(color='red', width=1, dash='dot'),
-                    hovertemplate='<b>%{x}</b><br>50日MA: %{y:.2f}<extra></extra>'
-                )
-            )
-        
-        # レイアウト設定
-        fig.update_layout(
+            traces.append({
+                'type': trace_type,
+                'x': x_axis,
+                'y': moving_averages[50],
+                'mode': 'lines',
+                'name': '50日移動平均',
+                'line': dict(color='red', width=1, dash='dot'),
+                'hovertemplate': '<b>%{x}</b><br>50日MA: %{y:.2f}<extra></extra>'
+            })
+        
+        # レイアウト設定（グリッド表示を含む）
+        layout = dict(
             title=f'{ticker} 株価チャート ({period})',
-            xaxis_title='日付',
-            yaxis_title='株価',
+            xaxis=dict(title='日付', showgrid=True, gridwidth=1, gridcolor='lightgray'),
+            yaxis=dict(title='株価', showgrid=True, gridwidth=1, gridcolor='lightgray'),
             height=500,
             showlegend=True,
-            hovermode='x unified'
+            hovermode=_hovermode_for(len(traces) * len(stock_data))
         )
         
-        # グリッド表示
-        fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='lightgray')
-        fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='lightgray')
+        fig = go.Figure(data=traces, layout=layout)
         
         return fig
         
@@ -585,6 +1054,7 @@ def create_stock_line_chart(stock_data: pd.DataFrame, ticker: str, period: str =
         return fig
 
 
+@_fig_cache
 def create_stock_candlestick_chart(stock_data: pd.DataFrame, ticker: str) -> go.Figure:
     """
     株価ローソク足チャート
@@ -596,15 +1066,11 @@ def create_stock_candlestick_chart(stock_data: pd.DataFrame, ticker: str) -> go.
     Returns:
         plotly.graph_objects.Figure: ローソク足チャート
     """
+    go = _lazy_go()
+    make_subplots = _lazy_make_subplots()
     try:
         if stock_data.empty:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="データがありません",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
+            return _empty_figure()
         
         # サブプロットの作成（価格と出来高）
         fig = make_subplots(
@@ -615,14 +1081,24 @@ def create_stock_candlestick_chart(stock_data: pd.DataFrame, ticker: str) -> go.
             row_heights=[0.7, 0.3]
         )
         
+        # 各カラムを一度だけ配列として取り出し、全トレースで共有
+        # 日付はエポックミリ秒(int64)、OHLCは float32 に変換してJSONエンコードを軽くする
+        dates = _to_epoch_ms(stock_data['Date'])
+        open_values = stock_data['Open'].to_numpy(dtype=np.float32)
+        high_values = stock_data['High'].to_numpy(dtype=np.float32)
+        low_values = stock_data['Low'].to_numpy(dtype=np.float32)
+        close_raw = stock_data['Close'].to_numpy(dtype=np.float64)
+        close_values = close_raw.astype(np.float32)
+        volume_values = stock_data['Volume'].to_numpy()
+        
         # ローソク足チャート
         fig.add_trace(
             go.Candlestick(
-                x=stock_data['Date'],
-                open=stock_data['Open'],
-                high=stock_data['High'],
-                low=stock_data['Low'],
-                close=stock_data['Close'],
+                x=dates,
+                open=open_values,
+                high=high_values,
+                low=low_values,
+                close=close_values,
                 name='価格',
                 increasing_line_color='green',
                 decreasing_line_color='red'
@@ -631,11 +1107,12 @@ def create_stock_candlestick_chart(stock_data: pd.DataFrame, ticker: str) -> go.
         )
         
         # 移動平均線を追加（20日、50日）
+        moving_averages = _fast_sma(close_raw, [20, 50])
         if len(stock_data) >= 20:
-            ma20 = stock_data['Close'].rolling(window=20).mean()
+            ma20 = moving_averages[20]
             fig.add_trace(
                 go.Scatter(
-                    x=stock_data['Date'],
+                    x=dates,
                     y=ma20,
                     mode='lines',
                     name='MA20',
@@ -646,10 +1123,10 @@ def create_stock_candlestick_chart(stock_data: pd.DataFrame, ticker: str) -> go.
             )
         
         if len(stock_data) >= 50:
-            ma50 = stock_data['Close'].rolling(window=50).mean()
+            ma50 = moving_averages[50]
             fig.add_trace(
                 go.Scatter(
-                    x=stock_data['Date'],
+                    x=dates,
                     y=ma50,
                     mode='lines',
                     name='MA50',
@@ -660,13 +1137,12 @@ def create_stock_candlestick_chart(stock_data: pd.DataFrame, ticker: str) -> go.
             )
         
         # 出来高チャート
-        colors = ['green' if close >= open else 'red' 
-                 for close, open in zip(stock_data['Close'], stock_data['Open'])]
+        colors = np.where(close_values >= open_values, 'green', 'red')
         
         fig.add_trace(
             go.Bar(
-                x=stock_data['Date'],
-                y=stock_data['Volume'],
+                x=dates,
+                y=volume_values,
                 marker_color=colors,
                 name='出来高',
                 opacity=0.6
@@ -681,6 +1157,10 @@ def create_stock_candlestick_chart(stock_data: pd.DataFrame, ticker: str) -> go.
             showlegend=True
         )
         
+        # エポックミリ秒を日付として解釈させる
+        if np.issubdtype(dates.dtype, np.integer):
+            fig.update_xaxes(type='date')
+        
         # Y軸の設定
         fig.update_yaxes(title_text="価格", row=1, col=1)
         fig.update_yaxes(title_text="出来高", row=2, col=1)
@@ -703,15 +1183,10 @@ def create_news_sentiment_chart(sentiment_data: Dict) -> go.Figure:
     Returns:
         plotly.graph_objects.Figure: センチメントチャート
     """
+    go = _lazy_go()
     try:
         if not sentiment_data or sentiment_data.get('total', 0) == 0:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="データがありません",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
+            return _empty_figure()
         
         labels = ['ポジティブ', 'ネガティブ', 'ニュートラル']
         values = [
@@ -757,29 +1232,14 @@ def create_factor_beta_chart(factor_results: Dict[str, any]) -> go.Figure:
     Returns:
         plotly.graph_objects.Figure: ファクターベータチャート
     """
+    go = _lazy_go()
     try:
         if not factor_results or 'betas' not in factor_results:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="データがありません",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
+            return _empty_figure()
         
         betas = factor_results['betas']
         pvalues = factor_results.get('factor_pvalues', {})
         
-        # ファクター名の日本語化
-        factor_names_jp = {
-            'Mkt-RF': '市場プレミアム',
-            'SMB': '小型株プレミアム',
-            'HML': 'バリュープレミアム',
-            'RMW': '収益性プレミアム',
-            'CMA': '投資プレミアム',
-            'Mom': 'モメンタムプレミアム'
-        }
-        
         factors = list(betas.keys())
         beta_values = list(betas.values())
         
@@ -797,7 +1257,7 @@ def create_factor_beta_chart(factor_results: Dict[str, any]) -> go.Figure:
                 colors.append('lightgray')  # 非有意
         
         # 日本語ファクター名
-        factor_labels = [factor_names_jp.get(f, f) for f in factors]
+        factor_labels = [FACTOR_NAMES_JP.get(f, f) for f in factors]
         
         fig = go.Figure(data=[
             go.Bar(
@@ -850,57 +1310,36 @@ def create_rolling_beta_chart(rolling_betas: pd.DataFrame, period_label: str = N
     Returns:
         plotly.graph_objects.Figure: ローリングベータチャート
     """
+    go = _lazy_go()
     try:
         if rolling_betas.empty:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="データがありません",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
-        
-        # ファクター名の日本語化
-        factor_names_jp = {
-            'Mkt-RF': '市場プレミアム',
-            'SMB': '小型株プレミアム',
-            'HML': 'バリュープレミアム',
-            'RMW': '収益性プレミアム',
-            'CMA': '投資プレミアム',
-            'Mom': 'モメンタムプレミアム'
-        }
-        
-        fig = go.Figure()
-        
-        colors = ['blue', 'red', 'green', 'orange', 'purple', 'brown']
-        
-        for i, column in enumerate(rolling_betas.columns):
-            fig.add_trace(go.Scatter(
-                x=rolling_betas.index,
-                y=rolling_betas[column],
-                mode='lines',
-                name=factor_names_jp.get(column, column),
-                line=dict(color=colors[i % len(colors)], width=2),
-                hovertemplate='<b>%{fullData.name}</b><br>' +
-                            '日付: %{x}<br>' +
-                            'ベータ: %{y:.3f}<br>' +
-                            '<extra></extra>'
-            ))
+            return _empty_figure()
+        
+        # 日付はエポックミリ秒に変換し、全トレースで共有
+        is_date_axis = pd.api.types.is_datetime64_any_dtype(rolling_betas.index)
+        dates = _to_epoch_ms(rolling_betas.index)
+        
+        # トレースは検証コストの低いdict形式でまとめて構築
+        traces = []
+        for i, (column, beta_values) in enumerate(zip(rolling_betas.columns, rolling_betas.to_numpy().T)):
+            traces.append({
+                'type': 'scatter',
+                'x': dates,
+                'y': beta_values,
+                'mode': 'lines',
+                'name': FACTOR_NAMES_JP.get(column, column),
+                'line': dict(color=FACTOR_COLOR_PALETTE[i % len(FACTOR_COLOR_PALETTE)], width=2),
+                'hovertemplate': '<b>%{fullData.name}</b><br>' +
+                                 '日付: %{x}<br>' +
+                                 'ベータ: %{y:.3f}<br>' +
+                                 '<extra></extra>'
+            })
         
         # タイトルに期間情報を含める
         title = 'ローリングファクターベータ（1ヶ月窓）'
         if period_label:
             # 期間ラベルの日本語化
-            period_labels_jp = {
-                '1mo': '1ヶ月',
-                '3mo': '3ヶ月', 
-                '6mo': '6ヶ月',
-                'ytd': '年初来',
-                '1y': '1年',
-                '2y': '2年',
-                '5y': '5年'
-            }
-            period_jp = period_labels_jp.get(period_label, period_label)
+            period_jp = PERIOD_LABELS_JP.get(period_label, period_label)
             title = f'ローリングファクターベータ（{period_jp}間・1ヶ月窓）'
             
             # データの実際の期間も表示
@@ -909,12 +1348,12 @@ def create_rolling_beta_chart(rolling_betas: pd.DataFrame, period_label: str = N
                 end_date = rolling_betas.index.max().strftime('%Y/%m') if hasattr(rolling_betas.index, 'strftime') else str(rolling_betas.index.max())
                 title += f'<br><sub>{start_date} ～ {end_date}</sub>'
         
-        fig.update_layout(
+        layout = dict(
             title=title,
             xaxis_title='日付',
             yaxis_title='ベータ',
             height=600,
-            hovermode='x unified',
+            hovermode=_hovermode_for(rolling_betas.size),
             legend=dict(
                 yanchor="top",
                 y=0.99,
@@ -923,6 +1362,11 @@ def create_rolling_beta_chart(rolling_betas: pd.DataFrame, period_label: str = N
             )
         )
         
+        if is_date_axis:
+            layout['xaxis_type'] = 'date'
+        
+        fig = go.Figure(data=traces, layout=layout)
+        
         # ゼロラインを追加
         fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.5)
         
@@ -933,6 +1377,7 @@ def create_rolling_beta_chart(rolling_betas: pd.DataFrame, period_label: str = N
         return go.Figure()
 
 
+@_fig_cache
 def create_factor_contribution_chart(contributions: pd.DataFrame, period_label: str = None) -> go.Figure:
     """
     ファクター寄与度累積チャート
@@ -944,61 +1389,40 @@ def create_factor_contribution_chart(contributions: pd.DataFrame, period_label:
     Returns:
         plotly.graph_objects.Figure: ファクター寄与度チャート
     """
+    go = _lazy_go()
     try:
         if contributions.empty:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="データがありません",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
-        
-        # 累積寄与度を計算
-        cumulative_contributions = contributions.cumsum()
-        
-        # ファクター名の日本語化
-        factor_names_jp = {
-            'Mkt-RF': '市場プレミアム',
-            'SMB': '小型株プレミアム',
-            'HML': 'バリュープレミアム',
-            'RMW': '収益性プレミアム',
-            'CMA': '投資プレミアム',
-            'Mom': 'モメンタムプレミアム'
-        }
-        
-        fig = go.Figure()
-        
-        colors = ['blue', 'red', 'green', 'orange', 'purple', 'brown']
-        
-        for i, column in enumerate(cumulative_contributions.columns):
-            fig.add_trace(go.Scatter(
-                x=cumulative_contributions.index,
-                y=cumulative_contributions[column] * 100,  # パーセント表示
-                mode='lines',
-                name=factor_names_jp.get(column, column),
-                line=dict(color=colors[i % len(colors)], width=2),
-                fill='tonexty' if i > 0 else None,
-                hovertemplate='<b>%{fullData.name}</b><br>' +
-                            '日付: %{x}<br>' +
-                            '累積寄与: %{y:.2f}%<br>' +
-                            '<extra></extra>'
-            ))
+            return _empty_figure()
+        
+        # 累積寄与度を計算（パーセント換算済みの連続配列として一度だけ作成）
+        # 表示は小数2桁のため float32 で十分
+        cumulative_pct = (contributions.cumsum().to_numpy(dtype=np.float64) * 100.0).astype(np.float32)
+        # 日付はエポックミリ秒に変換し、全トレースで共有
+        is_date_axis = pd.api.types.is_datetime64_any_dtype(contributions.index)
+        dates = _to_epoch_ms(contributions.index)
+        
+        # トレースは検証コストの低いdict形式でまとめて構築
+        traces = []
+        for i, column in enumerate(contributions.columns):
+            traces.append({
+                'type': 'scatter',
+                'x': dates,
+                'y': cumulative_pct[:, i],  # パーセント表示
+                'mode': 'lines',
+                'name': FACTOR_NAMES_JP.get(column, column),
+                'line': dict(color=FACTOR_COLOR_PALETTE[i % len(FACTOR_COLOR_PALETTE)], width=2),
+                'fill': 'tonexty' if i > 0 else None,
+                'hovertemplate': '<b>%{fullData.name}</b><br>' +
+                                 '日付: %{x}<br>' +
+                                 '累積寄与: %{y:.2f}%<br>' +
+                                 '<extra></extra>'
+            })
         
         # タイトルに期間情報を含める
         title = 'ファクター累積寄与度'
         if period_label:
             # 期間ラベルの日本語化
-            period_labels_jp = {
-                '1mo': '1ヶ月',
-                '3mo': '3ヶ月', 
-                '6mo': '6ヶ月',
-                'ytd': '年初来',
-                '1y': '1年',
-                '2y': '2年',
-                '5y': '5年'
-            }
-            period_jp = period_labels_jp.get(period_label, period_label)
+            period_jp = PERIOD_LABELS_JP.get(period_label, period_label)
             title = f'ファクター累積寄与度（{period_jp}間）'
             
             # データの実際の期間も表示
@@ -1007,12 +1431,12 @@ def create_factor_contribution_chart(contributions: pd.DataFrame, period_label:
                 end_date = contributions.index.max().strftime('%Y/%m') if hasattr(contributions.index, 'strftime') else str(contributions.index.max())
                 title += f'<br><sub>{start_date} ～ {end_date}</sub>'
         
-        fig.update_layout(
+        layout = dict(
             title=title,
             xaxis_title='日付',
             yaxis_title='累積寄与度（%）',
             height=600,
-            hovermode='x unified',
+            hovermode=_hovermode_for(cumulative_pct.size),
             legend=dict(
                 yanchor="top",
                 y=0.99,
@@ -1021,6 +1445,11 @@ def create_factor_contribution_chart(contributions: pd.DataFrame, period_label:
             )
         )
         
+        if is_date_axis:
+            layout['xaxis_type'] = 'date'
+        
+        fig = go.Figure(data=traces, layout=layout)
+        
         # ゼロラインを追加
         fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.5)
         
@@ -1028,4 +1457,101 @@ def create_factor_contribution_chart(contributions: pd.DataFrame, period_label:
         
     except Exception as e:
         logger.error(f"ファクター寄与度チャート作成エラー: {str(e)}")
-        return go.Figure()
\ No newline at end of file
+        return go.Figure()
+
+
+def build_dashboard_figures(
+    pnl_df: Optional[pd.DataFrame] = None,
+    correlation_matrix: Optional[pd.DataFrame] = None,
+    historical_data: Optional[pd.DataFrame] = None,
+    risk_data: Optional[Dict[str, any]] = None,
+    summary: Optional[Dict[str, float]] = None
+) -> Dict[str, go.Figure]:
+    """
+    互いに独立したダッシュボード用チャートをスレッドプールで並列生成
+    
+    Args:
+        pnl_df: 損益計算結果DataFrame（損益チャート・配分円グラフ）
+        correlation_matrix: 相関行列DataFrame
+        historical_data: 過去価格データ
+        risk_data: リスク寄与度データ
+        summary: ポートフォリオサマリー
+    
+    Returns:
+        Dict[str, go.Figure]: 'pnl', 'alloc', 'corr', 'hist', 'risk', 'summary' のうち
+        入力が与えられたチャートのみを含む辞書
+    """
+    tasks = {}
+    if pnl_df is not None:
+        tasks['pnl'] = (create_pnl_chart, pnl_df)
+        tasks['alloc'] = (create_allocation_pie, pnl_df)
+    if correlation_matrix is not None:
+        tasks['corr'] = (create_correlation_heatmap, correlation_matrix)
+    if historical_data is not None:
+        tasks['hist'] = (create_price_history_chart, historical_data)
+    if risk_data is not None:
+        tasks['risk'] = (create_risk_contribution_chart, risk_data)
+    if summary is not None:
+        tasks['summary'] = (create_performance_summary_chart, summary)
+    
+    if not tasks:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(DASHBOARD_MAX_WORKERS, len(tasks))) as executor:
+        futures = {key: executor.submit(func, arg) for key, (func, arg) in tasks.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+
+def create_price_history_chart_json(historical_data: pd.DataFrame, normalize: bool = True) -> str:
+    """
+    価格履歴チャート（シリアライズ済みJSON）
+    
+    Args:
+        historical_data: 過去価格データ
+        normalize: 正規化するかどうか
+    
+    Returns:
+        str: Figure JSON
+    """
+    return create_price_history_chart.json(historical_data, normalize)
+
+
+def create_correlation_heatmap_json(correlation_matrix: pd.DataFrame) -> str:
+    """
+    相関行列ヒートマップ（シリアライズ済みJSON）
+    
+    Args:
+        correlation_matrix: 相関行列DataFrame
+    
+    Returns:
+        str: Figure JSON
+    """
+    return create_correlation_heatmap.json(correlation_matrix)
+
+
+def create_stock_candlestick_chart_json(stock_data: pd.DataFrame, ticker: str) -> str:
+    """
+    株価ローソク足チャート（シリアライズ済みJSON）
+    
+    Args:
+        stock_data: 株価OHLCV データ
+        ticker: ティッカーシンボル
+    
+    Returns:
+        str: Figure JSON
+    """
+    return create_stock_candlestick_chart.json(stock_data, ticker)
+
+
+def create_factor_contribution_chart_json(contributions: pd.DataFrame, period_label: str = None) -> str:
+    """
+    ファクター寄与度累積チャート（シリアライズ済みJSON）
+    
+    Args:
+        contributions: ファクター寄与度データ
+        period_label: 期間ラベル（例：「1y」「3mo」など）
+    
+    Returns:
+        str: Figure JSON
+    """
+    return create_factor_contribution_chart.json(contributions, period_label)
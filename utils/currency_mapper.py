@@ -3,12 +3,200 @@
 ティッカーシンボルから通貨を判定する機能
 """
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
+import functools
 import logging
+import re
+
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# ティッカーに使用できる文字（英数字、ドット、ハイフンのみ）
+TICKER_PATTERN = re.compile(r'^[A-Za-z0-9.\-]+$')
+
+
+# 取引所サフィックス（最後のドット以降）と上場通貨の対応表
+TICKER_SUFFIX_CURRENCY = {
+    # 日本
+    'T': 'JPY', 'JP': 'JPY', 'OS': 'JPY', 'TS': 'JPY',
+    # 欧州（オランダ・フランス・ドイツ・イタリア・スペイン・オーストリア・ベルギー・ポルトガル・フィンランド・アイスランド）
+    'AS': 'EUR', 'PA': 'EUR', 'DE': 'EUR', 'MI': 'EUR', 'MC': 'EUR',
+    'VI': 'EUR', 'BR': 'EUR', 'LS': 'EUR', 'HE': 'EUR', 'IC': 'EUR',
+    # 英国
+    'L': 'GBP', 'LON': 'GBP',
+    # スイス
+    'SW': 'CHF', 'VX': 'CHF',
+    # カナダ
+    'TO': 'CAD', 'V': 'CAD', 'CN': 'CAD',
+    # オーストラリア
+    'AX': 'AUD',
+    # 香港
+    'HK': 'HKD',
+    # シンガポール
+    'SI': 'SGD',
+    # 中国
+    'SS': 'CNY', 'SZ': 'CNY',
+    # 韓国
+    'KS': 'KRW', 'KQ': 'KRW',
+    # インド
+    'NS': 'INR', 'BO': 'INR',
+    # ブラジル
+    'SA': 'BRL',
+    # メキシコ
+    'MX': 'MXN',
+    # 南アフリカ
+    'JO': 'ZAR',
+    # ロシア
+    'ME': 'RUB',
+    # トルコ
+    'IS': 'TRY'
+}
+
+# 取引所サフィックスと市場名の対応表
+TICKER_SUFFIX_MARKET = {
+    'T': '東京証券取引所',
+    'TS': '東京証券取引所',
+    'JP': '日本（JASDAQ）',
+    'OS': '大阪証券取引所',
+    'AS': 'ユーロネクスト・アムステルダム',
+    'PA': 'ユーロネクスト・パリ',
+    'DE': 'フランクフルト証券取引所',
+    'MI': 'ボルサ・イタリアーナ',
+    'MC': 'マドリッド証券取引所',
+    'VI': 'ウィーン証券取引所',
+    'LS': 'ユーロネクスト・リスボン',
+    'L': 'ロンドン証券取引所',
+    'LON': 'ロンドン証券取引所',
+    'SW': 'スイス証券取引所',
+    'VX': 'スイス証券取引所',
+    'TO': 'トロント証券取引所',
+    'V': 'TSXベンチャー取引所',
+    'AX': 'オーストラリア証券取引所',
+    'HK': '香港証券取引所',
+    'SI': 'シンガポール証券取引所',
+    'SS': '上海証券取引所',
+    'SZ': '深圳証券取引所',
+    'KS': '韓国証券取引所',
+    'NS': 'インド国立証券取引所',
+    'BO': 'ボンベイ証券取引所'
+}
+
+# 通貨と国名の対応表
+CURRENCY_COUNTRY = {
+    'JPY': '日本',
+    'USD': 'アメリカ',
+    'EUR': 'ユーロ圏',
+    'GBP': 'イギリス',
+    'CHF': 'スイス',
+    'CAD': 'カナダ',
+    'AUD': 'オーストラリア',
+    'HKD': '香港',
+    'SGD': 'シンガポール',
+    'CNY': '中国',
+    'KRW': '韓国',
+    'INR': 'インド'
+}
+
+# サフィックスなし・未知サフィックスの場合の (通貨, 市場, 国)
+DEFAULT_MARKET_INFO = ('USD', 'NASDAQ/NYSE', 'アメリカ')
+
+# サフィックス -> (通貨, 市場, 国) を一度だけ組み立てておく
+TICKER_SUFFIX_INFO = {
+    suffix: (
+        currency,
+        TICKER_SUFFIX_MARKET.get(suffix, DEFAULT_MARKET_INFO[1]),
+        CURRENCY_COUNTRY.get(currency, 'その他')
+    )
+    for suffix, currency in TICKER_SUFFIX_CURRENCY.items()
+}
+
+
+# 逆順サフィックストライの葉（通貨コード）を示すキー
+_TRIE_LEAF = '$'
+
+
+def _build_reverse_suffix_trie(suffix_table: Dict[str, str]) -> Dict[str, dict]:
+    """
+    サフィックス対応表から、ティッカー末尾から1文字ずつ辿る逆順トライを構築
+    
+    Args:
+        suffix_table: サフィックス -> 通貨コードの対応表
+    
+    Returns:
+        Dict[str, dict]: 入れ子辞書によるトライ（'.' の次のノードに通貨コードを格納）
+    """
+    root: Dict[str, dict] = {}
+    for suffix, currency in suffix_table.items():
+        node = root
+        for ch in reversed('.' + suffix):
+            node = node.setdefault(ch, {})
+        node[_TRIE_LEAF] = currency
+    return root
+
+
+# ティッカー末尾から辿るサフィックストライ（インポート時に一度だけ構築）
+_REVERSE_SUFFIX_TRIE = _build_reverse_suffix_trie(TICKER_SUFFIX_CURRENCY)
+
 
+# サポート通貨（呼び出しごとにリストを組み立てないよう不変タプルで保持）
+SUPPORTED_CURRENCIES = (
+    'USD',  # 米ドル
+    'JPY',  # 日本円
+    'EUR',  # ユーロ
+    'GBP',  # 英ポンド
+    'CHF',  # スイスフラン
+    'CAD',  # カナダドル
+    'AUD',  # オーストラリアドル
+    'HKD',  # 香港ドル
+    'SGD',  # シンガポールドル
+    'CNY',  # 中国元
+    'KRW',  # 韓国ウォン
+    'INR',  # インドルピー
+    'BRL',  # ブラジルレアル
+    'MXN',  # メキシコペソ
+    'ZAR',  # 南アフリカランド
+    'RUB',  # ロシアルーブル
+    'TRY'   # トルコリラ
+)
+
+# 為替レート取得用の通貨ペア（読み取り専用ビューとして共有）
+CURRENCY_EXCHANGE_PAIRS = MappingProxyType({
+    'USD': 'USDJPY=X',
+    'EUR': 'EURJPY=X',
+    'GBP': 'GBPJPY=X',
+    'CHF': 'CHFJPY=X',
+    'CAD': 'CADJPY=X',
+    'AUD': 'AUDJPY=X',
+    'HKD': 'HKDJPY=X',
+    'SGD': 'SGDJPY=X',
+    'CNY': 'CNYJPY=X',
+    'KRW': 'KRWJPY=X'
+})
+
+# フォールバック用の概算為替レート（対JPY、読み取り専用ビューとして共有）
+FALLBACK_EXCHANGE_RATES = MappingProxyType({
+    'USD': 150.0,   # 1 USD = 150 JPY
+    'EUR': 160.0,   # 1 EUR = 160 JPY
+    'GBP': 180.0,   # 1 GBP = 180 JPY
+    'CHF': 165.0,   # 1 CHF = 165 JPY
+    'CAD': 110.0,   # 1 CAD = 110 JPY
+    'AUD': 100.0,   # 1 AUD = 100 JPY
+    'HKD': 19.0,    # 1 HKD = 19 JPY
+    'SGD': 110.0,   # 1 SGD = 110 JPY
+    'CNY': 21.0,    # 1 CNY = 21 JPY
+    'KRW': 0.11,    # 1 KRW = 0.11 JPY
+    'INR': 1.8,     # 1 INR = 1.8 JPY
+    'BRL': 30.0,    # 1 BRL = 30 JPY
+    'MXN': 8.5,     # 1 MXN = 8.5 JPY
+    'ZAR': 8.0,     # 1 ZAR = 8.0 JPY
+    'RUB': 1.6,     # 1 RUB = 1.6 JPY
+    'TRY': 4.5      # 1 TRY = 4.5 JPY
+})
+
+
+@functools.lru_cache(maxsize=4096)
 def get_currency_from_ticker(ticker: str) -> str:
     """
     ティッカーシンボルから上場通貨を判定
@@ -19,92 +207,16 @@ def get_currency_from_ticker(ticker: str) -> str:
     Returns:
         str: 通貨コード（USD, JPY, EUR等）
     """
-    ticker = ticker.upper().strip()
-    
-    # 日本株の判定
-    japanese_suffixes = ['.T', '.JP', '.OS', '.TS']
-    if any(suffix in ticker for suffix in japanese_suffixes):
-        return 'JPY'
-    
-    # 欧州株の判定
-    european_mappings = {
-        '.AS': 'EUR',  # オランダ（アムステルダム）
-        '.PA': 'EUR',  # フランス（パリ）
-        '.DE': 'EUR',  # ドイツ（フランクフルト）
-        '.MI': 'EUR',  # イタリア（ミラノ）
-        '.MC': 'EUR',  # スペイン（マドリード）
-        '.VI': 'EUR',  # オーストリア（ウィーン）
-        '.BR': 'EUR',  # ベルギー（ブリュッセル）
-        '.LS': 'EUR',  # ポルトガル（リスボン）
-        '.HE': 'EUR',  # フィンランド（ヘルシンキ）
-        '.IC': 'EUR',  # アイスランド
-    }
-    
-    for suffix, currency in european_mappings.items():
-        if suffix in ticker:
-            return currency
-    
-    # 英国株の判定
-    uk_suffixes = ['.L', '.LON']
-    if any(suffix in ticker for suffix in uk_suffixes):
-        return 'GBP'
-    
-    # スイス株の判定
-    if '.SW' in ticker or '.VX' in ticker:
-        return 'CHF'
-    
-    # カナダ株の判定
-    canadian_suffixes = ['.TO', '.V', '.CN']
-    if any(suffix in ticker for suffix in canadian_suffixes):
-        return 'CAD'
-    
-    # オーストラリア株の判定
-    if '.AX' in ticker:
-        return 'AUD'
-    
-    # 香港株の判定
-    if '.HK' in ticker:
-        return 'HKD'
-    
-    # シンガポール株の判定
-    if '.SI' in ticker:
-        return 'SGD'
-    
-    # 中国株の判定
-    chinese_suffixes = ['.SS', '.SZ']
-    if any(suffix in ticker for suffix in chinese_suffixes):
-        return 'CNY'
-    
-    # 韓国株の判定
-    if '.KS' in ticker or '.KQ' in ticker:
-        return 'KRW'
-    
-    # インド株の判定
-    indian_suffixes = ['.NS', '.BO']
-    if any(suffix in ticker for suffix in indian_suffixes):
-        return 'INR'
-    
-    # ブラジル株の判定
-    if '.SA' in ticker:
-        return 'BRL'
-    
-    # メキシコ株の判定
-    if '.MX' in ticker:
-        return 'MXN'
-    
-    # 南アフリカ株の判定
-    if '.JO' in ticker:
-        return 'ZAR'
-    
-    # ロシア株の判定
-    if '.ME' in ticker:
-        return 'RUB'
-    
-    # トルコ株の判定
-    if '.IS' in ticker:
-        return 'TRY'
+    # 末尾から1文字ずつトライを辿り、最後のドットに到達した時点で通貨が確定する
+    node = _REVERSE_SUFFIX_TRIE
+    for ch in reversed(ticker.upper().strip()):
+        node = node.get(ch)
+        if node is None:
+            break
+        if ch == '.':
+            return node.get(_TRIE_LEAF, 'USD')
     
-    # デフォルトは米国株（USD）
+    # サフィックスなし・未知サフィックスの場合は米国株（USD）
     return 'USD'
 
 
@@ -118,91 +230,53 @@ def get_currency_mapping(tickers: List[str]) -> Dict[str, str]:
     Returns:
         Dict[str, str]: ティッカーをキーとした通貨辞書
     """
-    currency_mapping = {}
+    tickers = list(tickers)
+    if not tickers:
+        return {}
     
-    for ticker in tickers:
-        currency = get_currency_from_ticker(ticker)
-        currency_mapping[ticker] = currency
-        logger.debug(f"通貨判定: {ticker} -> {currency}")
+    # サフィックス抽出と通貨対応表の参照をpandasの文字列演算で一括処理
+    normalized = pd.Series(tickers, dtype='string').str.upper().str.strip()
+    suffixes = normalized.str.rpartition('.')[2].where(normalized.str.contains('.', regex=False), '')
+    currencies = suffixes.map(TICKER_SUFFIX_CURRENCY).fillna('USD').astype(object)
     
-    logger.info(f"通貨マッピング作成完了: {len(currency_mapping)}銘柄")
+    currency_mapping = dict(zip(tickers, currencies))
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        for ticker, currency in currency_mapping.items():
+            logger.debug("通貨判定: %s -> %s", ticker, currency)
+    
+    logger.info("通貨マッピング作成完了: %d銘柄", len(currency_mapping))
     return currency_mapping
 
 
-def get_supported_currencies() -> List[str]:
+def get_supported_currencies() -> Tuple[str, ...]:
     """
     サポートされている通貨のリストを取得
     
     Returns:
-        List[str]: サポート通貨リスト
+        Tuple[str, ...]: サポート通貨タプル（変更が必要な場合は list() で複製）
     """
-    return [
-        'USD',  # 米ドル
-        'JPY',  # 日本円
-        'EUR',  # ユーロ
-        'GBP',  # 英ポンド
-        'CHF',  # スイスフラン
-        'CAD',  # カナダドル
-        'AUD',  # オーストラリアドル
-        'HKD',  # 香港ドル
-        'SGD',  # シンガポールドル
-        'CNY',  # 中国元
-        'KRW',  # 韓国ウォン
-        'INR',  # インドルピー
-        'BRL',  # ブラジルレアル
-        'MXN',  # メキシコペソ
-        'ZAR',  # 南アフリカランド
-        'RUB',  # ロシアルーブル
-        'TRY'   # トルコリラ
-    ]
-
-
-def get_currency_exchange_pairs() -> Dict[str, str]:
+    return SUPPORTED_CURRENCIES
+
+
+def get_currency_exchange_pairs() -> Mapping[str, str]:
     """
     為替レート取得用のペア定義
     
     Returns:
-        Dict[str, str]: 通貨ペア辞書
+        Mapping[str, str]: 通貨ペア辞書（読み取り専用、変更が必要な場合は dict() で複製）
     """
-    return {
-        'USD': 'USDJPY=X',
-        'EUR': 'EURJPY=X',
-        'GBP': 'GBPJPY=X',
-        'CHF': 'CHFJPY=X',
-        'CAD': 'CADJPY=X',
-        'AUD': 'AUDJPY=X',
-        'HKD': 'HKDJPY=X',
-        'SGD': 'SGDJPY=X',
-        'CNY': 'CNYJPY=X',
-        'KRW': 'KRWJPY=X'
-    }
+    return CURRENCY_EXCHANGE_PAIRS
 
 
-def get_fallback_exchange_rates() -> Dict[str, float]:
+def get_fallback_exchange_rates() -> Mapping[str, float]:
     """
     フォールバック用の概算為替レート
     
     Returns:
-        Dict[str, float]: 概算レート辞書（対JPY）
+        Mapping[str, float]: 概算レート辞書（対JPY、読み取り専用、変更が必要な場合は dict() で複製）
     """
-    return {
-        'USD': 150.0,   # 1 USD = 150 JPY
-        'EUR': 160.0,   # 1 EUR = 160 JPY
-        'GBP': 180.0,   # 1 GBP = 180 JPY
-        'CHF': 165.0,   # 1 CHF = 165 JPY
-        'CAD': 110.0,   # 1 CAD = 110 JPY
-        'AUD': 100.0,   # 1 AUD = 100 JPY
-        'HKD': 19.0,    # 1 HKD = 19 JPY
-        'SGD': 110.0,   # 1 SGD = 110 JPY
-        'CNY': 21.0,    # 1 CNY = 21 JPY
-        'KRW': 0.11,    # 1 KRW = 0.11 JPY
-        'INR': 1.8,     # 1 INR = 1.8 JPY
-        'BRL': 30.0,    # 1 BRL = 30 JPY
-        'MXN': 8.5,     # 1 MXN = 8.5 JPY
-        'ZAR': 8.0,     # 1 ZAR = 8.0 JPY
-        'RUB': 1.6,     # 1 RUB = 1.6 JPY
-        'TRY': 4.5      # 1 TRY = 4.5 JPY
-    }
+    return FALLBACK_EXCHANGE_RATES
 
 
 def validate_ticker_format(ticker: str) -> bool:
@@ -218,6 +292,20 @@ def validate_ticker_format(ticker: str) -> bool:
     if not ticker or not isinstance(ticker, str):
         return False
     
+    return _is_valid_ticker_text(ticker)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_valid_ticker_text(ticker: str) -> bool:
+    """
+    文字列ティッカーの形式検証本体（結果をキャッシュ）
+    
+    Args:
+        ticker: ティッカーシンボル（str）
+    
+    Returns:
+        bool: 有効な形式かどうか
+    """
     ticker = ticker.strip()
     
     # 空文字チェック
@@ -229,11 +317,7 @@ def validate_ticker_format(ticker: str) -> bool:
         return False
     
     # 基本的な文字チェック（英数字、ドット、ハイフンのみ）
-    import re
-    if not re.match(r'^[A-Za-z0-9.\-]+$', ticker):
-        return False
-    
-    return True
+    return TICKER_PATTERN.match(ticker) is not None
 
 
 def get_market_info(ticker: str) -> Dict[str, str]:
@@ -246,60 +330,29 @@ def get_market_info(ticker: str) -> Dict[str, str]:
     Returns:
         Dict[str, str]: 市場情報
     """
-    ticker = ticker.upper().strip()
-    currency = get_currency_from_ticker(ticker)
-    
-    # 市場判定
-    market_mappings = {
-        '.T': '東京証券取引所',
-        '.JP': '日本（JASDAQ）',
-        '.OS': '大阪証券取引所',
-        '.AS': 'ユーロネクスト・アムステルダム',
-        '.PA': 'ユーロネクスト・パリ',
-        '.DE': 'フランクフルト証券取引所',
-        '.MI': 'ボルサ・イタリアーナ',
-        '.MC': 'マドリッド証券取引所',
-        '.L': 'ロンドン証券取引所',
-        '.SW': 'スイス証券取引所',
-        '.TO': 'トロント証券取引所',
-        '.V': 'TSXベンチャー取引所',
-        '.AX': 'オーストラリア証券取引所',
-        '.HK': '香港証券取引所',
-        '.SI': 'シンガポール証券取引所',
-        '.SS': '上海証券取引所',
-        '.SZ': '深圳証券取引所',
-        '.KS': '韓国証券取引所',
-        '.NS': 'インド国立証券取引所',
-        '.BO': 'ボンベイ証券取引所'
-    }
+    # キャッシュ済みの辞書を呼び出し側で変更されないよう複製して返す
+    return dict(_lookup_market_info(ticker))
+
+
+@functools.lru_cache(maxsize=4096)
+def _lookup_market_info(ticker: str) -> Dict[str, str]:
+    """
+    市場情報判定の本体（結果をキャッシュ）
     
-    market = 'NASDAQ/NYSE'  # デフォルト
-    for suffix, market_name in market_mappings.items():
-        if suffix in ticker:
-            market = market_name
-            break
+    Args:
+        ticker: ティッカーシンボル
     
-    # 国判定
-    country_mappings = {
-        'JPY': '日本',
-        'USD': 'アメリカ',
-        'EUR': 'ユーロ圏',
-        'GBP': 'イギリス',
-        'CHF': 'スイス',
-        'CAD': 'カナダ',
-        'AUD': 'オーストラリア',
-        'HKD': '香港',
-        'SGD': 'シンガポール',
-        'CNY': '中国',
-        'KRW': '韓国',
-        'INR': 'インド'
-    }
+    Returns:
+        Dict[str, str]: 市場情報
+    """
+    ticker = ticker.upper().strip()
+    head, dot, suffix = ticker.rpartition('.')
     
-    country = country_mappings.get(currency, 'その他')
+    currency, market, country = TICKER_SUFFIX_INFO.get(suffix, DEFAULT_MARKET_INFO) if dot else DEFAULT_MARKET_INFO
     
     return {
         'ticker': ticker,
         'currency': currency,
         'market': market,
         'country': country
-    }
\ No newline at end of file
+    }
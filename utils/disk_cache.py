@@ -0,0 +1,121 @@
+"""
+ディスクキャッシュユーティリティ
+取得済みデータ（dict / DataFrame）をpickleで永続化し、期限切れファイルを削除する機能
+"""
+
+from pathlib import Path
+from typing import Optional, Tuple, Union
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# キャッシュファイルの拡張子（一時ファイルは「.pkl.<pid>.<thread>.tmp」）
+CACHE_FILE_SUFFIX = ".pkl"
+
+
+def cache_file_path(cache_dir: Path, name: str, key_parts: Tuple[str, ...]) -> Path:
+    """
+    キャッシュファイルのパスを生成（同じキーは常に同じファイルを上書きする）
+    
+    Args:
+        cache_dir: キャッシュディレクトリ
+        name: キャッシュ名（ファイル名の接頭辞）
+        key_parts: キャッシュキーを構成する文字列
+    
+    Returns:
+        Path: キャッシュファイルのパス
+    """
+    digest = hashlib.sha1("|".join(key_parts).encode('utf-8')).hexdigest()[:16]
+    return cache_dir / f"{name}_{digest}{CACHE_FILE_SUFFIX}"
+
+
+def load_pickle_cache(cache_path: Path, max_age: float) -> Optional[Union[dict, pd.DataFrame]]:
+    """
+    キャッシュファイルを読み込む（未保存・期限切れ・空データならNone）
+    
+    Args:
+        cache_path: キャッシュファイルのパス
+        max_age: 有効期間（秒、ファイルの更新時刻から判定）
+    
+    Returns:
+        Optional[Union[dict, pd.DataFrame]]: キャッシュ済みデータ
+    """
+    try:
+        if not cache_path.exists():
+            return None
+        
+        if time.time() - cache_path.stat().st_mtime > max_age:
+            return None
+        
+        with open(cache_path, 'rb') as f:
+            value = pickle.load(f)
+        if isinstance(value, (dict, pd.DataFrame)) and len(value) > 0:
+            logger.info(f"📁 ディスクキャッシュから取得: {cache_path.name} ({len(value)}件)")
+            return value
+    except Exception as e:
+        logger.warning(f"ディスクキャッシュ読み込みエラー ({cache_path.name}): {str(e)}")
+    
+    return None
+
+
+def save_pickle_cache(cache_path: Path, value: Union[dict, pd.DataFrame], max_age: float):
+    """
+    キャッシュファイルに保存し（一時ファイル経由で置き換え）、同じディレクトリの期限切れファイルを削除
+    
+    Args:
+        cache_path: キャッシュファイルのパス
+        value: 保存するデータ（空の場合は保存しない）
+        max_age: 有効期間（秒、これより古いファイルを削除）
+    """
+    if len(value) == 0:
+        return
+    
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        logger.info(f"📁 ディスクキャッシュに保存: {cache_path.name}")
+    except Exception as e:
+        logger.warning(f"ディスクキャッシュ保存エラー ({cache_path.name}): {str(e)}")
+        return
+    
+    prune_pickle_cache(cache_path.parent, max_age)
+
+
+def prune_pickle_cache(cache_dir: Path, max_age: float) -> int:
+    """
+    期限切れのキャッシュファイル（中断で残った一時ファイルを含む）を削除
+    
+    Args:
+        cache_dir: キャッシュディレクトリ
+        max_age: 有効期間（秒）
+    
+    Returns:
+        int: 削除したファイル数
+    """
+    removed = 0
+    now = time.time()
+    try:
+        for path in cache_dir.glob(f"*{CACHE_FILE_SUFFIX}*"):
+            try:
+                if now - path.stat().st_mtime > max_age:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                # 他スレッド・他プロセスが同時に削除・置き換えた場合
+                continue
+    except Exception as e:
+        logger.warning(f"ディスクキャッシュ削除エラー ({cache_dir}): {str(e)}")
+    
+    if removed:
+        logger.info(f"🧹 期限切れディスクキャッシュを削除: {removed}件")
+    return removed
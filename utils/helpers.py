@@ -6,13 +6,29 @@
 import pandas as pd
 import numpy as np
 import streamlit as st
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+from itertools import cycle, islice
+import functools
+import io
 import logging
+import math
+import random
 from datetime import datetime, timedelta
 import time
 
+# t分布の累積分布関数（相関係数の有意性検定用、scipyが無い環境では検定をスキップ）
+try:
+    from scipy.special import stdtr
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# リトライ待機時間の上限（秒）と、待機時間に加えるジッタの割合
+RETRY_MAX_DELAY = 10.0
+RETRY_JITTER_RATIO = 0.1
+
 
 def format_currency(amount: float, currency: str = 'JPY') -> str:
     """
@@ -36,7 +52,7 @@ def format_currency(amount: float, currency: str = 'JPY') -> str:
             return f"£{amount:,.2f}"
         else:
             return f"{amount:,.2f} {currency}"
-    except:
+    except (TypeError, ValueError):
         return f"{amount} {currency}"
 
 
@@ -52,11 +68,13 @@ def format_percentage(value: float, decimal_places: int = 2) -> str:
         str: フォーマット済みパーセンテージ文字列
     """
     try:
-        if value > 0:
-            return f"+{value:.{decimal_places}f}%"
-        else:
+        # NaNには符号を付けない（従来通り "nan%" と表示）
+        if value != value:
             return f"{value:.{decimal_places}f}%"
-    except:
+        
+        # 符号は書式指定（+）で付与する
+        return f"{value:+.{decimal_places}f}%"
+    except (TypeError, ValueError):
         return f"{value}%"
 
 
@@ -72,11 +90,15 @@ def safe_divide(numerator: float, denominator: float, default: float = 0.0) -> f
     Returns:
         float: 除算結果またはデフォルト値
     """
+    if denominator is None:
+        return default
+    
     try:
-        if denominator == 0 or pd.isna(denominator):
+        # float（np.float64含む）のNaNは math.isnan で判定（pd.isna のディスパッチを避ける）
+        if denominator == 0 or (isinstance(denominator, float) and math.isnan(denominator)):
             return default
         return numerator / denominator
-    except:
+    except (TypeError, ValueError, ArithmeticError):
         return default
 
 
@@ -91,7 +113,18 @@ def calculate_returns(prices: pd.Series) -> pd.Series:
         pd.Series: リターン系列
     """
     try:
-        return prices.pct_change().dropna()
+        # 前日比を NumPy のビュー同士の除算で一括計算（pct_change + dropna の中間コピーを省く）
+        values = prices.to_numpy(dtype=np.float64, na_value=np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = values[1:] / values[:-1] - 1.0
+        
+        index = prices.index[1:]
+        valid = ~np.isnan(returns)
+        if not valid.all():
+            returns = returns[valid]
+            index = index[valid]
+        
+        return pd.Series(returns, index=index, name=prices.name)
     except Exception as e:
         logger.error(f"リターン計算エラー: {str(e)}")
         return pd.Series()
@@ -108,7 +141,15 @@ def calculate_cumulative_returns(returns: pd.Series) -> pd.Series:
         pd.Series: 累積リターン系列
     """
     try:
-        return (1 + returns).cumprod() - 1
+        values = returns.to_numpy(dtype=np.float64)
+        
+        # -100%以下のリターンを含む場合は対数が定義できないため積で計算
+        if np.any(values <= -1):
+            return (1 + returns).cumprod() - 1
+        
+        # log1p の累積和 -> expm1（cumsum はNaNをスキップし、cumprod と同じ欠損値の扱い）
+        log_growth = pd.Series(np.log1p(values), index=returns.index, name=returns.name).cumsum()
+        return np.expm1(log_growth)
     except Exception as e:
         logger.error(f"累積リターン計算エラー: {str(e)}")
         return pd.Series()
@@ -129,9 +170,9 @@ def handle_missing_data(df: pd.DataFrame, method: str = 'drop') -> pd.DataFrame:
         if method == 'drop':
             return df.dropna()
         elif method == 'forward_fill':
-            return df.fillna(method='ffill')
+            return df.ffill()
         elif method == 'backward_fill':
-            return df.fillna(method='bfill')
+            return df.bfill()
         else:
             return df
     except Exception as e:
@@ -154,7 +195,9 @@ def validate_dataframe(df: pd.DataFrame, required_columns: List[str]) -> bool:
         if df.empty:
             return False
         
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        # 列名集合を一度だけ作成し、必須列の順序を保ったまま不足列を抽出
+        column_set = frozenset(df.columns)
+        missing_columns = [col for col in required_columns if col not in column_set]
         if missing_columns:
             logger.warning(f"不足している列: {missing_columns}")
             return False
@@ -196,21 +239,25 @@ def get_business_days_between(start_date: datetime, end_date: datetime) -> int:
         int: 営業日数
     """
     try:
-        business_days = pd.bdate_range(start=start_date, end=end_date)
-        return len(business_days)
+        # インデックスを生成せず平日数を直接数える（終了日を含めるため翌日を上限とする）
+        start = np.datetime64(start_date, 'D')
+        end = np.datetime64(end_date, 'D') + np.timedelta64(1, 'D')
+        return max(int(np.busday_count(start, end)), 0)
     except Exception as e:
         logger.error(f"営業日数計算エラー: {str(e)}")
         return 0
 
 
-def retry_operation(func, max_retries: int = 3, delay: float = 1.0):
+def retry_operation(func, max_retries: int = 3, delay: float = 1.0,
+                    retry_on: Tuple[type, ...] = (Exception,)):
     """
-    リトライ機能付き操作実行
+    リトライ機能付き操作実行（指数バックオフ + ジッタ）
     
     Args:
         func: 実行する関数
         max_retries: 最大リトライ回数
-        delay: リトライ間隔（秒）
+        delay: 初回リトライ間隔（秒）、以降は試行ごとに倍増（上限 RETRY_MAX_DELAY）
+        retry_on: リトライ対象とする例外型（それ以外の例外は即座に送出）
     
     Returns:
         Any: 関数の実行結果
@@ -218,13 +265,15 @@ def retry_operation(func, max_retries: int = 3, delay: float = 1.0):
     for attempt in range(max_retries):
         try:
             return func()
-        except Exception as e:
+        except retry_on as e:
             if attempt == max_retries - 1:
                 logger.error(f"最大リトライ回数到達: {str(e)}")
-                raise e
-            else:
-                logger.warning(f"リトライ {attempt + 1}/{max_retries}: {str(e)}")
-                time.sleep(delay)
+                raise
+            
+            # 同時リトライの集中を避けるため待機時間にジッタを加える
+            wait = min(delay * (2 ** attempt) + random.uniform(0, RETRY_JITTER_RATIO * delay), RETRY_MAX_DELAY)
+            logger.warning(f"リトライ {attempt + 1}/{max_retries}（{wait:.2f}秒後）: {str(e)}")
+            time.sleep(wait)
 
 
 def log_performance(func):
@@ -237,17 +286,22 @@ def log_performance(func):
     Returns:
         関数: ラップした関数
     """
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             result = func(*args, **kwargs)
-            end_time = time.time()
-            logger.info(f"{func.__name__} 実行時間: {end_time - start_time:.2f}秒")
-            return result
         except Exception as e:
-            end_time = time.time()
-            logger.error(f"{func.__name__} エラー（実行時間: {end_time - start_time:.2f}秒）: {str(e)}")
-            raise e
+            if logger.isEnabledFor(logging.ERROR):
+                elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+                logger.error("%s エラー（実行時間: %.2f秒）: %s", func.__name__, elapsed, e)
+            raise
+        
+        # ログレベルが無効な場合はメッセージ整形を行わない
+        if logger.isEnabledFor(logging.INFO):
+            elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+            logger.info("%s 実行時間: %.2f秒", func.__name__, elapsed)
+        return result
     return wrapper
 
 
@@ -270,7 +324,13 @@ def display_dataframe_info(df: pd.DataFrame, title: str = "DataFrame情報"):
                 st.metric("列数", len(df.columns))
             
             with col3:
-                memory_usage = df.memory_usage(deep=True).sum() / 1024 / 1024
+                # 文字列列の全セル走査は重いため、詳細計測はチェック時のみ行う
+                deep = st.checkbox(
+                    "文字列列を含めて詳細計測",
+                    value=False,
+                    key=f"deep_memory_usage_{title}"
+                )
+                memory_usage = df.memory_usage(deep=deep).sum() / 1024 / 1024
                 st.metric("メモリ使用量", f"{memory_usage:.2f} MB")
             
             if not df.empty:
@@ -278,7 +338,7 @@ def display_dataframe_info(df: pd.DataFrame, title: str = "DataFrame情報"):
                 dtype_df = pd.DataFrame({
                     '列名': df.columns,
                     'データ型': df.dtypes.values,
-                    '欠損値数': df.isnull().sum().values
+                    '欠損値数': (len(df) - df.count()).values
                 })
                 st.dataframe(dtype_df, use_container_width=True)
     except Exception as e:
@@ -295,10 +355,12 @@ def create_download_link(df: pd.DataFrame, filename: str, link_text: str = "ダ
         link_text: リンクテキスト
     """
     try:
-        csv = df.to_csv(index=False, encoding='utf-8-sig')
+        # 文字列を経由せずバイト列へ直接書き出す（BOM付きUTF-8でExcelの文字化けを防ぐ）
+        buffer = io.BytesIO()
+        df.to_csv(buffer, index=False, encoding='utf-8-sig')
         st.download_button(
             label=f"📥 {link_text}",
-            data=csv,
+            data=buffer.getvalue(),
             file_name=filename,
             mime="text/csv"
         )
@@ -362,7 +424,21 @@ def display_info_message(message: str):
     logger.info(message)
 
 
-def get_color_palette(n_colors: int) -> List[str]:
+@functools.lru_cache(maxsize=1)
+def _base_color_palette() -> Tuple[str, ...]:
+    """
+    基本カラーパレット（plotlyの定性パレット）を初回利用時に一度だけ読み込む
+    
+    Returns:
+        Tuple[str, ...]: 基本色のタプル
+    """
+    import plotly.colors as pc
+    
+    return tuple(pc.qualitative.Plotly)
+
+
+@functools.lru_cache(maxsize=64)
+def get_color_palette(n_colors: int) -> Tuple[str, ...]:
     """
     カラーパレットを取得
     
@@ -370,16 +446,9 @@ def get_color_palette(n_colors: int) -> List[str]:
         n_colors: 必要な色数
     
     Returns:
-        List[str]: 色のリスト
+        Tuple[str, ...]: 色のタプル（色数が多い場合は基本色を繰り返す、呼び出し間で共有されるため不変）
     """
-    import plotly.colors as pc
-    
-    if n_colors <= 10:
-        return pc.qualitative.Plotly[:n_colors]
-    else:
-        # 色数が多い場合は繰り返し
-        base_colors = pc.qualitative.Plotly
-        return (base_colors * ((n_colors // len(base_colors)) + 1))[:n_colors]
+    return tuple(islice(cycle(_base_color_palette()), max(n_colors, 0)))
 
 
 def calculate_correlation_significance(corr_matrix: pd.DataFrame, n_observations: int) -> pd.DataFrame:
@@ -394,18 +463,22 @@ def calculate_correlation_significance(corr_matrix: pd.DataFrame, n_observations
         pd.DataFrame: 有意性マトリックス（True/False）
     """
     try:
-        from scipy import stats
+        if not SCIPY_AVAILABLE:
+            logger.warning("scipyが利用できないため相関有意性を計算できません")
+            return pd.DataFrame()
+        
+        dof = n_observations - 2
+        # |r|=1 でのゼロ除算を避けるためクリップ
+        r = np.clip(corr_matrix.to_numpy(dtype=np.float64), -0.9999, 0.9999)
         
         # t統計量を計算
-        t_stat = corr_matrix * np.sqrt((n_observations - 2) / (1 - corr_matrix**2))
+        t_stat = r * np.sqrt(dof / (1.0 - r * r))
         
-        # p値を計算
-        p_values = 2 * (1 - stats.t.cdf(np.abs(t_stat), n_observations - 2))
+        # p値を計算（両側検定）
+        p_values = 2.0 * (1.0 - stdtr(dof, np.abs(t_stat)))
         
         # 5%水準で有意かどうか
-        significant = p_values < 0.05
-        
-        return significant
+        return pd.DataFrame(p_values < 0.05, index=corr_matrix.index, columns=corr_matrix.columns)
     except Exception as e:
         logger.error(f"相関有意性計算エラー: {str(e)}")
         return pd.DataFrame()
@@ -422,22 +495,19 @@ def clean_numeric_data(series: pd.Series) -> pd.Series:
         pd.Series: クリーニング済み系列
     """
     try:
-        # 数値以外を除去
-        numeric_series = pd.to_numeric(series, errors='coerce')
-        
-        # 無限大値を除去
-        numeric_series = numeric_series.replace([np.inf, -np.inf], np.nan)
+        # 数値以外・無限大値をNaNにした float64 配列を一度だけ作成
+        values = pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+        values[~np.isfinite(values)] = np.nan
         
-        # 異常値検出（3シグマルール）
-        if len(numeric_series.dropna()) > 0:
-            mean_val = numeric_series.mean()
-            std_val = numeric_series.std()
+        # 異常値検出（3シグマルール、標準偏差は pandas と同じ不偏推定）
+        if np.count_nonzero(~np.isnan(values)) > 1:
+            mean_val = np.nanmean(values)
+            std_val = np.nanstd(values, ddof=1)
             
             if std_val > 0:
-                outlier_mask = (np.abs(numeric_series - mean_val) > 3 * std_val)
-                numeric_series[outlier_mask] = np.nan
+                values[np.abs(values - mean_val) > 3 * std_val] = np.nan
         
-        return numeric_series
+        return pd.Series(values, index=series.index, name=series.name)
     except Exception as e:
         logger.error(f"数値データクリーニングエラー: {str(e)}")
         return series
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""
+テキスト正規化ユーティリティ
+スクレイピング結果やプロンプトのUnicode正規化・エンコーディング安全化を行う機能
+"""
+
+import unicodedata
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SafeText(str):
+    """
+    NFC正規化済みかつUTF-8で安全にエンコードできることが確認済みのテキスト
+    
+    このクラスのインスタンスは to_safe_text で再処理されない
+    """
+    __slots__ = ()
+
+
+def to_safe_text(text) -> SafeText:
+    """
+    テキストをNFC正規化し、UTF-8にエンコードできない文字を置換
+    
+    Args:
+        text: 処理対象のテキスト（文字列以外はstrに変換）
+    
+    Returns:
+        SafeText: 安全化済みテキスト（既にSafeTextの場合はそのまま返す）
+    """
+    if isinstance(text, SafeText):
+        return text
+    
+    if not isinstance(text, str):
+        text = str(text)
+    
+    # Unicode正規化（既に正規化済みの場合はスキップ）
+    if not unicodedata.is_normalized('NFC', text):
+        text = unicodedata.normalize('NFC', text)
+    
+    # 問題のある文字（UTF-8にエンコードできないサロゲート等）がある場合のみ置換
+    try:
+        text.encode('utf-8')
+    except UnicodeEncodeError:
+        text = text.encode('utf-8', errors='replace').decode('utf-8')
+    
+    return SafeText(text)
+
+
+def truncate_text(text: str, max_chars: int) -> str:
+    """
+    テキストを先頭から最大文字数で切り詰める（SafeTextは切り詰め後もSafeTextのまま）
+    
+    strのスライスはSafeTextを保持しないため、安全化済みの印を付け直す
+    （NFC正規化済みテキストの先頭部分はNFCのままで、UTF-8エンコード可能性も変わらない）
+    
+    Args:
+        text: 対象テキスト
+        max_chars: 最大文字数
+    
+    Returns:
+        str: 切り詰めたテキスト
+    """
+    if isinstance(text, SafeText):
+        return SafeText(text[:max_chars])
+    return text[:max_chars]